@@ -1,27 +1,80 @@
 from __future__ import annotations
 
+import csv
+import fcntl
+import json
 import os
 import re
+import runpy
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import astuple, fields
 from datetime import datetime
-from importlib.metadata import version
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from subprocess import TimeoutExpired, run
-from typing import TYPE_CHECKING, Any
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
 from linetimer import CodeTimer
 #import cudf
 
+from queries.cpu import CpuMonitor, CpuUsage
+from queries.memory import MemoryMonitor
+from queries.parameters import get_answer_path
+from queries.perf_counters import PERF_EVENTS, PerfCounters
 from settings import Settings
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     import pandas as pd
     import polars as pl
+    import pyarrow.dataset as ds
+
+    from queries.table_provider import TableProvider
 
 settings = Settings()
 
+# Throughput test stream the current thread is running, if any
+current_stream: ContextVar[int | None] = ContextVar(
+    "current_stream", default=settings.run.stream
+)
+
+QueryPhase: TypeAlias = Literal["io", "materialize"]
+
+# Seconds spent in each phase of the query the current thread is timing, if any
+_phase_times: ContextVar[dict[QueryPhase, float] | None] = ContextVar(
+    "phase_times", default=None
+)
+
+
+# Engine that ran the query the current thread is timing, for libraries that can
+# pick an engine per query
+_query_engine: ContextVar[str] = ContextVar("query_engine", default="")
+
+
+def set_query_engine(engine: str) -> None:
+    """Record the engine that ran the timed query."""
+    _query_engine.set(engine)
+
+
+@contextmanager
+def query_phase(phase: QueryPhase) -> Iterator[None]:
+    """Attribute the time spent in the block to a phase of the timed query.
+
+    Reading tables is I/O, converting the result of an engine to the DataFrame
+    that is returned is materialization. All other time is compute.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        phase_times = _phase_times.get()
+        if phase_times is not None:
+            phase_times[phase] = phase_times.get(phase, 0.0) + perf_counter() - start
+
 
 def get_table_path(table_name: str) -> Path:
     """Return the path to the given table."""
@@ -29,69 +82,270 @@ def get_table_path(table_name: str) -> Path:
     return settings.dataset_base_dir / f"{table_name}.{ext}"
 
 
+def get_hive_partitioning(table_name: str) -> ds.Partitioning | None:
+    """Return the hive partitioning of a table, or None if it is not partitioned.
+
+    The partitioning has the type of the key, which readers would otherwise infer
+    as a dictionary from the directory names.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    from queries.schema import PARTITION_KEYS, get_arrow_schema
+
+    if settings.run.partitioning != "hive" or table_name not in PARTITION_KEYS:
+        return None
+    key = get_arrow_schema(table_name).field(PARTITION_KEYS[table_name])
+    return ds.partitioning(pa.schema([key]), flavor="hive")
+
+
+def get_library_version(library_name: str) -> str:
+    """Return the installed version of the library, or "" if it is not a package."""
+    try:
+        return version(library_name)
+    except PackageNotFoundError:
+        return ""
+
+
+def get_thread_count() -> int:
+    """Return the number of threads the engine is configured to use."""
+    return settings.run.threads or len(os.sched_getaffinity(0))
+
+
+@cache
+def get_dataset_layout() -> str:
+    """Return the Parquet layout of the dataset, as recorded by `prepare_data`.
+
+    Returns "" if the tables are not read from Parquet or no layout was recorded.
+    """
+    path = settings.dataset_base_dir / settings.paths.layout_filename
+    if settings.run.io_type != "parquet" or not path.exists():
+        return ""
+    layout = json.loads(path.read_text())
+    return ";".join(f"{key}={value}" for key, value in layout.items())
+
+
+# Columns of the timings file, rows are written by `log_query_timing`
+TIMINGS_HEADER = [
+    "solution",
+    "version",
+    "query_number",
+    "duration[s]",
+    "io_type",
+    "scale_factor",
+    "datetime_iso",
+    "cpu_set",
+    "threads",
+    "stream",
+    "seed",
+    "table_order",
+    "partitioning",
+    "layout",
+    "table_loading",
+    "io[s]",
+    "compute[s]",
+    "materialize[s]",
+    "peak_rss[B]",
+    "arrow_peak[B]",
+    "tracemalloc_peak[B]",
+    "spill_peak[B]",
+    "user[s]",
+    "system[s]",
+    "voluntary_switches",
+    "involuntary_switches",
+    "parallelism",
+    *PERF_EVENTS.values(),
+    "batch[s]",
+    "engine",
+]
+
+
+def _format_optional(value: float | None) -> str:
+    return "" if value is None else str(value)
+
+
+@contextmanager
+def _open_csv_log(path: Path, header: list[str]) -> Iterator[Any]:
+    """Open a CSV log file to append a row to, with a lock on the file.
+
+    A file with another header, e.g. from a version with other columns, is moved
+    aside to a name with the current time, and a new file is started.
+    """
+    while True:
+        with path.open("a", newline="") as f:
+            # Queries may run in parallel, make sure the header is written only once
+            fcntl.flock(f, fcntl.LOCK_EX)
+            # The file may have been moved aside while waiting for the lock
+            if not path.exists() or not os.path.samestat(
+                os.fstat(f.fileno()), path.stat()
+            ):
+                continue
+            writer = csv.writer(f)
+            if f.seek(0, os.SEEK_END) == 0:
+                writer.writerow(header)
+            else:
+                with path.open(newline="") as existing:
+                    if next(csv.reader(existing), []) != header:
+                        timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+                        old_path = path.with_stem(f"{path.stem}-{timestamp}")
+                        path.rename(old_path)
+                        print(f"Moved {path} with other columns to {old_path}")
+                        continue
+            yield writer
+            return
+
+
 def log_query_timing(
-    solution: str, version: str, query_number: int, time: float
+    solution: str,
+    version: str,
+    query_number: int,
+    time: float,
+    table_loading: str = "",
+    io_time: float | None = None,
+    compute_time: float | None = None,
+    materialize_time: float | None = None,
+    peak_rss: int | None = None,
+    arrow_peak: int | None = None,
+    tracemalloc_peak: int | None = None,
+    spill_peak: int | None = None,
+    cpu_usage: CpuUsage | None = None,
+    parallelism: float | None = None,
+    perf_counts: dict[str, int | None] | None = None,
+    batch_time: float | None = None,
+    engine: str = "",
 ) -> None:
+    from queries.scheduling import format_cpu_set
+
     settings.paths.timings.mkdir(parents=True, exist_ok=True)
 
-    with (settings.paths.timings / settings.paths.timings_filename).open("a") as f:
-        if f.tell() == 0:
-            f.write("solution,version,query_number,duration[s],io_type,scale_factor,datetime_iso\n")
-
-        line = (
-            ",".join(
-                [
-                    solution,
-                    version,
-                    str(query_number),
-                    str(time),
-                    settings.run.io_type,
-                    str(settings.scale_factor),
-                    datetime.now().isoformat()
-                ]
-            )
-            + "\n"
+    path = settings.paths.timings / settings.paths.timings_filename
+    with _open_csv_log(path, TIMINGS_HEADER) as writer:
+        writer.writerow(
+            [
+                solution,
+                version,
+                str(query_number),
+                str(time),
+                settings.run.io_type,
+                str(settings.scale_factor),
+                datetime.now().isoformat(),
+                format_cpu_set(list(os.sched_getaffinity(0))),
+                str(get_thread_count()),
+                str(current_stream.get() or ""),
+                "" if settings.run.seed is None else str(settings.run.seed),
+                settings.run.table_order,
+                settings.run.partitioning,
+                get_dataset_layout(),
+                table_loading,
+                _format_optional(io_time),
+                _format_optional(compute_time),
+                _format_optional(materialize_time),
+                _format_optional(peak_rss),
+                _format_optional(arrow_peak),
+                _format_optional(tracemalloc_peak),
+                _format_optional(spill_peak),
+                *(
+                    map(str, astuple(cpu_usage))
+                    if cpu_usage
+                    else [""] * len(fields(CpuUsage))
+                ),
+                _format_optional(parallelism),
+                *(_format_optional((perf_counts or {}).get(e)) for e in PERF_EVENTS),
+                _format_optional(batch_time),
+                engine,
+            ]
         )
-        f.write(line)
 
 
-def on_second_call(func: Any) -> Any:
-    def helper(*args: Any, **kwargs: Any) -> Any:
-        helper.calls += 1  # type: ignore[attr-defined]
+def execute_all(library_name: str) -> None:
+    print(settings.model_dump_json())
 
-        # first call is outside the function
-        # this call must set the result
-        if helper.calls == 1:  # type: ignore[attr-defined]
-            # include IO will compute the result on the 2nd call
-            if not settings.run.include_io:
-                helper.result = func(*args, **kwargs)  # type: ignore[attr-defined]
-            return helper.result  # type: ignore[attr-defined]
+    query_numbers = settings.run.queries or _get_query_numbers(library_name)
 
-        # second call is in the query, now we set the result
-        if settings.run.include_io and helper.calls == 2:  # type: ignore[attr-defined]
-            helper.result = func(*args, **kwargs)  # type: ignore[attr-defined]
+    if settings.run.parallel_queries > 1 and settings.run.execution_mode != "subprocess":
+        msg = "parallel queries are only supported with the subprocess execution mode"
+        raise ValueError(msg)
+    if settings.run.memory_limit is not None and settings.run.execution_mode != "subprocess":
+        msg = "a memory limit is only supported with the subprocess execution mode"
+        raise ValueError(msg)
 
-        return helper.result  # type: ignore[attr-defined]
+    if settings.run.throughput_streams > 0:
+        from queries.throughput import run_throughput_test
 
-    helper.calls = 0  # type: ignore[attr-defined]
-    helper.result = None  # type: ignore[attr-defined]
+        run_throughput_test(library_name, query_numbers)
+        return
 
-    return helper
+    if settings.run.refresh_sets > 0:
+        from queries.refresh import run_refresh_test
 
+        run_refresh_test(library_name)
+        return
 
-def execute_all(library_name: str) -> None:
-    print(settings.model_dump_json())
+    with CodeTimer(name=f"Overall execution of ALL {library_name} queries", unit="s"):
+        if settings.run.execution_mode == "in-process":
+            n_succeeded = execute_in_process(library_name, query_numbers)
+            # A stream of the throughput test reports its failed queries to the
+            # parent process, which would otherwise count them as completed
+            if settings.run.stream is not None and n_succeeded < len(query_numbers):
+                sys.exit(1)
+        elif settings.run.execution_mode == "multiplex":
+            if library_name != "polars":
+                msg = "the multiplex execution mode is only supported for Polars"
+                raise ValueError(msg)
+            from queries.polars.utils import run_multiplexed
 
-    query_numbers = _get_query_numbers(library_name)
+            run_multiplexed(query_numbers)
+        else:
+            _execute_in_subprocesses(library_name, query_numbers)
 
-    with CodeTimer(name=f"Overall execution of ALL {library_name} queries", unit="s"):
-        for i in query_numbers:
-            try:
-                run([sys.executable, "-m", f"queries.{library_name}.q{i}"],
-                    timeout=max(999, float(os.environ.get("SCALE_FACTOR", "1.0")) / 5 * 60)
-                    )
-            except TimeoutExpired as e:
-                print(e)
+
+def _execute_in_subprocesses(library_name: str, query_numbers: list[int]) -> None:
+    """Run every query in a fresh interpreter."""
+    timeout = max(999, float(os.environ.get("SCALE_FACTOR", "1.0")) / 5 * 60)
+
+    if settings.run.parallel_queries > 1:
+        from queries.scheduling import run_pinned
+
+        run_pinned(library_name, query_numbers, timeout=timeout)
+        return
+
+    from queries.memory_budget import run_query_process
+
+    for i in query_numbers:
+        run_query_process(
+            library_name,
+            i,
+            [sys.executable, "-m", f"queries.{library_name}.q{i}"],
+            timeout=timeout,
+        )
+
+
+def execute_in_process(
+    library_name: str,
+    query_numbers: list[int],
+    run_query: Callable[[int], None] | None = None,
+) -> int:
+    """Run every query in the current interpreter and return how many succeeded.
+
+    The library is imported and its engine is warmed up once, for the first query.
+    By default a query runs its module as `__main__`, `run_query` replaces that.
+    Note that there is no timeout in this mode.
+    """
+    n_succeeded = 0
+    for i in query_numbers:
+        try:
+            if run_query is None:
+                runpy.run_module(f"queries.{library_name}.q{i}", run_name="__main__")
+            else:
+                run_query(i)
+        except KeyboardInterrupt:
+            raise
+        # Rust panics surface as `BaseException`; they should not end the run
+        except BaseException as e:
+            print(f"q{i} FAILED\n{e}")
+        else:
+            n_succeeded += 1
+    return n_succeeded
 
 
 def _get_query_numbers(library_name: str) -> list[int]:
@@ -115,33 +369,90 @@ def run_query_generic(
     library_name: str,
     library_version: str | None = None,
     query_checker: Callable[..., None] | None = None,
+    table_provider: TableProvider[Any] | None = None,
+    tables: Iterable[str] = (),
 ) -> None:
-    """Execute a query."""
-    for _ in range(settings.run.iterations):
-        with CodeTimer(
-            name=f"Run {library_name} query {query_number}", unit="s"
-        ) as timer:
-            result = query()
-
-        if settings.run.log_timings:
-            log_query_timing(
-                solution=library_name,
-                version=library_version or version(library_name),
-                query_number=query_number,
-                time=timer.took,
-            )
-
-        if settings.run.check_results:
-            if query_checker is None:
-                msg = "cannot check results if no query checking function is provided"
-                raise ValueError(msg)
-            if settings.scale_factor != 1:
-                msg = f"cannot check results when scale factor is not 1, got {settings.scale_factor}"
-                raise RuntimeError(msg)
-            query_checker(result, query_number)
-
-        if settings.run.show_results:
-            print(result)
+    """Execute a query.
+
+    The duration is split into the phases marked with `query_phase`. If the query
+    gets its `tables` from `table_provider`, the time spent loading them is the
+    I/O time. Engines that scan their tables as part of the query plan have no
+    separate I/O time, their scans count as compute.
+    """
+    try:
+        for _ in range(settings.run.iterations):
+            phase_times: dict[QueryPhase, float] = {}
+            token = _phase_times.set(phase_times)
+            engine_token = _query_engine.set("")
+            try:
+                if table_provider is not None:
+                    table_provider.prepare(tables)
+                # Preloaded tables are I/O, but are not part of the duration
+                preload_time = phase_times.pop("io", 0.0)
+
+                with (
+                    MemoryMonitor() as memory,
+                    CpuMonitor() as cpu,
+                    PerfCounters() as perf,
+                    CodeTimer(
+                        name=f"Run {library_name} query {query_number}", unit="s"
+                    ) as timer,
+                ):
+                    result = query()
+                engine = _query_engine.get()
+            finally:
+                _phase_times.reset(token)
+                _query_engine.reset(engine_token)
+
+            table_loading = ""
+            io_time = None
+            if table_provider is not None:
+                table_loading = table_provider.mode
+                io_time = preload_time + phase_times.get("io", 0.0)
+                table_provider.finish()
+            materialize_time = phase_times.get("materialize", 0.0)
+            compute_time = timer.took - phase_times.get("io", 0.0) - materialize_time
+
+            if settings.run.log_timings:
+                log_query_timing(
+                    solution=library_name,
+                    version=library_version or version(library_name),
+                    query_number=query_number,
+                    time=timer.took,
+                    table_loading=table_loading,
+                    io_time=io_time,
+                    compute_time=compute_time,
+                    materialize_time=materialize_time,
+                    peak_rss=memory.peak_rss,
+                    arrow_peak=memory.arrow_peak,
+                    tracemalloc_peak=memory.tracemalloc_peak,
+                    spill_peak=memory.spill_peak,
+                    cpu_usage=cpu.usage,
+                    parallelism=cpu.parallelism(timer.took),
+                    perf_counts=perf.counts,
+                    engine=engine,
+                )
+
+            if settings.run.check_results:
+                if query_checker is None:
+                    msg = "cannot check results if no query checking function is provided"
+                    raise ValueError(msg)
+                ensure_answers_available()
+                query_checker(result, query_number)
+
+            if settings.run.show_results:
+                print(result)
+    finally:
+        if table_provider is not None:
+            table_provider.release()
+
+
+def ensure_answers_available() -> None:
+    """Raise if there are no answers to check the results against."""
+    # The answers of seeded parameters are computed for any scale factor
+    if settings.scale_factor != 1 and settings.run.seed is None:
+        msg = f"cannot check results when scale factor is not 1, got {settings.scale_factor}"
+        raise RuntimeError(msg)
 
 
 def check_query_result_pl(result: pl.DataFrame, query_number: int) -> None:
@@ -178,25 +489,25 @@ def _get_query_answer_pl(query: int) -> pl.DataFrame:
     """Read the true answer to the query from disk as a Polars DataFrame."""
     from polars import read_parquet
 
-    path = settings.paths.answers / f"q{query}.parquet"
+    path = get_answer_path(query)
     return read_parquet(path)
 
 def _get_query_answer_fireducks(query: int) -> pd.DataFrame:
     """Read the true answer to the query from disk as a fireducks DataFrame."""
     from fireducks.pandas import read_parquet
 
-    path = settings.paths.answers / f"q{query}.parquet"
+    path = get_answer_path(query)
     return read_parquet(path, dtype_backend="pyarrow")
 
 def _get_query_answer_pd(query: int) -> pd.DataFrame:
     """Read the true answer to the query from disk as a pandas DataFrame."""
     from pandas import read_parquet
 
-    path = settings.paths.answers / f"q{query}.parquet"
+    path = get_answer_path(query)
     return read_parquet(path, dtype_backend="pyarrow")
 
 
 def _get_query_answer_cudf(query: int) -> pd.DataFrame:
     """Read the true answer to the query from disk as a cudf DataFrame."""
-    path = settings.paths.answers / f"q{query}.parquet"
+    path = get_answer_path(query)
     return cudf.read_parquet(path)
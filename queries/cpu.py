@@ -0,0 +1,113 @@
+"""Measure the CPU usage of a query.
+
+User and system CPU time and context switches are taken from `getrusage` for the
+process itself, and from `/proc` for its child processes, which do the work of
+PySpark (the JVM) and Modin (Ray workers). Children that exit during the query
+without being waited for are not counted.
+
+The parallelism of a query is its CPU time divided by its wall-clock time, so a
+single-threaded engine has a parallelism of at most 1.
+"""
+
+from __future__ import annotations
+
+import os
+import resource
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+@dataclass(frozen=True)
+class CpuUsage:
+    user: float = 0.0
+    system: float = 0.0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+
+    def __add__(self, other: CpuUsage) -> CpuUsage:
+        return CpuUsage(
+            self.user + other.user,
+            self.system + other.system,
+            self.voluntary_switches + other.voluntary_switches,
+            self.involuntary_switches + other.involuntary_switches,
+        )
+
+    def __sub__(self, other: CpuUsage) -> CpuUsage:
+        return CpuUsage(
+            self.user - other.user,
+            self.system - other.system,
+            self.voluntary_switches - other.voluntary_switches,
+            self.involuntary_switches - other.involuntary_switches,
+        )
+
+
+def _get_own_usage() -> CpuUsage:
+    usage = CpuUsage()
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        r = resource.getrusage(who)
+        usage += CpuUsage(r.ru_utime, r.ru_stime, r.ru_nvcsw, r.ru_nivcsw)
+    return usage
+
+
+def _get_child_usage() -> dict[int, CpuUsage]:
+    """Return the CPU usage of all live descendants of this process."""
+    stats = {}
+    for path in Path("/proc").glob("[0-9]*"):
+        try:
+            stat = (path / "stat").read_text()
+            status = (path / "status").read_text()
+        except OSError:  # The process exited
+            continue
+        # The process name can contain spaces, the fields follow the last ")"
+        fields = stat[stat.rindex(")") + 2 :].split()
+        switches = dict(
+            line.split(":\t") for line in status.splitlines() if "ctxt_switches" in line
+        )
+        stats[int(path.name)] = (
+            int(fields[1]),
+            CpuUsage(
+                int(fields[11]) / _CLOCK_TICKS,
+                int(fields[12]) / _CLOCK_TICKS,
+                int(switches.get("voluntary_ctxt_switches", 0)),
+                int(switches.get("nonvoluntary_ctxt_switches", 0)),
+            ),
+        )
+
+    descendants, parents = {}, {os.getpid()}
+    while parents:
+        children = {pid for pid, (ppid, _) in stats.items() if ppid in parents}
+        descendants.update({pid: stats[pid][1] for pid in children})
+        parents = children - parents
+    return descendants
+
+
+class CpuMonitor:
+    """Track the CPU usage of the process and its children while in the context."""
+
+    usage = CpuUsage()
+
+    def __enter__(self) -> Self:
+        self._own_start = _get_own_usage()
+        self._children_start = _get_child_usage()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.usage = _get_own_usage() - self._own_start
+        for pid, usage in _get_child_usage().items():
+            self.usage += usage - self._children_start.get(pid, CpuUsage())
+
+    def parallelism(self, wall_time: float) -> float:
+        """Return the average number of busy CPUs over `wall_time` seconds."""
+        return (self.usage.user + self.usage.system) / wall_time
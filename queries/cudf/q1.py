@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from datetime import date
 import numpy as np
 
 import cudf.pandas
@@ -9,18 +8,17 @@ import cudf  # Import cudf explicitly
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 1
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    line_item_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        line_item_ds = line_item_ds()
+        line_item_ds = utils.get_line_item_ds()
         
-        var1 = np.datetime64('1998-09-02')
+        var1 = np.datetime64(params["var1"])
 
         filt = line_item_ds[line_item_ds["l_shipdate"] <= var1]
 
@@ -71,7 +69,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem"])
 
 if __name__ == "__main__":
     q()
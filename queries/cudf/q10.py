@@ -7,34 +7,21 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 10
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    nation_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = np.datetime64("1993-10-01")
-        var2 = np.datetime64("1994-01-01")
+        var1 = np.datetime64(params["var1"])
+        var2 = np.datetime64(params["var2"])
 
         # Filter orders within the date range
         orders_ds = orders_ds[
@@ -71,7 +58,7 @@ def q() -> None:
 
         return grouped_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "lineitem", "nation", "orders"])
 
 if __name__ == "__main__":
     q()
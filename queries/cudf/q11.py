@@ -6,30 +6,20 @@ cudf.pandas.install()
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 11
 
 def q() -> None:
-    nation_ds = utils.get_nation_ds
-    part_supp_ds = utils.get_part_supp_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call one time to cache in case we don't include the IO times
-    nation_ds()
-    part_supp_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal nation_ds
-        nonlocal part_supp_ds
-        nonlocal supplier_ds
-
-        nation_ds = nation_ds()
-        part_supp_ds = part_supp_ds()
-        supplier_ds = supplier_ds()
+        nation_ds = utils.get_nation_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        var1 = "GERMANY"
-        var2 = 0.0001
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         # Join partsupp and supplier
         merged_df = part_supp_ds.merge(supplier_ds, left_on="ps_suppkey", right_on="s_suppkey")
@@ -65,7 +55,7 @@ def q() -> None:
         return result_df
 
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["nation", "partsupp", "supplier"])
 
 if __name__ == "__main__":
     q()
@@ -8,26 +8,19 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 14
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    part_ds = utils.get_part_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    part_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal part_ds
-
-        line_item_ds = line_item_ds()
-        part_ds = part_ds()
+        line_item_ds = utils.get_line_item_ds()
+        part_ds = utils.get_part_ds()
 
-        var1 = np.datetime64("1995-09-01")
-        var2 = np.datetime64("1995-10-01")
+        var1 = np.datetime64(params["var1"])
+        var2 = np.datetime64(params["var2"])
 
         # Join lineitem and part
         merged_df = line_item_ds.merge(part_ds, left_on="l_partkey", right_on="p_partkey")
@@ -48,7 +41,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "part"])
 
 if __name__ == "__main__":
     q()
@@ -7,25 +7,19 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 15
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    supplier_ds = utils.get_supplier_ds
+    params = get_parameters(Q_NUM)
 
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    supplier_ds()
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal supplier_ds
+        line_item_ds = utils.get_line_item_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        line_item_ds = line_item_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = np.datetime64("1996-01-01")
-        var2 = np.datetime64("1996-04-01")
+        var1 = np.datetime64(params["var1"])
+        var2 = np.datetime64(params["var2"])
 
         # Filter the DataFrame based on ship date
         filtered_line_item_ds = line_item_ds[
@@ -57,7 +51,7 @@ def q() -> None:
         return result_df
 
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "supplier"])
 
 if __name__ == "__main__":
     q()
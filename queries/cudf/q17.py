@@ -7,26 +7,19 @@ import cudf
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 17
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    part_ds = utils.get_part_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    part_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal part_ds
-
-        line_item_ds = line_item_ds()
-        part_ds = part_ds()
+        line_item_ds = utils.get_line_item_ds()
+        part_ds = utils.get_part_ds()
 
-        var1 = "Brand#23"
-        var2 = "MED BOX"
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         # Filter part for brand and container type
         filtered_part = part_ds[(part_ds["p_brand"] == var1) & (part_ds["p_container"] == var2)]
@@ -51,7 +44,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "part"])
 
 if __name__ == "__main__":
     q()
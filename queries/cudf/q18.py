@@ -6,33 +6,23 @@ cudf.pandas.install()
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 18
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = 300
+        var1 = params["var1"]
 
         # Group lineitem by "l_orderkey" and calculate sum of "l_quantity"
         sum_quantity_df = (
-            line_item_ds.groupby("l_orderkey", as_index=False)["l_quantity"].sum()
+            line_item_ds.groupby("l_orderkey", as_index=False)[["l_quantity"]].sum()
             .rename(columns={"l_quantity": "sum_quantity"})
         )
 
@@ -65,7 +55,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "lineitem", "orders"])
 
 if __name__ == "__main__":
     q()
@@ -7,42 +7,42 @@ import cudf
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 19
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    part_ds = utils.get_part_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    part_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal part_ds
+        line_item_ds = utils.get_line_item_ds()
+        part_ds = utils.get_part_ds()
 
-        line_item_ds = line_item_ds()
-        part_ds = part_ds()
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
+        var4 = params["var4"]
+        var5 = params["var5"]
+        var6 = params["var6"]
 
         # Filter parts based on conditions
         conditions = [
             {
-                "brand": "Brand#12",
+                "brand": var1,
                 "containers": ["SM CASE", "SM BOX", "SM PACK", "SM PKG"],
-                "quantity_range": (1, 11),
+                "quantity_range": (var4, var4 + 10),
                 "size_range": (1, 5)
             },
             {
-                "brand": "Brand#23",
+                "brand": var2,
                 "containers": ["MED BAG", "MED BOX", "MED PKG", "MED PACK"],
-                "quantity_range": (10, 20),
+                "quantity_range": (var5, var5 + 10),
                 "size_range": (1, 10)
             },
             {
-                "brand": "Brand#34",
+                "brand": var3,
                 "containers": ["LG CASE", "LG BOX", "LG PACK", "LG PKG"],
-                "quantity_range": (20, 30),
+                "quantity_range": (var6, var6 + 10),
                 "size_range": (1, 15)
             },
         ]
@@ -71,12 +71,12 @@ def q() -> None:
 
         # Apply final conditions
         final_conditions = (
-            ((merged_df["p_brand"] == "Brand#12") &
-             (merged_df["l_quantity"].between(1, 11))) |
-            ((merged_df["p_brand"] == "Brand#23") &
-             (merged_df["l_quantity"].between(10, 20))) |
-            ((merged_df["p_brand"] == "Brand#34") &
-             (merged_df["l_quantity"].between(20, 30)))
+            ((merged_df["p_brand"] == var1) &
+             (merged_df["l_quantity"].between(var4, var4 + 10))) |
+            ((merged_df["p_brand"] == var2) &
+             (merged_df["l_quantity"].between(var5, var5 + 10))) |
+            ((merged_df["p_brand"] == var3) &
+             (merged_df["l_quantity"].between(var6, var6 + 10)))
         )
         filtered_df = merged_df[final_conditions]
 
@@ -86,7 +86,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "part"])
 
 if __name__ == "__main__":
     q()
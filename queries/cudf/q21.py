@@ -7,33 +7,20 @@ import cudf
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 21
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call to cache data
-    line_item_ds()
-    nation_ds()
-    orders_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-        nonlocal supplier_ds
-
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        var1 = "SAUDI ARABIA"
+        var1 = params["var1"]
 
         # Filter nation
         nation_ds = nation_ds[nation_ds["n_name"] == var1][["n_nationkey"]]
@@ -94,7 +81,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "nation", "orders", "supplier"])
 
 if __name__ == "__main__":
     q()
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import date
-
 import cudf.pandas
 
 cudf.pandas.install()
@@ -9,30 +7,21 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 3
 
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # first call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = "BUILDING"
-        var2 = np.datetime64("1995-03-15")
+        var1 = params["var1"]
+        var2 = np.datetime64(params["var2"])
 
         fcustomer = customer_ds[customer_ds["c_mktsegment"] == var1]
 
@@ -56,7 +45,7 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "lineitem", "orders"])
 
 
 if __name__ == "__main__":
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import date
-
 import cudf.pandas
 
 cudf.pandas.install()
@@ -9,26 +7,20 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 4
 
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # first call one time to cache in case we don't include the IO times
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = np.datetime64("1993-07-01")
-        var2 = np.datetime64("1993-10-01")
+        var1 = np.datetime64(params["var1"])
+        var2 = np.datetime64(params["var2"])
 
         jn = line_item_ds.merge(orders_ds, left_on="l_orderkey", right_on="o_orderkey")
 
@@ -44,7 +36,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "orders"])
 
 
 if __name__ == "__main__":
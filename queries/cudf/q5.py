@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import date
-
 import cudf.pandas
 
 cudf.pandas.install()
@@ -9,43 +7,25 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 5
 
 
 def q() -> None:
-    region_ds = utils.get_region_ds
-    nation_ds = utils.get_nation_ds
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # first call one time to cache in case we don't include the IO times
-    region_ds()
-    nation_ds()
-    customer_ds()
-    line_item_ds()
-    orders_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal region_ds
-        nonlocal nation_ds
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        nonlocal supplier_ds
-        region_ds = region_ds()
-        nation_ds = nation_ds()
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
+        region_ds = utils.get_region_ds()
+        nation_ds = utils.get_nation_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        var1 = "ASIA"
-        var2 = np.datetime64("1994-01-01")
-        var3 = np.datetime64("1995-01-01")
+        var1 = params["var1"]
+        var2 = np.datetime64(params["var2"])
+        var3 = np.datetime64(params["var3"])
 
         jn1 = region_ds.merge(nation_ds, left_on="r_regionkey", right_on="n_regionkey")
         jn2 = jn1.merge(customer_ds, left_on="n_nationkey", right_on="c_nationkey")
@@ -66,7 +46,18 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM,
+        query,
+        tables=[
+            "region",
+            "nation",
+            "customer",
+            "lineitem",
+            "orders",
+            "supplier",
+        ],
+    )
 
 
 if __name__ == "__main__":
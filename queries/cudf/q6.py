@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import date
-
 import cudf.pandas
 
 cudf.pandas.install()
@@ -10,24 +8,21 @@ import pandas as pd
 import numpy as np
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 6
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-
-    # first call one time to cache in case we don't include the IO times
-    line_item_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        line_item_ds = line_item_ds()
+        line_item_ds = utils.get_line_item_ds()
 
-        var1 = np.datetime64("1994-01-01")
-        var2 = np.datetime64("1995-01-01")
-        var3 = 0.05
-        var4 = 0.07
-        var5 = 24
+        var1 = np.datetime64(params["var1"])
+        var2 = np.datetime64(params["var2"])
+        var3 = params["var3"]
+        var4 = params["var4"]
+        var5 = params["var5"]
 
         filt = line_item_ds[
             (line_item_ds["l_shipdate"] >= var1) & (line_item_ds["l_shipdate"] < var2)
@@ -39,7 +34,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem"])
 
 if __name__ == "__main__":
     q()
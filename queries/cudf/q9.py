@@ -7,42 +7,25 @@ import cudf
 import pandas as pd
 
 from queries.cudf import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 9
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-    part_ds = utils.get_part_ds
-    part_supp_ds = utils.get_part_supp_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    nation_ds()
-    orders_ds()
-    part_ds()
-    part_supp_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-        nonlocal part_ds
-        nonlocal part_supp_ds
-        nonlocal supplier_ds
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
+        part_ds = utils.get_part_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
-        part_ds = part_ds()
-        part_supp_ds = part_supp_ds()
-        supplier_ds = supplier_ds()
+        var1 = params["var1"]
 
-        # Filter part for p_name containing "green"
-        part_ds = part_ds[part_ds["p_name"].str.contains("green")][["p_partkey", "p_name"]]
+        # Filter part for p_name containing the color
+        part_ds = part_ds[part_ds["p_name"].str.contains(var1)][["p_partkey", "p_name"]]
 
         # Select necessary columns
         line_item_ds = line_item_ds[["l_orderkey", "l_partkey", "l_suppkey", "l_extendedprice", "l_discount", "l_quantity"]]
@@ -78,7 +61,18 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM,
+        query,
+        tables=[
+            "lineitem",
+            "nation",
+            "orders",
+            "part",
+            "partsupp",
+            "supplier",
+        ],
+    )
 
 if __name__ == "__main__":
     q()
@@ -12,9 +12,11 @@ import pandas as pd
 from queries.common_utils import (
     check_query_result_cudf,
     get_table_path,
-    on_second_call,
     run_query_generic,
 )
+from queries.schema import get_numpy_dtypes
+from queries.table_provider import TableProvider
+from queries.table_store import get_store_path
 from settings import Settings
 
 if TYPE_CHECKING:
@@ -27,15 +29,14 @@ pd.options.mode.copy_on_write = True
 
 def _read_ds(table_name: str) -> pd.DataFrame:
     path = get_table_path(table_name)
-    if settings.run.io_type in ("parquet", "skip"):
-        return cudf.read_parquet(path)
+    if settings.run.io_type == "skip":
+        # Read the uncompressed table from the shared-memory store
+        return cudf.read_feather(get_store_path(table_name))  # type: ignore[no-any-return]
+    elif settings.run.io_type == "parquet":
+        # Hive keys are strings, as in the other libraries
+        return cudf.read_parquet(path, categorical_partitions=False)
     elif settings.run.io_type == "csv":
-        df = cudf.read_csv(path)
-        # TODO: This is slow - we should use the known schema to read dates directly
-        for c in df.columns:
-            if c.endswith("date"):
-                df[c] = df[c].astype("date32[day][pyarrow]")  # type: ignore[call-overload]
-        return df
+        return cudf.read_csv(path, dtype=get_numpy_dtypes(table_name))
     elif settings.run.io_type == "feather":
         return cudf.read_feather(path)
     else:
@@ -43,47 +44,50 @@ def _read_ds(table_name: str) -> pd.DataFrame:
         raise ValueError(msg)
 
 
-@on_second_call
+table_provider = TableProvider(_read_ds)
+
+
 def get_line_item_ds() -> pd.DataFrame:
-    return _read_ds("lineitem")
+    return table_provider.get("lineitem")
 
 
-@on_second_call
 def get_orders_ds() -> pd.DataFrame:
-    return _read_ds("orders")
+    return table_provider.get("orders")
 
 
-@on_second_call
 def get_customer_ds() -> pd.DataFrame:
-    return _read_ds("customer")
+    return table_provider.get("customer")
 
 
-@on_second_call
 def get_region_ds() -> pd.DataFrame:
-    return _read_ds("region")
+    return table_provider.get("region")
 
 
-@on_second_call
 def get_nation_ds() -> pd.DataFrame:
-    return _read_ds("nation")
+    return table_provider.get("nation")
 
 
-@on_second_call
 def get_supplier_ds() -> pd.DataFrame:
-    return _read_ds("supplier")
+    return table_provider.get("supplier")
 
 
-@on_second_call
 def get_part_ds() -> pd.DataFrame:
-    return _read_ds("part")
+    return table_provider.get("part")
 
 
-@on_second_call
 def get_part_supp_ds() -> pd.DataFrame:
-    return _read_ds("partsupp")
+    return table_provider.get("partsupp")
 
 
-def run_query(query_number: int, query: Callable[..., Any]) -> None:
+def run_query(
+    query_number: int, query: Callable[..., Any], tables: list[str]
+) -> None:
     run_query_generic(
-        query, query_number, library_name="cudf", library_version=cudf.__version__, query_checker=check_query_result_cudf
+        query,
+        query_number,
+        library_name="cudf",
+        library_version=cudf.__version__,
+        query_checker=check_query_result_cudf,
+        table_provider=table_provider,
+        tables=tables,
     )
@@ -1,24 +1,20 @@
 from __future__ import annotations
 
-from datetime import date
-
 import pandas as pd
 
 from queries.dask import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 1
 
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    # first call one time to cache in case we don't include the IO times
-    line_item_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        line_item_ds = line_item_ds()
+        line_item_ds = utils.get_line_item_ds()
 
-        var1 = date(1998, 9, 2)
+        var1 = params["var1"]
 
         filt = line_item_ds[line_item_ds["l_shipdate"] <= var1]
 
@@ -48,7 +44,7 @@ def q() -> None:
 
         return result_df.compute()  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem"])
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import date
 from typing import TYPE_CHECKING
 
 from queries.dask import utils
+from queries.parameters import get_parameters
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -12,25 +12,15 @@ Q_NUM = 3
 
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # first call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = "BUILDING"
-        var2 = date(1995, 3, 15)
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         fcustomer = customer_ds[customer_ds["c_mktsegment"] == var1]
 
@@ -52,7 +42,7 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "lineitem", "orders"])
 
 
 if __name__ == "__main__":
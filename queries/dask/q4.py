@@ -1,36 +1,28 @@
 from __future__ import annotations
 
-from datetime import date
-
 import pandas as pd
 
 from queries.dask import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 4
 
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # first call one time to cache in case we don't include the IO times
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = date(1993, 7, 1)
-        var2 = date(1993, 10, 1)
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         exists = line_item_ds[
             line_item_ds["l_commitdate"] < line_item_ds["l_receiptdate"]
         ]
 
-        jn = orders_ds.merge(
+        jn = orders_ds.merge(  # type: ignore[no-untyped-call]
             exists, left_on="o_orderkey", right_on="l_orderkey", how="leftsemi"
         )
         jn = jn[(jn["o_orderdate"] >= var1) & (jn["o_orderdate"] < var2)]
@@ -44,7 +36,7 @@ def q() -> None:
 
         return result_df.compute()  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "orders"])
 
 
 if __name__ == "__main__":
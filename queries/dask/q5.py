@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import date
 from typing import TYPE_CHECKING
 
 from queries.dask import utils
+from queries.parameters import get_parameters
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -12,40 +12,21 @@ Q_NUM = 5
 
 
 def q() -> None:
-    region_ds = utils.get_region_ds
-    nation_ds = utils.get_nation_ds
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # first call one time to cache in case we don't include the IO times
-    region_ds()
-    nation_ds()
-    customer_ds()
-    line_item_ds()
-    orders_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal region_ds
-        nonlocal nation_ds
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        nonlocal supplier_ds
-        region_ds = region_ds()
-        nation_ds = nation_ds()
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = "ASIA"
-        var2 = date(1994, 1, 1)
-        var3 = date(1995, 1, 1)
-
-        jn1 = region_ds.merge(nation_ds, left_on="r_regionkey", right_on="n_regionkey")
+        region_ds = utils.get_region_ds()
+        nation_ds = utils.get_nation_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
+        supplier_ds = utils.get_supplier_ds()
+
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
+
+        jn1 = region_ds.merge(nation_ds, left_on="r_regionkey", right_on="n_regionkey")  # type: ignore[no-untyped-call]
         jn2 = jn1.merge(customer_ds, left_on="n_nationkey", right_on="c_nationkey")
         jn3 = jn2.merge(orders_ds, left_on="c_custkey", right_on="o_custkey")
         jn4 = jn3.merge(line_item_ds, left_on="o_orderkey", right_on="l_orderkey")
@@ -64,7 +45,18 @@ def q() -> None:
 
         return result_df.compute()  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM,
+        query,
+        tables=[
+            "region",
+            "nation",
+            "customer",
+            "lineitem",
+            "orders",
+            "supplier",
+        ],
+    )
 
 
 if __name__ == "__main__":
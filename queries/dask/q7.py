@@ -6,6 +6,7 @@ from datetime import date
 import pandas as pd
 
 from queries.dask import utils
+from queries.parameters import get_parameters
 
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -16,33 +17,17 @@ Q_NUM = 7
 
 
 def q() -> None:
-    nation_ds = utils.get_nation_ds
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # first call one time to cache in case we don't include the IO times
-    nation_ds()
-    customer_ds()
-    line_item_ds()
-    orders_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal nation_ds
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        nonlocal supplier_ds
-        nation_ds = nation_ds()
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = "FRANCE"
-        var2 = "GERMANY"
+        nation_ds = utils.get_nation_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
+        supplier_ds = utils.get_supplier_ds()
+
+        var1 = params["var1"]
+        var2 = params["var2"]
         var3 = date(1995, 1, 1)
         var4 = date(1996, 12, 31)
 
@@ -50,7 +35,7 @@ def q() -> None:
         n2 = nation_ds[(nation_ds["n_name"] == var2)]
 
         # Part 1
-        jn1 = customer_ds.merge(n1, left_on="c_nationkey", right_on="n_nationkey")
+        jn1 = customer_ds.merge(n1, left_on="c_nationkey", right_on="n_nationkey")  # type: ignore[no-untyped-call]
         jn2 = jn1.merge(orders_ds, left_on="c_custkey", right_on="o_custkey")
         jn2 = jn2.rename(columns={"n_name": "cust_nation"})
         jn3 = jn2.merge(line_item_ds, left_on="o_orderkey", right_on="l_orderkey")
@@ -59,7 +44,7 @@ def q() -> None:
         df1 = jn5.rename(columns={"n_name": "supp_nation"})
 
         # Part 2
-        jn1 = customer_ds.merge(n2, left_on="c_nationkey", right_on="n_nationkey")
+        jn1 = customer_ds.merge(n2, left_on="c_nationkey", right_on="n_nationkey")  # type: ignore[no-untyped-call]
         jn2 = jn1.merge(orders_ds, left_on="c_custkey", right_on="o_custkey")
         jn2 = jn2.rename(columns={"n_name": "cust_nation"})
         jn3 = jn2.merge(line_item_ds, left_on="o_orderkey", right_on="l_orderkey")
@@ -81,7 +66,9 @@ def q() -> None:
 
         return result_df.compute()  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM, query, tables=["nation", "customer", "lineitem", "orders", "supplier"]
+    )
 
 
 if __name__ == "__main__":
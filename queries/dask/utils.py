@@ -1,91 +1,133 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import dask
 import dask.dataframe as dd
+import pandas as pd
+import pyarrow as pa
 
 from queries.common_utils import (
     check_query_result_pd,
+    get_hive_partitioning,
     get_table_path,
-    on_second_call,
     run_query_generic,
 )
+from queries.memory_budget import get_spill_dir
+from queries.schema import get_arrow_schema, get_pandas_dtypes
+from queries.table_provider import TableProvider
 from settings import Settings
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     from dask.dataframe import DataFrame
 
 settings = Settings()
 
-dask.config.set(scheduler="threads")
+dask.config.set(scheduler="threads", num_workers=settings.run.threads)
+if settings.run.memory_limit is not None:
+    dask.config.set({"temporary-directory": str(get_spill_dir())})
 
 
-def read_ds(table_name: str) -> DataFrame:
-    if settings.run.io_type == "skip":
-        # TODO: Load into memory before returning the Dask DataFrame.
-        # Code below is tripped up by date types
-        # df = pd.read_parquet(path, dtype_backend="pyarrow")
-        # return dd.from_pandas(df, npartitions=os.cpu_count())
-        msg = "cannot run Dask starting from an in-memory representation"
-        raise RuntimeError(msg)
+def _read_ipc_batch(schema: pa.Schema, path: Path, index: int) -> pd.DataFrame:
+    # The file is memory-mapped, so uncompressed record batches are not copied. The
+    # mapping stays valid after closing the file, as long as the batch is used.
+    with pa.memory_map(str(path)) as source:
+        record_batch = pa.ipc.open_file(source).get_batch(index)
+    return record_batch.cast(schema).to_pandas(types_mapper=pd.ArrowDtype)  # type: ignore[no-any-return]
+
+
+def _read_ipc(table_name: str, path: Path) -> DataFrame:
+    """Read Arrow IPC files, with a partition per record batch."""
+    files = sorted(path.glob("**/*.feather")) if path.is_dir() else [path]
+    paths: list[Path] = []
+    indices: list[int] = []
+    for file in files:
+        with pa.memory_map(str(file)) as source:
+            n_batches = pa.ipc.open_file(source).num_record_batches
+        paths.extend([file] * n_batches)
+        indices.extend(range(n_batches))
+
+    schema = get_arrow_schema(table_name)
+    return dd.from_map(  # type: ignore[no-any-return, no-untyped-call]
+        partial(_read_ipc_batch, schema),
+        paths,
+        indices,
+        meta=schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype),
+        enforce_metadata=False,
+    )
+
 
+def read_ds(table_name: str) -> DataFrame:
     path = get_table_path(table_name)
+    dataset_options = {"partitioning": get_hive_partitioning(table_name) or "hive"}
 
+    if settings.run.io_type == "skip":
+        # Load the partitions into memory. Reading the Parquet file with Dask keeps
+        # the Arrow date types, which `dd.from_pandas` does not.
+        return dd.read_parquet(  # type: ignore[no-any-return]
+            path, dtype_backend="pyarrow", dataset=dataset_options
+        ).persist()
     if settings.run.io_type == "parquet":
-        return dd.read_parquet(path, dtype_backend="pyarrow")  # type: ignore[no-any-return]
+        return dd.read_parquet(  # type: ignore[no-any-return]
+            path, dtype_backend="pyarrow", dataset=dataset_options
+        )
     elif settings.run.io_type == "csv":
-        df = dd.read_csv(path, dtype_backend="pyarrow")
-        for c in df.columns:
-            if c.endswith("date"):
-                df[c] = df[c].astype("date32[day][pyarrow]")
-        return df  # type: ignore[no-any-return]
+        return dd.read_csv(  # type: ignore[no-any-return]
+            path, dtype=get_pandas_dtypes(table_name), dtype_backend="pyarrow"
+        )
+    elif settings.run.io_type == "feather":
+        return _read_ipc(table_name, path)
     else:
         msg = f"unsupported file type: {settings.run.io_type!r}"
         raise ValueError(msg)
 
 
-@on_second_call
+# Dask DataFrames are lazy, so they do not count towards the cache budget
+table_provider = TableProvider(read_ds, size_of=lambda _: 0)
+
+
 def get_line_item_ds() -> DataFrame:
-    return read_ds("lineitem")
+    return table_provider.get("lineitem")
 
 
-@on_second_call
 def get_orders_ds() -> DataFrame:
-    return read_ds("orders")
+    return table_provider.get("orders")
 
 
-@on_second_call
 def get_customer_ds() -> DataFrame:
-    return read_ds("customer")
+    return table_provider.get("customer")
 
 
-@on_second_call
 def get_region_ds() -> DataFrame:
-    return read_ds("region")
+    return table_provider.get("region")
 
 
-@on_second_call
 def get_nation_ds() -> DataFrame:
-    return read_ds("nation")
+    return table_provider.get("nation")
 
 
-@on_second_call
 def get_supplier_ds() -> DataFrame:
-    return read_ds("supplier")
+    return table_provider.get("supplier")
 
 
-@on_second_call
 def get_part_ds() -> DataFrame:
-    return read_ds("part")
+    return table_provider.get("part")
 
 
-@on_second_call
 def get_part_supp_ds() -> DataFrame:
-    return read_ds("partsupp")
-
-
-def run_query(query_number: int, query: Callable[..., Any]) -> None:
-    run_query_generic(query, query_number, "dask", query_checker=check_query_result_pd)
+    return table_provider.get("partsupp")
+
+
+def run_query(query_number: int, query: Callable[..., Any], tables: list[str]) -> None:
+    run_query_generic(
+        query,
+        query_number,
+        "dask",
+        query_checker=check_query_result_pd,
+        table_provider=table_provider,
+        tables=tables,
+    )
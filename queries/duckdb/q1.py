@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 1
 
@@ -8,6 +7,9 @@ Q_NUM = 1
 def q() -> None:
     lineitem = utils.get_line_item_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         l_returnflag,
@@ -23,7 +25,7 @@ def q() -> None:
     from
         {lineitem}
     where
-        l_shipdate <= '1998-09-02'
+        l_shipdate <= '{var1}'
     group by
         l_returnflag,
         l_linestatus
@@ -32,7 +34,7 @@ def q() -> None:
         l_linestatus
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 10
 
@@ -11,6 +10,9 @@ def q() -> None:
     line_item_ds = utils.get_line_item_ds()
     nation_ds = utils.get_nation_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         c_custkey,
@@ -29,8 +31,8 @@ def q() -> None:
     where
         c_custkey = o_custkey
         and l_orderkey = o_orderkey
-        and o_orderdate >= date '1993-10-01'
-        and o_orderdate < date '1993-10-01' + interval '3' month
+        and o_orderdate >= date '{var1}'
+        and o_orderdate < date '{var1}' + interval '3' month
         and l_returnflag = 'R'
         and c_nationkey = n_nationkey
     group by
@@ -46,7 +48,7 @@ def q() -> None:
     limit 20
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 11
 
@@ -10,6 +9,10 @@ def q() -> None:
     part_supp_ds = utils.get_part_supp_ds()
     nation_ds = utils.get_nation_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         ps_partkey,
@@ -21,12 +24,12 @@ def q() -> None:
     where
         ps_suppkey = s_suppkey
         and s_nationkey = n_nationkey
-        and n_name = 'GERMANY'
+        and n_name = '{var1}'
     group by
         ps_partkey having
                 sum(ps_supplycost * ps_availqty) > (
             select
-                sum(ps_supplycost * ps_availqty) * 0.0001
+                sum(ps_supplycost * ps_availqty) * {var2}
             from
                 {part_supp_ds},
                 {supplier_ds},
@@ -34,13 +37,13 @@ def q() -> None:
             where
                 ps_suppkey = s_suppkey
                 and s_nationkey = n_nationkey
-                and n_name = 'GERMANY'
+                and n_name = '{var1}'
             )
         order by
             value desc
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
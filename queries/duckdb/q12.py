@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 12
 
@@ -9,6 +8,11 @@ def q() -> None:
     line_item_ds = utils.get_line_item_ds()
     orders_ds = utils.get_orders_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
     query_str = f"""
     select
         l_shipmode,
@@ -29,17 +33,17 @@ def q() -> None:
         {line_item_ds}
     where
         o_orderkey = l_orderkey
-        and l_shipmode in ('MAIL', 'SHIP')
+        and l_shipmode in ('{var1}', '{var2}')
         and l_commitdate < l_receiptdate
         and l_shipdate < l_commitdate
-        and l_receiptdate >= date '1994-01-01'
-        and l_receiptdate < date '1994-01-01' + interval '1' year
+        and l_receiptdate >= date '{var3}'
+        and l_receiptdate < date '{var3}' + interval '1' year
     group by
         l_shipmode
     order by
         l_shipmode
 	"""
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
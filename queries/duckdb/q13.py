@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 13
 
@@ -9,6 +8,10 @@ def q() -> None:
     orders_ds = utils.get_orders_ds()
     customer_ds = utils.get_customer_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         c_count, count(*) as custdist
@@ -19,7 +22,7 @@ def q() -> None:
         from
             {customer_ds} left outer join {orders_ds} on
             c_custkey = o_custkey
-            and o_comment not like '%special%requests%'
+            and o_comment not like '%{var1}%{var2}%'
         group by
             c_custkey
         )as c_orders (c_custkey, c_count)
@@ -33,7 +36,7 @@ def q() -> None:
     utils.get_customer_ds()
     utils.get_orders_ds()
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
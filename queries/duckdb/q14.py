@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 14
 
@@ -9,6 +8,9 @@ def q() -> None:
     part_ds = utils.get_part_ds()
     line_item_ds = utils.get_line_item_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         round(100.00 * sum(case
@@ -21,11 +23,11 @@ def q() -> None:
         {part_ds}
     where
         l_partkey = p_partkey
-        and l_shipdate >= date '1995-09-01'
-        and l_shipdate < date '1995-09-01' + interval '1' month
+        and l_shipdate >= date '{var1}'
+        and l_shipdate < date '{var1}' + interval '1' month
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
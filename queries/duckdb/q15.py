@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 15
 
@@ -9,6 +8,9 @@ def q() -> None:
     line_item_ds = utils.get_line_item_ds()
     supplier_ds = utils.get_supplier_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     ddl = f"""
     create or replace temporary view revenue (supplier_no, total_revenue) as
         select
@@ -17,8 +19,8 @@ def q() -> None:
         from
             {line_item_ds}
         where
-            l_shipdate >= date '1996-01-01'
-            and l_shipdate < date '1996-01-01' + interval '3' month
+            l_shipdate >= date '{var1}'
+            and l_shipdate < date '{var1}' + interval '3' month
         group by
             l_suppkey
     """
@@ -45,11 +47,12 @@ def q() -> None:
         s_suppkey
 	"""
 
-    _ = duckdb.execute(ddl)
-    q_final = duckdb.sql(query_str)
+    con = utils.get_connection()
+    _ = con.execute(ddl)
+    q_final = con.sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
-    duckdb.execute("DROP VIEW IF EXISTS revenue")
+    con.execute("DROP VIEW IF EXISTS revenue")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 16
 
@@ -10,6 +9,11 @@ def q() -> None:
     supplier_ds = utils.get_supplier_ds()
     part_supp_ds = utils.get_part_supp_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = ", ".join(map(str, params["var3"]))
+
     query_str = f"""
     select
         p_brand,
@@ -21,9 +25,9 @@ def q() -> None:
         {part_ds}
     where
         p_partkey = ps_partkey
-        and p_brand <> 'Brand#45'
-        and p_type not like 'MEDIUM POLISHED%'
-        and p_size in (49, 14, 23, 45, 19, 3, 36, 9)
+        and p_brand <> '{var1}'
+        and p_type not like '{var2}%'
+        and p_size in ({var3})
         and ps_suppkey not in (
             select
                 s_suppkey
@@ -43,7 +47,7 @@ def q() -> None:
         p_size
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 17
 
@@ -9,6 +8,10 @@ def q() -> None:
     part_ds = utils.get_part_ds()
     line_item_ds = utils.get_line_item_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         round(sum(l_extendedprice) / 7.0, 2) as avg_yearly
@@ -17,8 +20,8 @@ def q() -> None:
         {part_ds}
     where
         p_partkey = l_partkey
-        and p_brand = 'Brand#23'
-        and p_container = 'MED BOX'
+        and p_brand = '{var1}'
+        and p_container = '{var2}'
         and l_quantity < (
             select
                 0.2 * avg(l_quantity)
@@ -29,7 +32,7 @@ def q() -> None:
         )
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 18
 
@@ -10,6 +9,9 @@ def q() -> None:
     orders_ds = utils.get_orders_ds()
     customer_ds = utils.get_customer_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         c_name,
@@ -30,7 +32,7 @@ def q() -> None:
                 {line_item_ds}
             group by
                 l_orderkey having
-                    sum(l_quantity) > 300
+                    sum(l_quantity) > {var1}
         )
         and c_custkey = o_custkey
         and o_orderkey = l_orderkey
@@ -46,7 +48,7 @@ def q() -> None:
     limit 100
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
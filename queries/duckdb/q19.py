@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 19
 
@@ -9,6 +8,14 @@ def q() -> None:
     part_ds = utils.get_part_ds()
     line_item_ds = utils.get_line_item_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+    var5 = params["var5"]
+    var6 = params["var6"]
+
     query_str = f"""
     select
         round(sum(l_extendedprice* (1 - l_discount)), 2) as revenue
@@ -18,9 +25,9 @@ def q() -> None:
     where
         (
             p_partkey = l_partkey
-            and p_brand = 'Brand#12'
+            and p_brand = '{var1}'
             and p_container in ('SM CASE', 'SM BOX', 'SM PACK', 'SM PKG')
-            and l_quantity >= 1 and l_quantity <= 1 + 10
+            and l_quantity >= {var4} and l_quantity <= {var4} + 10
             and p_size between 1 and 5
             and l_shipmode in ('AIR', 'AIR REG')
             and l_shipinstruct = 'DELIVER IN PERSON'
@@ -28,9 +35,9 @@ def q() -> None:
         or
         (
             p_partkey = l_partkey
-            and p_brand = 'Brand#23'
+            and p_brand = '{var2}'
             and p_container in ('MED BAG', 'MED BOX', 'MED PKG', 'MED PACK')
-            and l_quantity >= 10 and l_quantity <= 20
+            and l_quantity >= {var5} and l_quantity <= {var5} + 10
             and p_size between 1 and 10
             and l_shipmode in ('AIR', 'AIR REG')
             and l_shipinstruct = 'DELIVER IN PERSON'
@@ -38,16 +45,16 @@ def q() -> None:
         or
         (
             p_partkey = l_partkey
-            and p_brand = 'Brand#34'
+            and p_brand = '{var3}'
             and p_container in ('LG CASE', 'LG BOX', 'LG PACK', 'LG PKG')
-            and l_quantity >= 20 and l_quantity <= 30
+            and l_quantity >= {var6} and l_quantity <= {var6} + 10
             and p_size between 1 and 15
             and l_shipmode in ('AIR', 'AIR REG')
             and l_shipinstruct = 'DELIVER IN PERSON'
         )
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
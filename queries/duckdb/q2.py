@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 2
 
@@ -12,6 +11,11 @@ def q() -> None:
     part_ds = utils.get_part_ds()
     part_supp_ds = utils.get_part_supp_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
     query_str = f"""
     select
         s_acctbal,
@@ -31,11 +35,11 @@ def q() -> None:
     where
         p_partkey = ps_partkey
         and s_suppkey = ps_suppkey
-        and p_size = 15
-        and p_type like '%BRASS'
+        and p_size = {var1}
+        and p_type like '%{var2}'
         and s_nationkey = n_nationkey
         and n_regionkey = r_regionkey
-        and r_name = 'EUROPE'
+        and r_name = '{var3}'
         and ps_supplycost = (
             select
                 min(ps_supplycost)
@@ -49,7 +53,7 @@ def q() -> None:
                 and s_suppkey = ps_suppkey
                 and s_nationkey = n_nationkey
                 and n_regionkey = r_regionkey
-                and r_name = 'EUROPE'
+                and r_name = '{var3}'
         )
     order by
         s_acctbal desc,
@@ -59,7 +63,7 @@ def q() -> None:
     limit 100
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 20
 
@@ -12,6 +11,11 @@ def q() -> None:
     part_ds = utils.get_part_ds()
     part_supp_ds = utils.get_part_supp_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+
     query_str = f"""
     select
         s_name,
@@ -32,7 +36,7 @@ def q() -> None:
                     from
                         {part_ds}
                     where
-                        p_name like 'forest%'
+                        p_name like '{var4}%'
                 )
                 and ps_availqty > (
                     select
@@ -42,17 +46,17 @@ def q() -> None:
                     where
                         l_partkey = ps_partkey
                         and l_suppkey = ps_suppkey
-                        and l_shipdate >= date '1994-01-01'
-                        and l_shipdate < date '1994-01-01' + interval '1' year
+                        and l_shipdate >= date '{var1}'
+                        and l_shipdate < date '{var1}' + interval '1' year
                 )
         )
         and s_nationkey = n_nationkey
-        and n_name = 'CANADA'
+        and n_name = '{var3}'
     order by
         s_name
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 21
 
@@ -11,6 +10,9 @@ def q() -> None:
     nation_ds = utils.get_nation_ds()
     orders_ds = utils.get_orders_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         s_name,
@@ -45,7 +47,7 @@ def q() -> None:
                 and l3.l_receiptdate > l3.l_commitdate
         )
         and s_nationkey = n_nationkey
-        and n_name = 'SAUDI ARABIA'
+        and n_name = '{var1}'
     group by
         s_name
     order by
@@ -54,7 +56,7 @@ def q() -> None:
     limit 100
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
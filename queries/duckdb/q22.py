@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 22
 
@@ -9,6 +8,9 @@ def q() -> None:
     orders_ds = utils.get_orders_ds()
     customer_ds = utils.get_customer_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = ", ".join(f"'{code}'" for code in params["var1"])
+
     query_str = f"""
     select
         cntrycode,
@@ -22,7 +24,7 @@ def q() -> None:
             {customer_ds}
         where
             substring(c_phone from 1 for 2) in
-                (13, 31, 23, 29, 30, 18, 17)
+                ({var1})
             and c_acctbal > (
                 select
                     avg(c_acctbal)
@@ -31,7 +33,7 @@ def q() -> None:
                 where
                     c_acctbal > 0.00
                     and substring (c_phone from 1 for 2) in
-                        (13, 31, 23, 29, 30, 18, 17)
+                        ({var1})
             )
             and not exists (
                 select
@@ -48,7 +50,7 @@ def q() -> None:
         cntrycode
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
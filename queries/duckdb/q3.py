@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 3
 
@@ -10,6 +9,10 @@ def q() -> None:
     line_item_ds = utils.get_line_item_ds()
     orders_ds = utils.get_orders_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         l_orderkey,
@@ -21,11 +24,11 @@ def q() -> None:
         {orders_ds},
         {line_item_ds}
     where
-        c_mktsegment = 'BUILDING'
+        c_mktsegment = '{var1}'
         and c_custkey = o_custkey
         and l_orderkey = o_orderkey
-        and o_orderdate < '1995-03-15'
-        and l_shipdate > '1995-03-15'
+        and o_orderdate < '{var2}'
+        and l_shipdate > '{var2}'
     group by
         l_orderkey,
         o_orderdate,
@@ -36,7 +39,7 @@ def q() -> None:
     limit 10
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 4
 
@@ -9,6 +8,9 @@ def q() -> None:
     line_item_ds = utils.get_line_item_ds()
     orders_ds = utils.get_orders_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         o_orderpriority,
@@ -16,8 +18,8 @@ def q() -> None:
     from
         {orders_ds}
     where
-        o_orderdate >= timestamp '1993-07-01'
-        and o_orderdate < timestamp '1993-07-01' + interval '3' month
+        o_orderdate >= timestamp '{var1}'
+        and o_orderdate < timestamp '{var1}' + interval '3' month
         and exists (
             select
                 *
@@ -33,7 +35,7 @@ def q() -> None:
         o_orderpriority
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 5
 
@@ -13,6 +12,10 @@ def q() -> None:
     orders_ds = utils.get_orders_ds()
     supplier_ds = utils.get_supplier_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         n_name,
@@ -31,16 +34,16 @@ def q() -> None:
         and c_nationkey = s_nationkey
         and s_nationkey = n_nationkey
         and n_regionkey = r_regionkey
-        and r_name = 'ASIA'
-        and o_orderdate >= timestamp '1994-01-01'
-        and o_orderdate < timestamp '1994-01-01' + interval '1' year
+        and r_name = '{var1}'
+        and o_orderdate >= timestamp '{var2}'
+        and o_orderdate < timestamp '{var2}' + interval '1' year
     group by
         n_name
     order by
         revenue desc
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
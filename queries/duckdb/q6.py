@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 6
 
@@ -8,19 +7,25 @@ Q_NUM = 6
 def q() -> None:
     line_item_ds = utils.get_line_item_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+    var5 = params["var5"]
+
     query_str = f"""
     select
         sum(l_extendedprice * l_discount) as revenue
     from
         {line_item_ds}
     where
-        l_shipdate >= timestamp '1994-01-01'
-        and l_shipdate < timestamp '1994-01-01' + interval '1' year
-        and l_discount between .06 - 0.01 and .06 + 0.01
-        and l_quantity < 24
+        l_shipdate >= timestamp '{var1}'
+        and l_shipdate < timestamp '{var1}' + interval '1' year
+        and l_discount between {var3} and {var4}
+        and l_quantity < {var5}
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
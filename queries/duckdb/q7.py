@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 7
 
@@ -12,6 +11,10 @@ def q() -> None:
     orders_ds = utils.get_orders_ds()
     supplier_ds = utils.get_supplier_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
     query_str = f"""
     select
         supp_nation,
@@ -39,8 +42,8 @@ def q() -> None:
                 and s_nationkey = n1.n_nationkey
                 and c_nationkey = n2.n_nationkey
                 and (
-                    (n1.n_name = 'FRANCE' and n2.n_name = 'GERMANY')
-                    or (n1.n_name = 'GERMANY' and n2.n_name = 'FRANCE')
+                    (n1.n_name = '{var1}' and n2.n_name = '{var2}')
+                    or (n1.n_name = '{var2}' and n2.n_name = '{var1}')
                 )
                 and l_shipdate between timestamp '1995-01-01' and timestamp '1996-12-31'
         ) as shipping
@@ -54,7 +57,7 @@ def q() -> None:
         l_year
     """
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
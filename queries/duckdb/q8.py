@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 8
 
@@ -14,12 +13,17 @@ def q() -> None:
     nation_ds = utils.get_nation_ds()
     region_ds = utils.get_region_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
     query_str = f"""
     select
         o_year,
         round(
             sum(case
-                when nation = 'BRAZIL' then volume
+                when nation = '{var1}' then volume
                 else 0
             end) / sum(volume)
         , 2) as mkt_share
@@ -45,10 +49,10 @@ def q() -> None:
                 and o_custkey = c_custkey
                 and c_nationkey = n1.n_nationkey
                 and n1.n_regionkey = r_regionkey
-                and r_name = 'AMERICA'
+                and r_name = '{var2}'
                 and s_nationkey = n2.n_nationkey
                 and o_orderdate between timestamp '1995-01-01' and timestamp '1996-12-31'
-                and p_type = 'ECONOMY ANODIZED STEEL'
+                and p_type = '{var3}'
         ) as all_nations
     group by
         o_year
@@ -56,7 +60,7 @@ def q() -> None:
         o_year
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
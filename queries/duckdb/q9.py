@@ -1,6 +1,5 @@
-import duckdb
-
 from queries.duckdb import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 9
 
@@ -13,6 +12,9 @@ def q() -> None:
     part_supp_ds = utils.get_part_supp_ds()
     nation_ds = utils.get_nation_ds()
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     query_str = f"""
     select
         nation,
@@ -38,7 +40,7 @@ def q() -> None:
                 and p_partkey = l_partkey
                 and o_orderkey = l_orderkey
                 and s_nationkey = n_nationkey
-                and p_name like '%green%'
+                and p_name like '%{var1}%'
         ) as profit
     group by
         nation,
@@ -48,7 +50,7 @@ def q() -> None:
         o_year desc
 	"""
 
-    q_final = duckdb.sql(query_str)
+    q_final = utils.get_connection().sql(query_str)
 
     utils.run_query(Q_NUM, q_final)
 
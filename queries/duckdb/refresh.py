@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from queries.duckdb.utils import get_connection
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_table(sources: list[Path], output: Path) -> None:
+    """Write the concatenation of the source tables to `output`."""
+    union = " union all ".join(
+        f"select * from read_parquet('{path}')" for path in sources
+    )
+    get_connection().execute(f"copy ({union}) to '{output}' (format parquet)")
+
+
+def delete_rows(source: Path, key_column: str, keys: Path, output: Path) -> None:
+    """Write the rows of `source` whose key is not in `keys` to `output`."""
+    get_connection().execute(
+        f"""
+        copy (
+            select * from read_parquet('{source}')
+            where {key_column} not in (select orderkey from read_parquet('{keys}'))
+        ) to '{output}' (format parquet)
+        """
+    )
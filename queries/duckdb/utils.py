@@ -1,32 +1,80 @@
+import threading
+
 import duckdb
-from duckdb import DuckDBPyRelation
+import polars as pl
+import pyarrow.dataset as ds
+from duckdb import DuckDBPyConnection, DuckDBPyRelation
+from pyarrow import fs
 
 from queries.common_utils import (
     check_query_result_pl,
+    get_library_version,
     get_table_path,
+    query_phase,
     run_query_generic,
 )
+from queries.memory_budget import get_engine_memory_limit, get_spill_dir
+from queries.plans import save_plan
+from queries.schema import get_arrow_schema, get_sql_types
 from settings import Settings
 
 settings = Settings()
 
+_connection = duckdb.connect()
+_local = threading.local()
+_create_table_lock = threading.Lock()
+
+if settings.run.threads is not None:
+    _connection.sql(f"SET threads = {settings.run.threads}")
+if (memory_limit := get_engine_memory_limit()) is not None:
+    _connection.sql(f"SET memory_limit = '{memory_limit // 2**20}MiB'")
+    _connection.sql(f"SET temp_directory = '{get_spill_dir()}'")
+
+
+def get_connection() -> DuckDBPyConnection:
+    """Return the connection to run queries on from the current thread.
+
+    A DuckDB connection must not be shared between threads, so every thread (e.g.
+    a stream of the throughput test) gets its own cursor of the same database.
+    """
+    if not hasattr(_local, "connection"):
+        _local.connection = _connection.cursor()
+    return _local.connection  # type: ignore[no-any-return]
+
 
 def _scan_ds(table_name: str) -> str:
     path = get_table_path(table_name)
-    path_str = str(path)
+    name = str(path).replace("/", "_").replace(".", "_").replace("-", "_")
+    # Tables can also be directories of files, e.g. after appending to them, or
+    # hive partitioned directories, whose keys are read from the paths so that
+    # filters on them skip directories
+    path_str = str(path / f"**/*{path.suffix}") if path.is_dir() else str(path)
+    hive_partitioning = settings.run.partitioning == "hive"
+    scan = f"read_parquet('{path_str}', hive_partitioning = {str(hive_partitioning).lower()})"
+    con = get_connection()
 
     if settings.run.io_type == "skip":
-        name = path_str.replace("/", "_").replace(".", "_").replace("-", "_")
-        duckdb.sql(
-            f"create temp table if not exists {name} as select * from read_parquet('{path_str}');"
-        )
+        # Not a temp table, as those are only visible to a single cursor
+        with _create_table_lock:
+            con.sql(f"create table if not exists {name} as select * from {scan};")
         return name
     elif settings.run.io_type == "parquet":
-        duckdb.read_parquet(path_str)
-        return f"'{path_str}'"
+        con.read_parquet(path_str, hive_partitioning=hive_partitioning)
+        return scan
     elif settings.run.io_type == "csv":
-        duckdb.read_csv(path_str)
-        return f"'{path_str}'"
+        return f"read_csv('{path_str}', header = true, columns = {get_sql_types(table_name)})"
+    elif settings.run.io_type == "feather":
+        # DuckDB scans Arrow datasets with projection and filter pushdown. The files
+        # are memory-mapped, so uncompressed record batches are not copied. The
+        # schema casts the string views written by Polars, which Arrow can't filter.
+        dataset = ds.dataset(
+            path,
+            schema=get_arrow_schema(table_name),
+            format="ipc",
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
+        con.register(name, dataset)
+        return name
     else:
         msg = f"unsupported file type: {settings.run.io_type!r}"
         raise ValueError(msg)
@@ -65,7 +113,19 @@ def get_part_supp_ds() -> str:
 
 
 def run_query(query_number: int, context: DuckDBPyRelation) -> None:
-    query = context.pl
+    def query() -> pl.DataFrame:
+        # Same as `context.pl()`, with the conversion to Polars timed separately
+        table = context.arrow()
+        with query_phase("materialize"):
+            return pl.from_arrow(table)  # type: ignore[return-value]
+
     run_query_generic(
         query, query_number, "duckdb", query_checker=check_query_result_pl
     )
+
+    if settings.run.capture_plans:
+        # Profiled after the timed runs, as `EXPLAIN ANALYZE` runs the query again
+        explain = f"EXPLAIN (ANALYZE, FORMAT JSON) {context.sql_query()}"
+        plan = get_connection().sql(explain).fetchall()[0][1]
+        version = get_library_version("duckdb")
+        save_plan("duckdb", version, query_number, plan, suffix="json")
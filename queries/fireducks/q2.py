@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from queries.fireducks import utils
+from queries.parameters import get_parameters
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -11,34 +12,18 @@ Q_NUM = 2
 
 
 def q() -> None:
-    region_ds = utils.get_region_ds
-    nation_ds = utils.get_nation_ds
-    supplier_ds = utils.get_supplier_ds
-    part_ds = utils.get_part_ds
-    part_supp_ds = utils.get_part_supp_ds
-
-    # first call one time to cache in case we don't include the IO times
-    region_ds()
-    nation_ds()
-    supplier_ds()
-    part_ds()
-    part_supp_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal region_ds
-        nonlocal nation_ds
-        nonlocal supplier_ds
-        nonlocal part_ds
-        nonlocal part_supp_ds
-        region_ds = region_ds()
-        nation_ds = nation_ds()
-        supplier_ds = supplier_ds()
-        part_ds = part_ds()
-        part_supp_ds = part_supp_ds()
-
-        var1 = 15
-        var2 = "BRASS"
-        var3 = "EUROPE"
+        region_ds = utils.get_region_ds()
+        nation_ds = utils.get_nation_ds()
+        supplier_ds = utils.get_supplier_ds()
+        part_ds = utils.get_part_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
 
         jn = (
             part_ds.merge(part_supp_ds, left_on="p_partkey", right_on="ps_partkey")
@@ -77,7 +62,9 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM, query, tables=["region", "nation", "supplier", "part", "partsupp"]
+    )
 
 
 if __name__ == "__main__":
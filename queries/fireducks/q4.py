@@ -1,30 +1,22 @@
 from __future__ import annotations
 
-from datetime import date
-
 import pandas as pd
 
 from queries.fireducks import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 4
 
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # first call one time to cache in case we don't include the IO times
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = date(1993, 7, 1)
-        var2 = date(1993, 10, 1)
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         jn = line_item_ds.merge(orders_ds, left_on="l_orderkey", right_on="o_orderkey")
 
@@ -40,7 +32,7 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "orders"])
 
 
 if __name__ == "__main__":
@@ -5,38 +5,23 @@ from datetime import date
 import pandas as pd
 
 from queries.fireducks import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 7
 
 
 def q() -> None:
-    nation_ds = utils.get_nation_ds
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # first call one time to cache in case we don't include the IO times
-    nation_ds()
-    customer_ds()
-    line_item_ds()
-    orders_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal nation_ds
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal orders_ds
-        nonlocal supplier_ds
-        nation_ds = nation_ds()
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = "FRANCE"
-        var2 = "GERMANY"
+        nation_ds = utils.get_nation_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
+        supplier_ds = utils.get_supplier_ds()
+
+        var1 = params["var1"]
+        var2 = params["var2"]
         var3 = date(1995, 1, 1)
         var4 = date(1996, 12, 31)
 
@@ -75,7 +60,9 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM, query, tables=["nation", "customer", "lineitem", "orders", "supplier"]
+    )
 
 
 if __name__ == "__main__":
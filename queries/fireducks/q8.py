@@ -4,6 +4,7 @@ from datetime import date
 from typing import TYPE_CHECKING
 
 from queries.fireducks import utils
+from queries.parameters import get_parameters
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -12,42 +13,20 @@ Q_NUM = 8
 
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-    part_ds = utils.get_part_ds
-    region_ds = utils.get_region_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # first call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    nation_ds()
-    orders_ds()
-    part_ds()
-    region_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-        nonlocal part_ds
-        nonlocal region_ds
-        nonlocal supplier_ds
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
-        part_ds = part_ds()
-        region_ds = region_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = "BRAZIL"
-        var2 = "AMERICA"
-        var3 = "ECONOMY ANODIZED STEEL"
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
+        part_ds = utils.get_part_ds()
+        region_ds = utils.get_region_ds()
+        supplier_ds = utils.get_supplier_ds()
+
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
         var4 = date(1995, 1, 1)
         var5 = date(1996, 12, 31)
 
@@ -85,7 +64,19 @@ def q() -> None:
 
         return result_df  # type: ignore[no-any-return]
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM,
+        query,
+        tables=[
+            "customer",
+            "lineitem",
+            "nation",
+            "orders",
+            "part",
+            "region",
+            "supplier",
+        ],
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+"""Measure the peak memory usage of a query.
+
+The peak resident set size (RSS) of the process is sampled by a background
+thread and combined with the lifetime peak that `getrusage` reports. If that
+lifetime peak grew while the query ran, it was reached by the query, which makes
+it exact when every query runs in its own subprocess.
+
+The Arrow memory pool is tracked the same way, for libraries that allocate
+through it (pandas with Arrow dtypes, DuckDB results, PySpark, ...). With
+`RUN_TRACEMALLOC`, the peak of the allocations of the Python allocator is traced
+as well, which mostly matters for pandas with NumPy dtypes. Within a memory
+budget, the peak size of the spill directory is sampled too.
+"""
+
+from __future__ import annotations
+
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from queries.memory_budget import get_spill_bytes
+from settings import Settings
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+settings = Settings()
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _get_rss() -> int:
+    """Return the current resident set size of the process in bytes."""
+    return int(Path("/proc/self/statm").read_text().split()[1]) * _PAGE_SIZE
+
+
+def _get_max_rss() -> int:
+    """Return the peak resident set size of the process so far in bytes."""
+    # Linux reports kilobytes
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _get_arrow_pool() -> Any:
+    """Return the default Arrow memory pool, if pyarrow is used at all."""
+    # Do not import pyarrow for libraries that do not use it
+    if "pyarrow" not in sys.modules:
+        return None
+    return sys.modules["pyarrow"].default_memory_pool()
+
+
+class MemoryMonitor:
+    """Track the peak memory usage of the process while in the context."""
+
+    def __init__(self) -> None:
+        self.peak_rss = 0
+        self.arrow_peak: int | None = None
+        self.tracemalloc_peak: int | None = None
+        self.spill_peak: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        self.peak_rss = max(self.peak_rss, _get_rss())
+        if self._arrow_pool is not None:
+            self.arrow_peak = max(
+                self.arrow_peak or 0, self._arrow_pool.bytes_allocated()
+            )
+        if settings.run.memory_limit is not None:
+            self.spill_peak = max(self.spill_peak or 0, get_spill_bytes())
+
+    def _run(self) -> None:
+        while not self._stop.wait(settings.run.memory_sample_interval):
+            self._sample()
+
+    def __enter__(self) -> Self:
+        self._arrow_pool = _get_arrow_pool()
+        self._max_rss_start = _get_max_rss()
+        if self._arrow_pool is not None:
+            self._arrow_max_start = self._arrow_pool.max_memory()
+        self._sample()
+
+        if settings.run.tracemalloc:
+            tracemalloc.start()
+
+        if settings.run.memory_sample_interval > 0:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if settings.run.tracemalloc:
+            self.tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+        # A lifetime peak that grew while the query ran was reached by the query
+        max_rss = _get_max_rss()
+        if max_rss > self._max_rss_start:
+            self.peak_rss = max(self.peak_rss, max_rss)
+
+        # If the query imported pyarrow, all Arrow allocations are its own
+        if self._arrow_pool is None and (pool := _get_arrow_pool()) is not None:
+            self.arrow_peak = pool.max_memory()
+        elif self._arrow_pool is not None:
+            arrow_max = self._arrow_pool.max_memory()
+            if arrow_max > self._arrow_max_start:
+                self.arrow_peak = max(self.arrow_peak or 0, arrow_max)
@@ -0,0 +1,206 @@
+"""Run query subprocesses within a memory budget.
+
+With `RUN_MEMORY_LIMIT`, every query subprocess runs in a transient cgroup v2
+scope with that `MemoryMax` and no swap, started with `systemd-run`. Without
+systemd on cgroup v2, the address space of the subprocess is limited with
+`RLIMIT_AS` instead. That limit is on virtual memory, so engines that reserve a
+lot of address space (the JVM, jemalloc, ...) fail earlier than they would on
+resident memory.
+
+The engines themselves are configured to stay within a share of the budget and
+to spill to a directory of their own, see `get_engine_memory_limit` and
+`get_spill_dir`. The outcome of every query subprocess is logged as one of the
+statuses ok, oom, error or timeout.
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import os
+import resource
+import shutil
+import signal
+import sys
+import threading
+from contextlib import suppress
+from datetime import datetime
+from functools import cache
+from pathlib import Path
+from subprocess import PIPE, STDOUT, Popen
+from typing import TYPE_CHECKING, Literal, TypeAlias
+
+from settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+settings = Settings()
+
+QueryStatus: TypeAlias = Literal["ok", "oom", "error", "timeout"]
+
+# Share of the budget for the engine's own memory limit, the rest is headroom
+# for the interpreter, the query result and allocations the engine does not track
+ENGINE_MEMORY_SHARE = 0.8
+
+# Output of the engines that failed to allocate memory
+_OOM_MARKERS = (
+    "MemoryError",
+    "Out of Memory",  # DuckDB
+    "memory allocation of",  # Rust
+    "java.lang.OutOfMemoryError",
+    "std::bad_alloc",
+    "malloc of size",  # Arrow
+    "Unable to allocate",  # NumPy
+    "Cannot allocate memory",
+)
+
+
+def get_engine_memory_limit() -> int | None:
+    """Return the memory limit of the engine in bytes, if there is a budget."""
+    if settings.run.memory_limit is None:
+        return None
+    return int(settings.run.memory_limit * ENGINE_MEMORY_SHARE)
+
+
+@cache
+def get_spill_dir() -> Path:
+    """Return the spill directory of this process, removed when it exits."""
+    path = settings.paths.spill / str(os.getpid())
+    path.mkdir(parents=True, exist_ok=True)
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def get_spill_bytes() -> int:
+    """Return the size of the files in the spill directory of this process."""
+    size = 0
+    for root, _, files in os.walk(get_spill_dir()):
+        for name in files:
+            # Spill files can be removed while walking the directory
+            with suppress(FileNotFoundError):
+                size += (Path(root) / name).stat().st_size
+    return size
+
+
+def _has_systemd_cgroup_v2() -> bool:
+    return (
+        Path("/sys/fs/cgroup/cgroup.controllers").exists()
+        and Path("/run/systemd/system").exists()
+        and shutil.which("systemd-run") is not None
+    )
+
+
+def _limit_address_space(limit: int) -> Callable[[], None]:
+    def preexec() -> None:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    return preexec
+
+
+def _budgeted_command(
+    command: list[str],
+) -> tuple[list[str], Callable[[], None] | None]:
+    """Return the command and the function to run in the child to limit memory."""
+    limit = settings.run.memory_limit
+    if limit is None:
+        return command, None
+    if _has_systemd_cgroup_v2():
+        user = ["--user"] if os.geteuid() != 0 else []
+        return [
+            "systemd-run",
+            *user,
+            "--scope",
+            "--quiet",
+            "--property=MemorySwapMax=0",
+            f"--property=MemoryMax={limit}",
+            "--",
+            *command,
+        ], None
+    return command, _limit_address_space(limit)
+
+
+def _get_status(returncode: int | None, output: str) -> QueryStatus:
+    if returncode is None:
+        return "timeout"
+    # Processes over their cgroup limit are killed by the kernel
+    killed = returncode == -signal.SIGKILL and settings.run.memory_limit is not None
+    if killed or any(marker in output for marker in _OOM_MARKERS):
+        return "oom"
+    if returncode != 0 or "FAILED" in output or "Traceback" in output:
+        return "error"
+    return "ok"
+
+
+def run_query_process(
+    library_name: str,
+    query_number: int,
+    command: list[str],
+    env: dict[str, str] | None = None,
+    timeout: float | None = None,
+) -> QueryStatus:
+    """Run a query subprocess within the memory budget and log its status.
+
+    The output of the subprocess is passed through, and scanned for failures.
+    """
+    command, preexec_fn = _budgeted_command(command)
+    with Popen(
+        command, env=env, stdout=PIPE, stderr=STDOUT, text=True, preexec_fn=preexec_fn
+    ) as process:
+        timer = threading.Timer(timeout, process.kill) if timeout else None
+        if timer is not None:
+            timer.start()
+
+        output = []
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
+            output.append(line)
+        returncode = process.wait()
+
+        # The timer has finished before it is cancelled only if it killed the process
+        timed_out = timer is not None and timer.finished.is_set()
+        if timer is not None:
+            timer.cancel()
+
+    if timed_out:
+        print(f"q{query_number} timed out after {timeout} seconds")
+    status = _get_status(None if timed_out else returncode, "".join(output))
+    if settings.run.log_timings:
+        log_query_status(library_name, query_number, status, returncode)
+    return status
+
+
+def log_query_status(
+    solution: str, query_number: int, status: QueryStatus, returncode: int
+) -> None:
+    settings.paths.timings.mkdir(parents=True, exist_ok=True)
+
+    path = settings.paths.timings / settings.paths.status_filename
+    with path.open("a", newline="") as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(
+                [
+                    "solution",
+                    "query_number",
+                    "status",
+                    "returncode",
+                    "memory_limit[B]",
+                    "io_type",
+                    "scale_factor",
+                    "datetime_iso",
+                ]
+            )
+        writer.writerow(
+            [
+                solution,
+                str(query_number),
+                status,
+                str(returncode),
+                str(settings.run.memory_limit or ""),
+                settings.run.io_type,
+                str(settings.scale_factor),
+                datetime.now().isoformat(),
+            ]
+        )
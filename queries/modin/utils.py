@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import os
+import sys
 from typing import TYPE_CHECKING, Any
 
 import modin.pandas as pd
 
 from queries.common_utils import (
     check_query_result_pd,
+    get_hive_partitioning,
     get_table_path,
-    on_second_call,
     run_query_generic,
 )
+from queries.memory_budget import get_engine_memory_limit
+from queries.schema import get_pandas_dtypes
+from queries.table_provider import TableProvider
+from queries.table_store import get_store_path
 from settings import Settings
 
 if TYPE_CHECKING:
@@ -20,21 +25,28 @@ settings = Settings()
 
 pd.options.mode.copy_on_write = True
 
-os.environ["MODIN_MEMORY"] = str(settings.run.modin_memory)
+# Size of the Ray object store, within the memory budget if there is one
+os.environ["MODIN_MEMORY"] = str(
+    min(settings.run.modin_memory, get_engine_memory_limit() or sys.maxsize)
+)
 
 
 def _read_ds(table_name: str) -> pd.DataFrame:
     path = get_table_path(table_name)
 
-    if settings.run.io_type in ("parquet", "skip"):
-        return pd.read_parquet(path, dtype_backend="pyarrow")
+    if settings.run.io_type == "skip":
+        # Read the uncompressed table from the shared-memory store
+        return pd.read_feather(get_store_path(table_name), dtype_backend="pyarrow")
+    elif settings.run.io_type == "parquet":
+        return pd.read_parquet(
+            path,
+            dtype_backend="pyarrow",
+            partitioning=get_hive_partitioning(table_name),
+        )
     elif settings.run.io_type == "csv":
-        df = pd.read_csv(path, dtype_backend="pyarrow")
-        # TODO: This is slow - we should use the known schema to read dates directly
-        for c in df.columns:
-            if c.endswith("date"):
-                df[c] = df[c].astype("date32[day][pyarrow]")
-        return df
+        return pd.read_csv(
+            path, dtype=get_pandas_dtypes(table_name), dtype_backend="pyarrow"
+        )
     elif settings.run.io_type == "feather":
         return pd.read_feather(path, dtype_backend="pyarrow")
     else:
@@ -42,50 +54,47 @@ def _read_ds(table_name: str) -> pd.DataFrame:
         raise ValueError(msg)
 
 
-@on_second_call
+table_provider = TableProvider(_read_ds)
+
+
 def get_line_item_ds() -> pd.DataFrame:
-    return _read_ds("lineitem")
+    return table_provider.get("lineitem")
 
 
-@on_second_call
 def get_orders_ds() -> pd.DataFrame:
-    return _read_ds("orders")
+    return table_provider.get("orders")
 
 
-@on_second_call
 def get_customer_ds() -> pd.DataFrame:
-    return _read_ds("customer")
+    return table_provider.get("customer")
 
 
-@on_second_call
 def get_region_ds() -> pd.DataFrame:
-    return _read_ds("region")
+    return table_provider.get("region")
 
 
-@on_second_call
 def get_nation_ds() -> pd.DataFrame:
-    return _read_ds("nation")
+    return table_provider.get("nation")
 
 
-@on_second_call
 def get_supplier_ds() -> pd.DataFrame:
-    return _read_ds("supplier")
+    return table_provider.get("supplier")
 
 
-@on_second_call
 def get_part_ds() -> pd.DataFrame:
-    return _read_ds("part")
+    return table_provider.get("part")
 
 
-@on_second_call
 def get_part_supp_ds() -> pd.DataFrame:
-    return _read_ds("partsupp")
+    return table_provider.get("partsupp")
 
 
-def run_query(query_number: int, query: Callable[..., Any]) -> None:
+def run_query(query_number: int, query: Callable[..., Any], tables: list[str]) -> None:
     run_query_generic(
         query,
         query_number,
         "modin",
         query_checker=lambda df, q: check_query_result_pd(df._to_pandas(), q),
+        table_provider=table_provider,
+        tables=tables,
     )
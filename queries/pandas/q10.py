@@ -3,34 +3,21 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 10
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    customer_ds()
-    line_item_ds()
-    nation_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = pd.Timestamp("1993-10-01")
-        var2 = pd.Timestamp("1994-01-01")
+        var1 = pd.Timestamp(params["var1"])
+        var2 = pd.Timestamp(params["var2"])
 
         # Select necessary columns
         customer_cols = ["c_custkey", "c_name", "c_acctbal", "c_phone", "c_nationkey", "c_address", "c_comment"]
@@ -55,7 +42,7 @@ def q() -> None:
         # Group by and aggregate
         grouped_df = merged_df.groupby(
             ["c_custkey", "c_name", "c_acctbal", "c_phone", "n_name", "c_address", "c_comment"], as_index=False
-        )["revenue"].sum()
+        )[["revenue"]].sum()
 
         # Sort and select top 20
         result_df = grouped_df.sort_values(by="revenue", ascending=False).head(20)
@@ -65,7 +52,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "lineitem", "nation", "orders"])
 
 if __name__ == "__main__":
     q()
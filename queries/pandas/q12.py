@@ -3,28 +3,21 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 12
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal orders_ds
-
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
+        line_item_ds = utils.get_line_item_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = "MAIL"
-        var2 = "SHIP"
-        var3 = pd.Timestamp("1994-01-01")
-        var4 = pd.Timestamp("1995-01-01")
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = pd.Timestamp(params["var3"])
+        var4 = pd.Timestamp(params["var4"])
 
         # Join orders and lineitem
         merged_df = orders_ds.merge(line_item_ds, left_on="o_orderkey", right_on="l_orderkey")
@@ -54,7 +47,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "orders"])
 
 if __name__ == "__main__":
     q()
@@ -3,26 +3,19 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 13
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    customer_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal orders_ds
-
-        customer_ds = customer_ds()
-        orders_ds = orders_ds()
+        customer_ds = utils.get_customer_ds()
+        orders_ds = utils.get_orders_ds()
 
-        var1 = "special"
-        var2 = "requests"
+        var1 = params["var1"]
+        var2 = params["var2"]
 
         # Filter orders where o_comment does not contain "special" followed by "requests"
         filtered_orders = orders_ds[~orders_ds["o_comment"].str.contains(f"{var1}.*{var2}")]
@@ -48,7 +41,7 @@ def q() -> None:
         return custdist_df
 
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "orders"])
 
 if __name__ == "__main__":
     q()
@@ -3,26 +3,19 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 14
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    part_ds = utils.get_part_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    part_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal part_ds
-
-        line_item_ds = line_item_ds()
-        part_ds = part_ds()
+        line_item_ds = utils.get_line_item_ds()
+        part_ds = utils.get_part_ds()
 
-        var1 = pd.Timestamp("1995-09-01")
-        var2 = pd.Timestamp("1995-10-01")
+        var1 = pd.Timestamp(params["var1"])
+        var2 = pd.Timestamp(params["var2"])
 
         # Join lineitem and part
         merged_df = line_item_ds.merge(part_ds, left_on="l_partkey", right_on="p_partkey")
@@ -43,7 +36,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "part"])
 
 if __name__ == "__main__":
     q()
@@ -3,29 +3,21 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 16
 
 def q() -> None:
-    part_ds = utils.get_part_ds
-    part_supp_ds = utils.get_part_supp_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call one time to cache in case we don't include the IO times
-    part_ds()
-    part_supp_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal part_ds
-        nonlocal part_supp_ds
-        nonlocal supplier_ds
-
-        part_ds = part_ds()
-        part_supp_ds = part_supp_ds()
-        supplier_ds = supplier_ds()
+        part_ds = utils.get_part_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        var1 = "Brand#45"
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
 
         # Filter supplier for comments containing "Customer" and "Complaints"
         supplier_filtered = supplier_ds[supplier_ds["s_comment"].str.contains(".*Customer.*Complaints.*")]
@@ -36,8 +28,8 @@ def q() -> None:
         merged_df = part_ds.merge(part_supp_ds, left_on="p_partkey", right_on="ps_partkey")
         filtered_df = (
             merged_df[(merged_df["p_brand"] != var1) &
-                      (~merged_df["p_type"].str.contains("MEDIUM POLISHED")) &
-                      (merged_df["p_size"].isin([49, 14, 23, 45, 19, 3, 36, 9]))]
+                      (~merged_df["p_type"].str.startswith(var2)) &
+                      (merged_df["p_size"].isin(var3))]
         )
 
         # Left join with supplier_filtered and filter out rows with matching ps_suppkey
@@ -54,7 +46,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["part", "partsupp", "supplier"])
 
 if __name__ == "__main__":
     q()
@@ -3,23 +3,23 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 19
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    part_ds = utils.get_part_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    part_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal part_ds
+        line_item_ds = utils.get_line_item_ds()
+        part_ds = utils.get_part_ds()
 
-        line_item_ds = line_item_ds()
-        part_ds = part_ds()
+        var1 = params["var1"]
+        var2 = params["var2"]
+        var3 = params["var3"]
+        var4 = params["var4"]
+        var5 = params["var5"]
+        var6 = params["var6"]
 
         # Join part with lineitem
         merged_df = part_ds.merge(line_item_ds, left_on="p_partkey", right_on="l_partkey")
@@ -29,17 +29,17 @@ def q() -> None:
             (merged_df["l_shipmode"].isin(["AIR", "AIR REG"])) &
             (merged_df["l_shipinstruct"] == "DELIVER IN PERSON") &
             (
-                ((merged_df["p_brand"] == "Brand#12") &
+                ((merged_df["p_brand"] == var1) &
                  (merged_df["p_container"].isin(["SM CASE", "SM BOX", "SM PACK", "SM PKG"])) &
-                 (merged_df["l_quantity"].between(1, 11)) &
+                 (merged_df["l_quantity"].between(var4, var4 + 10)) &
                  (merged_df["p_size"].between(1, 5))) |
-                ((merged_df["p_brand"] == "Brand#23") &
+                ((merged_df["p_brand"] == var2) &
                  (merged_df["p_container"].isin(["MED BAG", "MED BOX", "MED PKG", "MED PACK"])) &
-                 (merged_df["l_quantity"].between(10, 20)) &
+                 (merged_df["l_quantity"].between(var5, var5 + 10)) &
                  (merged_df["p_size"].between(1, 10))) |
-                ((merged_df["p_brand"] == "Brand#34") &
+                ((merged_df["p_brand"] == var3) &
                  (merged_df["p_container"].isin(["LG CASE", "LG BOX", "LG PACK", "LG PKG"])) &
-                 (merged_df["l_quantity"].between(20, 30)) &
+                 (merged_df["l_quantity"].between(var6, var6 + 10)) &
                  (merged_df["p_size"].between(1, 15)))
             )
         ]
@@ -50,7 +50,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["lineitem", "part"])
 
 if __name__ == "__main__":
     q()
@@ -3,40 +3,24 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 20
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    part_ds = utils.get_part_ds
-    part_supp_ds = utils.get_part_supp_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    nation_ds()
-    part_ds()
-    part_supp_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal part_ds
-        nonlocal part_supp_ds
-        nonlocal supplier_ds
-
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        part_ds = part_ds()
-        part_supp_ds = part_supp_ds()
-        supplier_ds = supplier_ds()
-
-        var1 = pd.Timestamp("1994-01-01")
-        var2 = pd.Timestamp("1995-01-01")
-        var3 = "CANADA"
-        var4 = "forest"
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        part_ds = utils.get_part_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+        supplier_ds = utils.get_supplier_ds()
+
+        var1 = pd.Timestamp(params["var1"])
+        var2 = pd.Timestamp(params["var2"])
+        var3 = params["var3"]
+        var4 = params["var4"]
 
         # Filter lineitem by shipdate and group by l_partkey and l_suppkey
         lineitem_grouped = (
@@ -70,7 +54,9 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM, query, tables=["lineitem", "nation", "part", "partsupp", "supplier"]
+    )
 
 if __name__ == "__main__":
     q()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -10,24 +11,18 @@ if TYPE_CHECKING:
 Q_NUM = 22
 
 def q() -> None:
-    customer_ds = utils.get_customer_ds
-    orders_ds = utils.get_orders_ds
-
-    # First call one time to cache in case we don't include the IO times
-    customer_ds()
-    orders_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal customer_ds
-        nonlocal orders_ds
+        customer_ds = utils.get_customer_ds()
+        orders_ds = utils.get_orders_ds()
 
-        customer_ds = customer_ds()
-        orders_ds = orders_ds()
+        var1 = params["var1"]
 
         # Add country code column by slicing first two characters of c_phone
         q1 = customer_ds.copy()
         q1["cntrycode"] = q1["c_phone"].str.slice(0, 2)
-        q1 = q1[q1["cntrycode"].isin(["13", "31", "23", "29", "30", "18", "17"])]
+        q1 = q1[q1["cntrycode"].isin(var1)]
         q1 = q1[["c_acctbal", "c_custkey", "cntrycode"]]
 
         # Calculate average account balance for customers with positive c_acctbal
@@ -51,7 +46,7 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(Q_NUM, query, tables=["customer", "orders"])
 
 if __name__ == "__main__":
     q()
@@ -3,39 +3,22 @@ from __future__ import annotations
 import pandas as pd
 
 from queries.pandas import utils
+from queries.parameters import get_parameters
 
 Q_NUM = 9
 
 def q() -> None:
-    line_item_ds = utils.get_line_item_ds
-    nation_ds = utils.get_nation_ds
-    orders_ds = utils.get_orders_ds
-    part_ds = utils.get_part_ds
-    part_supp_ds = utils.get_part_supp_ds
-    supplier_ds = utils.get_supplier_ds
-
-    # First call one time to cache in case we don't include the IO times
-    line_item_ds()
-    nation_ds()
-    orders_ds()
-    part_ds()
-    part_supp_ds()
-    supplier_ds()
+    params = get_parameters(Q_NUM)
 
     def query() -> pd.DataFrame:
-        nonlocal line_item_ds
-        nonlocal nation_ds
-        nonlocal orders_ds
-        nonlocal part_ds
-        nonlocal part_supp_ds
-        nonlocal supplier_ds
+        line_item_ds = utils.get_line_item_ds()
+        nation_ds = utils.get_nation_ds()
+        orders_ds = utils.get_orders_ds()
+        part_ds = utils.get_part_ds()
+        part_supp_ds = utils.get_part_supp_ds()
+        supplier_ds = utils.get_supplier_ds()
 
-        line_item_ds = line_item_ds()
-        nation_ds = nation_ds()
-        orders_ds = orders_ds()
-        part_ds = part_ds()
-        part_supp_ds = part_supp_ds()
-        supplier_ds = supplier_ds()
+        var1 = params["var1"]
 
         # Join part and partsupp
         merged_df = part_ds.merge(part_supp_ds, left_on="p_partkey", right_on="ps_partkey")
@@ -48,8 +31,8 @@ def q() -> None:
         # Join nation
         merged_df = merged_df.merge(nation_ds, left_on="s_nationkey", right_on="n_nationkey")
 
-        # Filter p_name containing "green"
-        filtered_df = merged_df[merged_df["p_name"].str.contains("green")]
+        # Filter p_name containing the color
+        filtered_df = merged_df[merged_df["p_name"].str.contains(var1)]
 
         # Select the relevant columns and calculate "amount"
         filtered_df = filtered_df.assign(
@@ -71,7 +54,18 @@ def q() -> None:
 
         return result_df
 
-    utils.run_query(Q_NUM, query)
+    utils.run_query(
+        Q_NUM,
+        query,
+        tables=[
+            "lineitem",
+            "nation",
+            "orders",
+            "part",
+            "partsupp",
+            "supplier",
+        ],
+    )
 
 if __name__ == "__main__":
     q()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_table(sources: list[Path], output: Path) -> None:
+    """Write the concatenation of the source tables to `output`."""
+    df = pd.concat(
+        [pd.read_parquet(path, dtype_backend="pyarrow") for path in sources],
+        ignore_index=True,
+    )
+    df.to_parquet(output, index=False)
+
+
+def delete_rows(source: Path, key_column: str, keys: Path, output: Path) -> None:
+    """Write the rows of `source` whose key is not in `keys` to `output`."""
+    df = pd.read_parquet(source, dtype_backend="pyarrow")
+    deleted = pd.read_parquet(keys, dtype_backend="pyarrow")["orderkey"]
+    df[~df[key_column].isin(deleted)].to_parquet(output, index=False)
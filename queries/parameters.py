@@ -0,0 +1,228 @@
+"""Disclaimer.
+
+Certain portions of the contents of this file are derived from TPC-H version 3.0.1
+(retrieved from
+http://www.tpc.org/tpc_documents_current_versions/current_specifications5.asp).
+Such portions are subject to copyrights held by Transaction Processing
+Performance Council (“TPC”) and licensed under the TPC EULA is available at
+http://www.tpc.org/tpc_documents_current_versions/current_specifications5.asp)
+(the “TPC EULA”).
+
+You may not use this file except in compliance with the TPC EULA.
+DISCLAIMER: Portions of this file is derived from the TPC-H benchmark and as
+such any result obtained using this file are not comparable to published TPC-H
+Benchmark results, as the results obtained from using this file do not comply with
+the TPC-H Benchmark.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import subprocess
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+settings = Settings()
+
+tpch_dbgen = Path(__file__).parent.parent / "tpch-dbgen"
+
+# Substitution parameters for query validation, as printed by `qgen -d`. These are
+# used if no seed is set. Note that the Q11 fraction is not divided by the scale
+# factor here, in line with the answers in `data/answers`.
+DEFAULT_PARAMETERS: dict[int, list[str]] = {
+    1: ["90"],
+    2: ["15", "BRASS", "EUROPE"],
+    3: ["BUILDING", "1995-03-15"],
+    4: ["1993-07-01"],
+    5: ["ASIA", "1994-01-01"],
+    6: ["1994-01-01", ".06", "24"],
+    7: ["FRANCE", "GERMANY"],
+    8: ["BRAZIL", "AMERICA", "ECONOMY ANODIZED STEEL"],
+    9: ["green"],
+    10: ["1993-10-01"],
+    11: ["GERMANY", "0.0001"],
+    12: ["MAIL", "SHIP", "1994-01-01"],
+    13: ["special", "requests"],
+    14: ["1995-09-01"],
+    15: ["1996-01-01"],
+    16: ["Brand#45", "MEDIUM POLISHED", "49", "14", "23", "45", "19", "3", "36", "9"],
+    17: ["Brand#23", "MED BOX"],
+    18: ["300"],
+    19: ["Brand#12", "Brand#23", "Brand#34", "1", "10", "20"],
+    20: ["forest", "1994-01-01", "CANADA"],
+    21: ["SAUDI ARABIA"],
+    22: ["13", "31", "23", "29", "30", "18", "17"],
+}
+
+
+def _add_months(d: date, months: int) -> date:
+    month = d.month - 1 + months
+    return d.replace(year=d.year + month // 12, month=month % 12 + 1)
+
+
+def _date(s: str) -> date:
+    return date.fromisoformat(s)
+
+
+# Functions turning the substitution parameters of a query into the variables used
+# by the query implementations, named after the variables of the Polars queries
+_VARIABLES: dict[int, Callable[[list[str]], dict[str, Any]]] = {
+    1: lambda p: {"var1": date(1998, 12, 1) - timedelta(days=int(p[0]))},
+    2: lambda p: {"var1": int(p[0]), "var2": p[1], "var3": p[2]},
+    3: lambda p: {"var1": p[0], "var2": _date(p[1])},
+    4: lambda p: {"var1": _date(p[0]), "var2": _add_months(_date(p[0]), 3)},
+    5: lambda p: {
+        "var1": p[0],
+        "var2": _date(p[1]),
+        "var3": _add_months(_date(p[1]), 12),
+    },
+    6: lambda p: {
+        "var1": _date(p[0]),
+        "var2": _add_months(_date(p[0]), 12),
+        "var3": round(float(p[1]) - 0.01, 2),
+        "var4": round(float(p[1]) + 0.01, 2),
+        "var5": int(p[2]),
+    },
+    7: lambda p: {"var1": p[0], "var2": p[1]},
+    8: lambda p: {"var1": p[0], "var2": p[1], "var3": p[2]},
+    9: lambda p: {"var1": p[0]},
+    10: lambda p: {"var1": _date(p[0]), "var2": _add_months(_date(p[0]), 3)},
+    11: lambda p: {"var1": p[0], "var2": float(p[1])},
+    12: lambda p: {
+        "var1": p[0],
+        "var2": p[1],
+        "var3": _date(p[2]),
+        "var4": _add_months(_date(p[2]), 12),
+    },
+    13: lambda p: {"var1": p[0], "var2": p[1]},
+    14: lambda p: {"var1": _date(p[0]), "var2": _add_months(_date(p[0]), 1)},
+    15: lambda p: {"var1": _date(p[0]), "var2": _add_months(_date(p[0]), 3)},
+    16: lambda p: {"var1": p[0], "var2": p[1], "var3": [int(s) for s in p[2:]]},
+    17: lambda p: {"var1": p[0], "var2": p[1]},
+    18: lambda p: {"var1": int(p[0])},
+    19: lambda p: {
+        "var1": p[0],
+        "var2": p[1],
+        "var3": p[2],
+        "var4": int(p[3]),
+        "var5": int(p[4]),
+        "var6": int(p[5]),
+    },
+    20: lambda p: {
+        "var1": _date(p[1]),
+        "var2": _add_months(_date(p[1]), 12),
+        "var3": p[2],
+        "var4": p[0],
+    },
+    21: lambda p: {"var1": p[0]},
+    22: lambda p: {"var1": p},
+}
+
+
+def _run_qgen(seed: int) -> dict[int, list[str]]:
+    """Draw the substitution parameters of all queries with `qgen`."""
+    qgen = tpch_dbgen / "qgen"
+    if not qgen.exists():
+        subprocess.check_output(["make", "qgen"], cwd=tpch_dbgen)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_file = Path(tmpdir) / "parameters.log"
+        subprocess.check_output(
+            shlex.split(
+                f"./qgen -r {seed} -s {settings.scale_factor} -l {log_file}"
+                f" {' '.join(map(str, DEFAULT_PARAMETERS))}"
+            ),
+            cwd=tpch_dbgen,
+            env=os.environ | {"DSS_QUERY": "queries"},
+        )
+        lines = log_file.read_text().splitlines()
+
+    parameters = {}
+    for line in lines:
+        query_number, *values = line.split("\t")
+        parameters[int(query_number)] = values
+    return parameters
+
+
+def _get_parameters_path(seed: int) -> Path:
+    return settings.paths.parameters / f"seed-{seed}-scale-{settings.scale_factor}.json"
+
+
+def get_substitution_parameters(query_number: int) -> list[str]:
+    """Return the substitution parameters of a query for the configured seed.
+
+    The parameters of a seed are drawn once and cached in `settings.paths.parameters`.
+    """
+    seed = settings.run.seed
+    if seed is None:
+        return DEFAULT_PARAMETERS[query_number]
+
+    path = _get_parameters_path(seed)
+    if not path.exists():
+        parameters = _run_qgen(seed)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Queries can run in parallel, so make sure the file is written atomically
+        tmp = _get_tmp_path(path)
+        tmp.write_text(json.dumps(parameters))
+        tmp.replace(path)
+
+    return json.loads(path.read_text())[str(query_number)]  # type: ignore[no-any-return]
+
+
+def _get_tmp_path(path: Path) -> Path:
+    """Return a temporary path to write a file to, unique to the current thread.
+
+    Streams of the throughput test run as threads of a single process.
+    """
+    return path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def get_parameters(query_number: int) -> dict[str, Any]:
+    """Return the variables of a query, for the configured seed."""
+    return _VARIABLES[query_number](get_substitution_parameters(query_number))
+
+
+def get_answer_path(query_number: int) -> Path:
+    """Return the path to the true answer of a query, for the configured seed.
+
+    Answers for a seed are computed once with Polars and cached. They are not an
+    independent reference for Polars itself: checking Polars results against them
+    only catches differences between engines and settings of Polars (e.g. the
+    streaming or GPU engine), not errors in the Polars queries. Other libraries are
+    validated against Polars.
+    """
+    seed = settings.run.seed
+    if seed is None:
+        return settings.paths.answers / f"q{query_number}.parquet"
+
+    path = (
+        settings.paths.answers
+        / f"seed-{seed}"
+        / f"scale-{settings.scale_factor}"
+        / f"q{query_number}.parquet"
+    )
+    if not path.exists():
+        _generate_answer(query_number, path)
+    return path
+
+
+def _generate_answer(query_number: int, path: Path) -> None:
+    from importlib import import_module
+
+    query_module = import_module(f"queries.polars.q{query_number}")
+    result = query_module.q().collect(engine="in-memory")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _get_tmp_path(path)
+    result.write_parquet(tmp)
+    tmp.replace(path)
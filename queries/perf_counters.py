@@ -0,0 +1,148 @@
+"""Count hardware events in the timed part of a query with `perf stat`.
+
+`perf stat` is attached to the query process before the timer starts, with its
+counters disabled. They are enabled for the timed region only, through the
+control FIFO of `perf stat`. This requires `perf` 5.11 or newer and a
+`kernel.perf_event_paranoid` setting that allows counting the own process.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from settings import Settings
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+settings = Settings()
+
+# perf event names, with the name of their column in the timings
+PERF_EVENTS = {
+    "cycles": "cycles",
+    "instructions": "instructions",
+    "cache-misses": "cache_misses",
+    "branch-misses": "branch_misses",
+    "LLC-loads": "llc_loads",
+}
+
+_TIMEOUT = 10.0  # Seconds to wait for `perf` to respond
+
+
+def _parse_perf_output(output: str) -> dict[str, int | None]:
+    """Parse the CSV output of `perf stat -x,` into the count of every event.
+
+    Events that could not be counted are None. The counts of hybrid CPUs, which
+    report an event per core type (e.g. `cpu_core/cycles/`), are summed.
+    """
+    counts: dict[str, int | None] = dict.fromkeys(PERF_EVENTS)
+    for line in output.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        value, _, event, *_ = line.split(",")
+        # Strip the PMU and modifiers, e.g. `cpu_core/cycles/u` or `cycles:u`
+        if "/" in event:
+            event = event.split("/")[1]
+        event = event.split(":")[0]
+        if event not in counts or not value.isdigit():
+            continue
+        counts[event] = (counts[event] or 0) + int(value)
+    return counts
+
+
+class PerfCounters:
+    """Count the hardware events of the process while in the context.
+
+    Does nothing unless `settings.run.perf_counters` is set.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int | None] = dict.fromkeys(PERF_EVENTS)
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def _command(self, command: str) -> None:
+        """Send a command to the control FIFO and wait for its acknowledgement."""
+        os.write(self._ctl_fd, f"{command}\n".encode())
+        ready, _, _ = select.select([self._ack_fd], [], [], _TIMEOUT)
+        if not ready or not os.read(self._ack_fd, 16).startswith(b"ack"):
+            msg = f"`perf stat` did not acknowledge {command!r}"
+            raise RuntimeError(msg)
+
+    def _open_control_fifo(self, path: Path) -> int:
+        # Opening a FIFO for writing fails until `perf` has opened it for reading
+        deadline = time.monotonic() + _TIMEOUT
+        while True:
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                assert self._process is not None
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self._process.kill()
+                    msg = "`perf stat` failed to start, see its error output"
+                    raise RuntimeError(msg) from None
+                time.sleep(0.01)
+            else:
+                os.set_blocking(fd, True)
+                return fd
+
+    def __enter__(self) -> Self:
+        if not settings.run.perf_counters:
+            return self
+        if shutil.which("perf") is None:
+            msg = "`perf` is required to count hardware events"
+            raise RuntimeError(msg)
+
+        self._dir = Path(tempfile.mkdtemp(prefix="perf-"))
+        ctl, ack = self._dir / "ctl", self._dir / "ack"
+        os.mkfifo(ctl)
+        os.mkfifo(ack)
+        self._output = self._dir / "stat.csv"
+        # Opened for reading and writing, so that opening never blocks
+        self._ack_fd = os.open(ack, os.O_RDWR)
+
+        self._process = subprocess.Popen(
+            [
+                "perf",
+                "stat",
+                "--field-separator=,",
+                f"--event={','.join(PERF_EVENTS)}",
+                f"--pid={os.getpid()}",
+                "--delay=-1",  # Start with the counters disabled
+                f"--control=fifo:{ctl},{ack}",
+                f"--output={self._output}",
+            ],
+            stdin=subprocess.DEVNULL,
+        )
+        self._ctl_fd = self._open_control_fifo(ctl)
+        self._command("enable")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._process is None:
+            return
+        try:
+            self._command("disable")
+            # `perf stat` writes the counts when it is interrupted
+            self._process.send_signal(signal.SIGINT)
+            self._process.wait(_TIMEOUT)
+            self.counts = _parse_perf_output(self._output.read_text())
+        finally:
+            if self._process.poll() is None:
+                self._process.kill()
+            os.close(self._ctl_fd)
+            os.close(self._ack_fd)
+            shutil.rmtree(self._dir)
@@ -0,0 +1,80 @@
+"""Store the query plans of every query, engine and version.
+
+Plans are stored next to the timings, in
+`<timings>/plans/<solution>/<version>/q<query_number>.<suffix>`, so that
+`scripts.plan_diff` can compare the plans of two versions or runs.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+settings = Settings()
+
+PLANS_DIRNAME = "plans"
+
+# Measurements in the plans of DuckDB's `EXPLAIN ANALYZE`, which change every run
+_PROFILING_KEYS = {
+    "blocked_thread_time",
+    "cpu_time",
+    "cumulative_cardinality",
+    "cumulative_rows_scanned",
+    "latency",
+    "operator_cardinality",
+    "operator_rows_scanned",
+    "operator_timing",
+    "result_set_size",
+    "rows_returned",
+}
+
+
+def get_plan_path(
+    solution: str, version: str, query_number: int, suffix: str = "txt"
+) -> Path:
+    return (
+        settings.paths.timings
+        / PLANS_DIRNAME
+        / solution
+        / version
+        / f"q{query_number}.{suffix}"
+    )
+
+
+def save_plan(
+    solution: str, version: str, query_number: int, plan: str, suffix: str = "txt"
+) -> None:
+    """Store the plan of a query, replacing the plan of an earlier run."""
+    path = get_plan_path(solution, version, query_number, suffix)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(plan)
+
+
+def _strip_profiling(node: Any) -> Any:
+    if isinstance(node, dict):
+        return {
+            key: _strip_profiling(value)
+            for key, value in node.items()
+            if key not in _PROFILING_KEYS
+        }
+    if isinstance(node, list):
+        return [_strip_profiling(value) for value in node]
+    return node
+
+
+def normalize_plan(plan: str, suffix: str) -> str:
+    """Remove the parts of a plan that change between runs of the same plan.
+
+    These are the measurements in profiled JSON plans and the expression and plan
+    ids that Spark assigns, e.g. `l_orderkey#16L` or `plan_id=12`.
+    """
+    if suffix == "json":
+        return json.dumps(_strip_profiling(json.loads(plan)), indent=2)
+    plan = re.sub(r"#\d+L?\b", "", plan)
+    return re.sub(r"\b(plan_id|id)=\d+", r"\1=", plan)
@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 1
@@ -12,7 +12,8 @@ def q(lineitem: None | pl.LazyFrame = None, **kwargs: Any) -> pl.LazyFrame:
     if lineitem is None:
         lineitem = utils.get_line_item_ds()
 
-    var1 = date(1998, 9, 2)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
 
     return (
         lineitem.filter(pl.col("l_shipdate") <= var1)
@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 10
@@ -26,8 +26,9 @@ def q(
     assert nation is not None
     assert orders is not None
 
-    var1 = date(1993, 10, 1)
-    var2 = date(1994, 1, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     return (
         customer.join(orders, left_on="c_custkey", right_on="o_custkey")
@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 11
@@ -22,8 +23,9 @@ def q(
     assert partsupp is not None
     assert supplier is not None
 
-    var1 = "GERMANY"
-    var2 = 0.0001
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     q1 = (
         partsupp.join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 12
@@ -20,10 +20,11 @@ def q(
     assert lineitem is not None
     assert orders is not None
 
-    var1 = "MAIL"
-    var2 = "SHIP"
-    var3 = date(1994, 1, 1)
-    var4 = date(1995, 1, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+    var4 = params["var4"]
 
     return (
         orders.join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
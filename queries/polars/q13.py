@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 13
@@ -19,8 +20,9 @@ def q(
     assert customer is not None
     assert orders is not None
 
-    var1 = "special"
-    var2 = "requests"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     orders = orders.filter(pl.col("o_comment").str.contains(f"{var1}.*{var2}").not_())
     return (
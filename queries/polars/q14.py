@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 14
@@ -20,8 +20,9 @@ def q(
     assert lineitem is not None
     assert part is not None
 
-    var1 = date(1995, 9, 1)
-    var2 = date(1995, 10, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     return (
         lineitem.join(part, left_on="l_partkey", right_on="p_partkey")
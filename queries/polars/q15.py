@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 15
@@ -20,8 +20,9 @@ def q(
     assert lineitem is not None
     assert supplier is not None
 
-    var1 = date(1996, 1, 1)
-    var2 = date(1996, 4, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     revenue = (
         lineitem.filter(pl.col("l_shipdate").is_between(var1, var2, closed="left"))
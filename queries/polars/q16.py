@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 16
@@ -22,7 +23,10 @@ def q(
     assert partsupp is not None
     assert supplier is not None
 
-    var1 = "Brand#45"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
 
     supplier = supplier.filter(
         pl.col("s_comment").str.contains(".*Customer.*Complaints.*")
@@ -31,8 +35,8 @@ def q(
     return (
         part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
         .filter(pl.col("p_brand") != var1)
-        .filter(pl.col("p_type").str.contains("MEDIUM POLISHED*").not_())
-        .filter(pl.col("p_size").is_in([49, 14, 23, 45, 19, 3, 36, 9]))
+        .filter(pl.col("p_type").str.starts_with(var2).not_())
+        .filter(pl.col("p_size").is_in(var3))
         .join(supplier, left_on="ps_suppkey", right_on="s_suppkey", how="left")
         .filter(pl.col("ps_suppkey_right").is_null())
         .group_by("p_brand", "p_type", "p_size")
@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 17
@@ -19,8 +20,9 @@ def q(
     assert lineitem is not None
     assert part is not None
 
-    var1 = "Brand#23"
-    var2 = "MED BOX"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     q1 = (
         part.filter(pl.col("p_brand") == var1)
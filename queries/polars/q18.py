@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 18
@@ -22,7 +23,8 @@ def q(
     assert lineitem is not None
     assert orders is not None
 
-    var1 = 300
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
 
     q1 = (
         lineitem.group_by("l_orderkey")
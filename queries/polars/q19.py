@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 19
@@ -19,33 +20,41 @@ def q(
     assert lineitem is not None
     assert part is not None
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+    var5 = params["var5"]
+    var6 = params["var6"]
+
     return (
         part.join(lineitem, left_on="p_partkey", right_on="l_partkey")
         .filter(pl.col("l_shipmode").is_in(["AIR", "AIR REG"]))
         .filter(pl.col("l_shipinstruct") == "DELIVER IN PERSON")
         .filter(
             (
-                (pl.col("p_brand") == "Brand#12")
+                (pl.col("p_brand") == var1)
                 & pl.col("p_container").is_in(
                     ["SM CASE", "SM BOX", "SM PACK", "SM PKG"]
                 )
-                & (pl.col("l_quantity").is_between(1, 11))
+                & (pl.col("l_quantity").is_between(var4, var4 + 10))
                 & (pl.col("p_size").is_between(1, 5))
             )
             | (
-                (pl.col("p_brand") == "Brand#23")
+                (pl.col("p_brand") == var2)
                 & pl.col("p_container").is_in(
                     ["MED BAG", "MED BOX", "MED PKG", "MED PACK"]
                 )
-                & (pl.col("l_quantity").is_between(10, 20))
+                & (pl.col("l_quantity").is_between(var5, var5 + 10))
                 & (pl.col("p_size").is_between(1, 10))
             )
             | (
-                (pl.col("p_brand") == "Brand#34")
+                (pl.col("p_brand") == var3)
                 & pl.col("p_container").is_in(
                     ["LG CASE", "LG BOX", "LG PACK", "LG PKG"]
                 )
-                & (pl.col("l_quantity").is_between(20, 30))
+                & (pl.col("l_quantity").is_between(var6, var6 + 10))
                 & (pl.col("p_size").is_between(1, 15))
             )
         )
@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 2
@@ -28,9 +29,10 @@ def q(
     assert region is not None
     assert supplier is not None
 
-    var1 = 15
-    var2 = "BRASS"
-    var3 = "EUROPE"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
 
     q1 = (
         part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
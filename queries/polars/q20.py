@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 20
@@ -29,10 +29,11 @@ def q(
     assert partsupp is not None
     assert supplier is not None
 
-    var1 = date(1994, 1, 1)
-    var2 = date(1995, 1, 1)
-    var3 = "CANADA"
-    var4 = "forest"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+    var4 = params["var4"]
 
     q1 = (
         lineitem.filter(pl.col("l_shipdate").is_between(var1, var2, closed="left"))
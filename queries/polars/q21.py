@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 21
@@ -25,7 +26,8 @@ def q(
     assert orders is not None
     assert supplier is not None
 
-    var1 = "SAUDI ARABIA"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
 
     q1 = (
         lineitem.group_by("l_orderkey")
@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 22
@@ -19,9 +20,12 @@ def q(
     assert customer is not None
     assert orders is not None
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     q1 = (
         customer.with_columns(pl.col("c_phone").str.slice(0, 2).alias("cntrycode"))
-        .filter(pl.col("cntrycode").str.contains("13|31|23|29|30|18|17"))
+        .filter(pl.col("cntrycode").is_in(var1))
         .select("c_acctbal", "c_custkey", "cntrycode")
     )
 
@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 3
@@ -23,8 +23,9 @@ def q(
     assert lineitem is not None
     assert orders is not None
 
-    var1 = "BUILDING"
-    var2 = date(1995, 3, 15)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     return (
         customer.filter(pl.col("c_mktsegment") == var1)
@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 4
@@ -20,8 +20,9 @@ def q(
     assert lineitem is not None
     assert orders is not None
 
-    var1 = date(1993, 7, 1)
-    var2 = date(1993, 10, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
 
     return (
         # SQL exists translates to semi join in Polars API
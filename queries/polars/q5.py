@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 5
@@ -34,9 +34,10 @@ def q(
     assert nation is not None
     assert orders is not None
 
-    var1 = "ASIA"
-    var2 = date(1994, 1, 1)
-    var3 = date(1995, 1, 1)
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
 
     return (
         region.join(nation, left_on="r_regionkey", right_on="n_regionkey")
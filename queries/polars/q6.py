@@ -1,8 +1,8 @@
-from datetime import date
 from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 6
@@ -15,11 +15,12 @@ def q(
     if lineitem is None:
         lineitem = utils.get_line_item_ds()
 
-    var1 = date(1994, 1, 1)
-    var2 = date(1995, 1, 1)
-    var3 = 0.05
-    var4 = 0.07
-    var5 = 24
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+    var5 = params["var5"]
 
     return (
         lineitem.filter(pl.col("l_shipdate").is_between(var1, var2, closed="left"))
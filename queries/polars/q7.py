@@ -3,6 +3,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 7
@@ -28,8 +29,9 @@ def q(
     assert orders is not None
     assert supplier is not None
 
-    var1 = "FRANCE"
-    var2 = "GERMANY"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
     var3 = date(1995, 1, 1)
     var4 = date(1996, 12, 31)
 
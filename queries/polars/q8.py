@@ -3,6 +3,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 8
@@ -33,9 +34,10 @@ def q(
     assert supplier is not None
     assert region is not None
 
-    var1 = "BRAZIL"
-    var2 = "AMERICA"
-    var3 = "ECONOMY ANODIZED STEEL"
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
     var4 = date(1995, 1, 1)
     var5 = date(1996, 12, 31)
 
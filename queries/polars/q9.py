@@ -2,6 +2,7 @@ from typing import Any
 
 import polars as pl
 
+from queries.parameters import get_parameters
 from queries.polars import utils
 
 Q_NUM = 9
@@ -32,6 +33,9 @@ def q(
     assert partsupp is not None
     assert supplier is not None
 
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
     return (
         part.join(partsupp, left_on="p_partkey", right_on="ps_partkey")
         .join(supplier, left_on="ps_suppkey", right_on="s_suppkey")
@@ -42,7 +46,7 @@ def q(
         )
         .join(orders, left_on="l_orderkey", right_on="o_orderkey")
         .join(nation, left_on="s_nationkey", right_on="n_nationkey")
-        .filter(pl.col("p_name").str.contains("green"))
+        .filter(pl.col("p_name").str.contains(var1))
         .select(
             pl.col("n_name").alias("nation"),
             pl.col("o_orderdate").dt.year().alias("o_year"),
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_table(sources: list[Path], output: Path) -> None:
+    """Write the concatenation of the source tables to `output`."""
+    pl.concat([pl.scan_parquet(path) for path in sources]).sink_parquet(output)
+
+
+def delete_rows(source: Path, key_column: str, keys: Path, output: Path) -> None:
+    """Write the rows of `source` whose key is not in `keys` to `output`."""
+    (
+        pl.scan_parquet(source)
+        .join(
+            pl.scan_parquet(keys), left_on=key_column, right_on="orderkey", how="anti"
+        )
+        .sink_parquet(output)
+    )
@@ -1,31 +1,58 @@
+import csv
+import math
+import os
 import pathlib
 import tempfile
-from functools import partial
+from functools import cache, partial
+from importlib import import_module
+from statistics import median
+from time import perf_counter
 from typing import Literal
 
 import polars as pl
+from linetimer import CodeTimer
 
 from queries.common_utils import (
     check_query_result_pl,
+    ensure_answers_available,
     get_table_path,
+    log_query_timing,
+    query_phase,
     run_query_generic,
+    set_query_engine,
 )
-from settings import Settings
+from queries.memory_budget import get_spill_dir
+from queries.plans import save_plan
+from queries.schema import get_polars_schema
+from queries.table_store import get_store_path
+from settings import PolarsEngine, Settings
 
 settings = Settings()
 
+# Profiles are stored in `<timings>/profiles/<solution>/<version>/q<n>.parquet`
+PROFILES_DIRNAME = "profiles"
+
+if settings.run.memory_limit is not None:
+    # The streaming engines spill to this directory
+    os.environ["POLARS_TEMP_DIR"] = str(get_spill_dir())
+
 
 def _scan_ds(table_name: str) -> pl.LazyFrame:
     path = get_table_path(table_name)
 
     if settings.run.io_type == "skip":
-        return pl.read_parquet(path, rechunk=True).lazy()
+        # Memory-mapping the table in the shared-memory store costs next to nothing
+        return pl.read_ipc(get_store_path(table_name), memory_map=True).lazy()
     if settings.run.io_type == "parquet":
+        if settings.run.partitioning == "hive":
+            # Prefiltered decoding panics in Polars 1.28 when a predicate combines
+            # the hive key with columns of the files
+            return pl.scan_parquet(path, hive_partitioning=True, parallel="row_groups")
         return pl.scan_parquet(path)
     elif settings.run.io_type == "feather":
-        return pl.scan_ipc(path)
+        return pl.scan_ipc(path, memory_map=True)
     elif settings.run.io_type == "csv":
-        return pl.scan_csv(path, try_parse_dates=True)
+        return pl.scan_csv(path, schema=get_polars_schema(table_name))
     else:
         msg = f"unsupported file type: {settings.run.io_type!r}"
         raise ValueError(msg)
@@ -75,6 +102,17 @@ def _preload_engine(
         pl.scan_parquet(f).collect(engine=engine)  # type: ignore[arg-type]
 
 
+@cache
+def _warm_up_engine() -> (
+    pl.GPUEngine | Literal["in-memory", "streaming", "old-streaming"]
+):
+    # Cached, so that queries sharing a process only warm up the engine once.
+    engine = obtain_engine_config()
+    _preload_engine(engine)
+    return engine
+
+
+@cache
 def obtain_engine_config() -> (
     pl.GPUEngine | Literal["in-memory", "streaming", "old-streaming"]
 ):
@@ -84,7 +122,11 @@ def obtain_engine_config() -> (
         return "streaming"
     if not settings.run.polars_gpu:
         return "in-memory"
+    return _get_gpu_engine()
+
 
+@cache
+def _get_gpu_engine() -> pl.GPUEngine:
     import cudf_polars
     import rmm
     from cudf_polars.callback import set_device
@@ -164,15 +206,113 @@ def obtain_engine_config() -> (
         return pl.GPUEngine(device=device, memory_resource=mr, raise_on_fail=True)
 
 
-def run_query(query_number: int, lf: pl.LazyFrame) -> None:
+def _get_engine(
+    name: PolarsEngine,
+) -> pl.GPUEngine | Literal["in-memory", "streaming", "old-streaming"]:
+    return _get_gpu_engine() if name == "gpu" else name
+
+
+# Engines of the timings of earlier runs, by solution name
+_SOLUTION_ENGINES: dict[str, PolarsEngine] = {
+    "polars": "in-memory",
+    "polars-new-streaming": "streaming",
+    "polars-streaming": "old-streaming",
+}
+
+
+@cache
+def _get_engine_history() -> dict[int, dict[PolarsEngine, float]]:
+    """Return the median duration of every query on every engine in the timings.
+
+    Only timings of the current scale factor and IO type are used.
+    """
+    path = settings.paths.timings / settings.paths.timings_filename
+    if not path.exists():
+        return {}
+
+    durations: dict[int, dict[PolarsEngine, list[float]]] = {}
+    with path.open(newline="") as f:
+        for row in csv.DictReader(f):
+            solution = row["solution"]
+            if solution == "polars-auto":
+                engine = row.get("engine")
+            elif solution.startswith("polars-gpu"):
+                engine = "gpu"
+            else:
+                engine = _SOLUTION_ENGINES.get(solution)
+            if (
+                not engine
+                or row["io_type"] != settings.run.io_type
+                or float(row["scale_factor"]) != settings.scale_factor
+            ):
+                continue
+            query_durations = durations.setdefault(int(row["query_number"]), {})
+            query_durations.setdefault(engine, []).append(float(row["duration[s]"]))  # type: ignore[arg-type]
+
+    return {
+        query_number: {engine: median(d) for engine, d in engines.items()}
+        for query_number, engines in durations.items()
+    }
+
+
+def _calibrate(lf: pl.LazyFrame, name: PolarsEngine) -> float:
+    """Return the duration of collecting `lf` once on an engine, inf if it fails."""
+    try:
+        engine = _get_engine(name)
+        _preload_engine(engine)
+        start = perf_counter()
+        lf.collect(engine=engine)  # type: ignore[arg-type]
+    except KeyboardInterrupt:
+        raise
+    # Rust panics surface as `BaseException`
+    except BaseException:
+        return math.inf
+    return perf_counter() - start
+
+
+def _rank_engines(query_number: int, lf: pl.LazyFrame) -> list[PolarsEngine]:
+    """Return the candidate engines for a query, fastest first.
+
+    Candidates without earlier timings for the query are calibrated first.
+    """
+    durations = dict(_get_engine_history().get(query_number, {}))
+    for name in settings.run.polars_auto_engines:
+        if name not in durations:
+            durations[name] = _calibrate(lf, name)
+    return sorted(settings.run.polars_auto_engines, key=durations.__getitem__)
+
+
+def _collect_with_fallback(
+    lf: pl.LazyFrame, engines: list[PolarsEngine]
+) -> pl.DataFrame:
+    """Collect `lf` on the first engine of `engines` that does not fail."""
+    for i, name in enumerate(engines):
+        try:
+            result = lf.collect(engine=_get_engine(name))  # type: ignore[arg-type]
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            if i == len(engines) - 1:
+                raise
+            print(f"Engine {name!r} failed, falling back to {engines[i + 1]!r}\n{e}")
+        else:
+            set_query_engine(name)
+            return result
+    msg = "no engines to run the query on"
+    raise ValueError(msg)
+
+
+def _get_library_name() -> str:
+    """Return the name of the configured Polars engine, used in the timings."""
     streaming = settings.run.polars_streaming
     new_streaming = settings.run.polars_new_streaming
     eager = settings.run.polars_eager
     gpu = settings.run.polars_gpu
     cloud = settings.run.polars_cloud
+    auto = settings.run.polars_auto_engine
 
-    if sum([eager, streaming, new_streaming, gpu, cloud]) > 1:
-        msg = "Please specify at most one of eager, streaming, new_streaming, cloud or gpu"
+    if sum([eager, streaming, new_streaming, gpu, cloud, auto]) > 1:
+        msg = "Please specify at most one of eager, streaming, new_streaming, cloud, gpu or auto_engine"
         raise ValueError(msg)
 
     if eager:
@@ -189,9 +329,38 @@ def run_query(query_number: int, lf: pl.LazyFrame) -> None:
         library_name = "polars-new-streaming"
     elif cloud:
         library_name = "polars-cloud"
+    elif auto:
+        library_name = "polars-auto"
     else:
         library_name = "polars"
 
+    # Profiled runs are slower, so they are logged apart from the plain runs
+    if settings.run.polars_profile:
+        if cloud or auto or streaming:
+            msg = "Profiling is not available with cloud, streaming or auto_engine"
+            raise ValueError(msg)
+        library_name = f"{library_name}-profile"
+    return library_name
+
+
+def get_profile_path(solution: str, version: str, query_number: int) -> pathlib.Path:
+    return (
+        settings.paths.timings
+        / PROFILES_DIRNAME
+        / solution
+        / version
+        / f"q{query_number}.parquet"
+    )
+
+
+def run_query(query_number: int, lf: pl.LazyFrame) -> None:
+    streaming = settings.run.polars_streaming
+    new_streaming = settings.run.polars_new_streaming
+    eager = settings.run.polars_eager
+    cloud = settings.run.polars_cloud
+    library_name = _get_library_name()
+    profiles: list[pl.DataFrame] = []
+
     if settings.run.polars_show_plan:
         print(
             lf.explain(  # type: ignore[call-arg]
@@ -199,12 +368,13 @@ def run_query(query_number: int, lf: pl.LazyFrame) -> None:
             )
         )
 
-    engine = obtain_engine_config()
+    # Eager load engine backend, so we don't time that.
+    engine = _warm_up_engine()
     if settings.run.polars_show_plan:
         print(lf.explain(engine=engine, optimized=not eager))  # type: ignore[arg-type]
-
-    # Eager load engine backend, so we don't time that.
-    _preload_engine(engine)
+    if settings.run.capture_plans and not cloud:
+        plan = lf.explain(engine=engine, optimized=not eager)  # type: ignore[arg-type]
+        save_plan(library_name, pl.__version__, query_number, plan)
 
     if cloud:
         import os
@@ -218,37 +388,114 @@ def run_query(query_number: int, lf: pl.LazyFrame) -> None:
                 self._interactive = True
                 self._compute_address = "localhost:5051"
                 self._compute_public_key = b""
-                self._compute_id = "1"  # type: ignore[assignment]
+                self._compute_id = "1"
 
             def get_status(self: pc.ComputeContext) -> pc.ComputeContextStatus:
                 """Get the status of the compute cluster."""
                 return pc.ComputeContextStatus.RUNNING
 
-        pc.ComputeContext.__init__ = PatchedComputeContext.__init__  # type: ignore[assignment]
-        pc.ComputeContext.get_status = PatchedComputeContext.get_status  # type: ignore[method-assign]
+        pc.ComputeContext.__init__ = PatchedComputeContext.__init__
+        pc.ComputeContext.get_status = PatchedComputeContext.get_status
 
-        def query():  # type: ignore[no-untyped-def]
+        def query() -> pl.DataFrame:
             result = pc.spawn(
                 lf, dst="file:///tmp/dst/", distributed=True
             ).await_result()
 
             if settings.run.show_results:
                 print(result.plan())
-            return result.lazy().collect()
+            with query_phase("materialize"):
+                df: pl.DataFrame = result.lazy().collect()
+                return df
+    elif settings.run.polars_auto_engine:
+        query = partial(_collect_with_fallback, lf, _rank_engines(query_number, lf))
+    elif settings.run.polars_profile:
+
+        def query() -> pl.DataFrame:
+            # `_get_library_name` rejects profiling with the old streaming engine
+            result, profile = lf.profile(no_optimization=eager, engine=engine)  # type: ignore[arg-type]
+            profiles.append(profile)
+            return result
     else:
-        query = partial(
-            lf.collect,
-            no_optimization=eager,
-            engine=engine,
-        )
 
-    try:
-        run_query_generic(
-            query,
-            query_number,
-            library_name,
-            library_version=pl.__version__,
-            query_checker=check_query_result_pl,
-        )
-    except Exception as e:
-        print(f"q{query_number} FAILED\n{e}")
+        def query() -> pl.DataFrame:
+            return lf.collect(no_optimization=eager, engine=engine)  # type: ignore[arg-type]
+
+    # Failures propagate, so that in-process runs and streams count them
+    run_query_generic(
+        query,
+        query_number,
+        library_name,
+        library_version=pl.__version__,
+        query_checker=check_query_result_pl,
+    )
+    if profiles:
+        # The profile of the last iteration, which is warm with more iterations
+        path = get_profile_path(library_name, pl.__version__, query_number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiles[-1].write_parquet(path)
+
+
+# Tables by the name of their argument in the `q` functions of the queries
+TABLE_NAMES = [
+    "customer",
+    "lineitem",
+    "nation",
+    "orders",
+    "part",
+    "partsupp",
+    "region",
+    "supplier",
+]
+
+
+def run_multiplexed(query_numbers: list[int]) -> None:
+    """Collect all queries at once with `pl.collect_all`.
+
+    All query plans get the same table scans, which `collect_all` runs only once as
+    common subplans. To split the batch time into the share of every query, every
+    query is also collected on its own, outside of the timed batch. The share is in
+    proportion to that standalone time.
+    """
+    if settings.run.polars_eager or settings.run.polars_cloud:
+        msg = "the multiplex execution mode does not support eager or cloud Polars"
+        raise ValueError(msg)
+    if settings.run.check_results:
+        ensure_answers_available()
+
+    library_name = f"{_get_library_name()}-multiplex"
+    engine = _warm_up_engine()
+
+    tables = {table_name: _scan_ds(table_name) for table_name in TABLE_NAMES}
+    lfs = [import_module(f"queries.polars.q{i}").q(**tables) for i in query_numbers]
+
+    for _ in range(settings.run.iterations):
+        with CodeTimer(name=f"Run {library_name} batch", unit="s") as timer:
+            results = pl.collect_all(lfs, engine=engine)  # type: ignore[arg-type]
+
+        standalone_times = []
+        for lf in lfs:
+            start = perf_counter()
+            lf.collect(engine=engine)
+            standalone_times.append(perf_counter() - start)
+        total = sum(standalone_times)
+        print(f"Sum of standalone query times: {total:.5f} s")
+
+        for query_number, result, standalone_time in zip(
+            query_numbers, results, standalone_times, strict=True
+        ):
+            if settings.run.log_timings:
+                log_query_timing(
+                    solution=library_name,
+                    version=pl.__version__,
+                    query_number=query_number,
+                    time=timer.took * standalone_time / total,
+                    batch_time=timer.took,
+                )
+            if settings.run.check_results:
+                try:
+                    check_query_result_pl(result, query_number)
+                except AssertionError as e:
+                    print(f"q{query_number} FAILED\n{e}")
+            if settings.run.show_results:
+                print(result)
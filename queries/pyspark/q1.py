@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 1
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         l_returnflag,
         l_linestatus,
@@ -19,7 +23,7 @@ def q() -> None:
     from
         lineitem
     where
-        date(l_shipdate) <= date('1998-09-02')
+        date(l_shipdate) <= date('{var1}')
     group by
         l_returnflag,
         l_linestatus
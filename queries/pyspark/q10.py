@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 10
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         c_custkey,
         c_name,
@@ -22,8 +26,8 @@ def q() -> None:
     where
         c_custkey = o_custkey
         and l_orderkey = o_orderkey
-        and o_orderdate >= date '1993-10-01'
-        and o_orderdate < date '1993-10-01' + interval '3' month
+        and o_orderdate >= date '{var1}'
+        and o_orderdate < date '{var1}' + interval '3' month
         and l_returnflag = 'R'
         and c_nationkey = n_nationkey
     group by
@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 11
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         ps_partkey,
         round(sum(ps_supplycost * ps_availqty), 2) as value
@@ -15,12 +20,12 @@ def q() -> None:
     where
         ps_suppkey = s_suppkey
         and s_nationkey = n_nationkey
-        and n_name = 'GERMANY'
+        and n_name = '{var1}'
     group by
         ps_partkey having
                 sum(ps_supplycost * ps_availqty) > (
             select
-                sum(ps_supplycost * ps_availqty) * 0.0001
+                sum(ps_supplycost * ps_availqty) * {var2}
             from
                 partsupp,
                 supplier,
@@ -28,7 +33,7 @@ def q() -> None:
             where
                 ps_suppkey = s_suppkey
                 and s_nationkey = n_nationkey
-                and n_name = 'GERMANY'
+                and n_name = '{var1}'
             )
         order by
             value desc
@@ -1,10 +1,16 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 12
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
+    query_str = f"""
     select
         l_shipmode,
         sum(case
@@ -24,11 +30,11 @@ def q() -> None:
         lineitem
     where
         o_orderkey = l_orderkey
-        and l_shipmode in ('MAIL', 'SHIP')
+        and l_shipmode in ('{var1}', '{var2}')
         and l_commitdate < l_receiptdate
         and l_shipdate < l_commitdate
-        and l_receiptdate >= date '1994-01-01'
-        and l_receiptdate < date '1994-01-01' + interval '1' year
+        and l_receiptdate >= date '{var3}'
+        and l_receiptdate < date '{var3}' + interval '1' year
     group by
         l_shipmode
     order by
@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 13
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         c_count, count(*) as custdist
     from (
@@ -14,7 +19,7 @@ def q() -> None:
         from
             customer left outer join orders on
             c_custkey = o_custkey
-            and o_comment not like '%special%requests%'
+            and o_comment not like '%{var1}%{var2}%'
         group by
             c_custkey
         )as c_orders (c_custkey, c_count)
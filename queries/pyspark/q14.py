@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 14
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         round(100.00 * sum(case
             when p_type like 'PROMO%'
@@ -16,8 +20,8 @@ def q() -> None:
         part
     where
         l_partkey = p_partkey
-        and l_shipdate >= date '1995-09-01'
-        and l_shipdate < date '1995-09-01' + interval '1' month
+        and l_shipdate >= date '{var1}'
+        and l_shipdate < date '{var1}' + interval '1' month
 	"""
 
     utils.get_line_item_ds()
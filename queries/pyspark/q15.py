@@ -1,3 +1,4 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 15
@@ -6,7 +7,10 @@ Q_NUM = 15
 def q() -> None:
     spark = utils.get_or_create_spark()
 
-    ddl = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    ddl = f"""
     create temp view revenue (supplier_no, total_revenue) as
         select
             l_suppkey,
@@ -14,8 +18,8 @@ def q() -> None:
         from
             lineitem
         where
-            l_shipdate >= date '1996-01-01'
-            and l_shipdate < date '1996-01-01' + interval '3' month
+            l_shipdate >= date '{var1}'
+            and l_shipdate < date '{var1}' + interval '3' month
         group by
             l_suppkey
     """
@@ -1,10 +1,16 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 16
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = ", ".join(map(str, params["var3"]))
+
+    query_str = f"""
     select
         p_brand,
         p_type,
@@ -15,9 +21,9 @@ def q() -> None:
         part
     where
         p_partkey = ps_partkey
-        and p_brand <> 'Brand#45'
-        and p_type not like 'MEDIUM POLISHED%'
-        and p_size in (49, 14, 23, 45, 19, 3, 36, 9)
+        and p_brand <> '{var1}'
+        and p_type not like '{var2}%'
+        and p_size in ({var3})
         and ps_suppkey not in (
             select
                 s_suppkey
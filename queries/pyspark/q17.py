@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 17
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         round(sum(l_extendedprice) / 7.0, 2) as avg_yearly
     from
@@ -12,8 +17,8 @@ def q() -> None:
         part
     where
         p_partkey = l_partkey
-        and p_brand = 'Brand#23'
-        and p_container = 'MED BOX'
+        and p_brand = '{var1}'
+        and p_container = '{var2}'
         and l_quantity < (
             select
                 0.2 * avg(l_quantity)
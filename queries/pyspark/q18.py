@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 18
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         c_name,
         c_custkey,
@@ -24,7 +28,7 @@ def q() -> None:
                 lineitem
             group by
                 l_orderkey having
-                    sum(l_quantity) > 300
+                    sum(l_quantity) > {var1}
         )
         and c_custkey = o_custkey
         and o_orderkey = l_orderkey
@@ -1,10 +1,16 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 2
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
+    query_str = f"""
     select
         s_acctbal,
         s_name,
@@ -23,11 +29,11 @@ def q() -> None:
     where
         p_partkey = ps_partkey
         and s_suppkey = ps_suppkey
-        and p_size = 15
-        and p_type like '%BRASS'
+        and p_size = {var1}
+        and p_type like '%{var2}'
         and s_nationkey = n_nationkey
         and n_regionkey = r_regionkey
-        and r_name = 'EUROPE'
+        and r_name = '{var3}'
         and ps_supplycost = (
             select
                 min(ps_supplycost)
@@ -41,7 +47,7 @@ def q() -> None:
                 and s_suppkey = ps_suppkey
                 and s_nationkey = n_nationkey
                 and n_regionkey = r_regionkey
-                and r_name = 'EUROPE'
+                and r_name = '{var3}'
         )
     order by
         s_acctbal desc,
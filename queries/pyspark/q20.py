@@ -1,10 +1,16 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 20
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+
+    query_str = f"""
     select
         s_name,
         s_address
@@ -24,7 +30,7 @@ def q() -> None:
                     from
                         part
                     where
-                        p_name like 'forest%'
+                        p_name like '{var4}%'
                 )
                 and ps_availqty > (
                     select
@@ -34,12 +40,12 @@ def q() -> None:
                     where
                         l_partkey = ps_partkey
                         and l_suppkey = ps_suppkey
-                        and l_shipdate >= date '1994-01-01'
-                        and l_shipdate < date '1994-01-01' + interval '1' year
+                        and l_shipdate >= date '{var1}'
+                        and l_shipdate < date '{var1}' + interval '1' year
                 )
         )
         and s_nationkey = n_nationkey
-        and n_name = 'CANADA'
+        and n_name = '{var3}'
     order by
         s_name
 	"""
@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 21
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         s_name,
         count(*) as numwait
@@ -38,7 +42,7 @@ def q() -> None:
                 and l3.l_receiptdate > l3.l_commitdate
         )
         and s_nationkey = n_nationkey
-        and n_name = 'SAUDI ARABIA'
+        and n_name = '{var1}'
     group by
         s_name
     order by
@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 22
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = ", ".join(f"'{code}'" for code in params["var1"])
+
+    query_str = f"""
     select
         cntrycode,
         count(*) as numcust,
@@ -17,7 +21,7 @@ def q() -> None:
             customer
         where
             substring(c_phone from 1 for 2) in
-                ("13","31","23", "29", "30", "18", "17")
+                ({var1})
             and c_acctbal > (
                 select
                     avg(c_acctbal)
@@ -26,7 +30,7 @@ def q() -> None:
                 where
                     c_acctbal > 0.00
                     and substring (c_phone from 1 for 2) in
-                        ("13","31","23", "29", "30", "18", "17")
+                        ({var1})
             )
             and not exists (
                 select
@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 3
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         l_orderkey,
         sum(l_extendedprice * (1 - l_discount)) as revenue,
@@ -15,11 +20,11 @@ def q() -> None:
         orders,
         lineitem
     where
-        c_mktsegment = 'BUILDING'
+        c_mktsegment = '{var1}'
         and c_custkey = o_custkey
         and l_orderkey = o_orderkey
-        and o_orderdate < date '1995-03-15'
-        and l_shipdate > date '1995-03-15'
+        and o_orderdate < date '{var2}'
+        and l_shipdate > date '{var2}'
     group by
         l_orderkey,
         o_orderdate,
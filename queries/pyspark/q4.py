@@ -1,18 +1,22 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 4
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         o_orderpriority,
         count(*) as order_count
     from
         orders
     where
-        o_orderdate >= date '1993-07-01'
-        and o_orderdate < date '1993-07-01' + interval '3' month
+        o_orderdate >= date '{var1}'
+        and o_orderdate < date '{var1}' + interval '3' month
         and exists (
             select
                 *
@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 5
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         n_name,
         sum(l_extendedprice * (1 - l_discount)) as revenue
@@ -22,9 +27,9 @@ def q() -> None:
         and c_nationkey = s_nationkey
         and s_nationkey = n_nationkey
         and n_regionkey = r_regionkey
-        and r_name = 'ASIA'
-        and o_orderdate >= date '1994-01-01'
-        and o_orderdate < date '1994-01-01' + interval '1' year
+        and r_name = '{var1}'
+        and o_orderdate >= date '{var2}'
+        and o_orderdate < date '{var2}' + interval '1' year
     group by
         n_name
     order by
@@ -1,19 +1,26 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 6
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var3 = params["var3"]
+    var4 = params["var4"]
+    var5 = params["var5"]
+
+    query_str = f"""
     select
         sum(l_extendedprice * l_discount) as revenue
     from
         lineitem
     where
-        l_shipdate >= date '1994-01-01'
-        and l_shipdate < date '1994-01-01' + interval '1' year
-        and l_discount between .06 - 0.01 and .06 + 0.01
-        and l_quantity < 24
+        l_shipdate >= date '{var1}'
+        and l_shipdate < date '{var1}' + interval '1' year
+        and l_discount between {var3} and {var4}
+        and l_quantity < {var5}
     """
 
     utils.get_line_item_ds()
@@ -1,10 +1,15 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 7
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+
+    query_str = f"""
     select
         supp_nation,
         cust_nation,
@@ -31,8 +36,8 @@ def q() -> None:
                 and s_nationkey = n1.n_nationkey
                 and c_nationkey = n2.n_nationkey
                 and (
-                    (n1.n_name = 'FRANCE' and n2.n_name = 'GERMANY')
-                    or (n1.n_name = 'GERMANY' and n2.n_name = 'FRANCE')
+                    (n1.n_name = '{var1}' and n2.n_name = '{var2}')
+                    or (n1.n_name = '{var2}' and n2.n_name = '{var1}')
                 )
                 and date(l_shipdate) between date '1995-01-01' and date '1996-12-31'
         ) as shipping
@@ -1,15 +1,21 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 8
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+    var2 = params["var2"]
+    var3 = params["var3"]
+
+    query_str = f"""
     select
         o_year,
         round(
             sum(case
-                when nation = 'BRAZIL' then volume
+                when nation = '{var1}' then volume
                 else 0
             end) / sum(volume)
         , 2) as mkt_share
@@ -35,10 +41,10 @@ def q() -> None:
                 and o_custkey = c_custkey
                 and c_nationkey = n1.n_nationkey
                 and n1.n_regionkey = r_regionkey
-                and r_name = 'AMERICA'
+                and r_name = '{var2}'
                 and s_nationkey = n2.n_nationkey
                 and o_orderdate between date '1995-01-01' and date '1996-12-31'
-                and p_type = 'ECONOMY ANODIZED STEEL'
+                and p_type = '{var3}'
         ) as all_nations
     group by
         o_year
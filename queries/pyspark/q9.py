@@ -1,10 +1,14 @@
+from queries.parameters import get_parameters
 from queries.pyspark import utils
 
 Q_NUM = 9
 
 
 def q() -> None:
-    query_str = """
+    params = get_parameters(Q_NUM)
+    var1 = params["var1"]
+
+    query_str = f"""
     select
         nation,
         o_year,
@@ -29,7 +33,7 @@ def q() -> None:
                 and p_partkey = l_partkey
                 and o_orderkey = l_orderkey
                 and s_nationkey = n_nationkey
-                and p_name like '%green%'
+                and p_name like '%{var1}%'
         ) as profit
     group by
         nation,
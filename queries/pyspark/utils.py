@@ -2,45 +2,86 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
 from pyspark.sql import SparkSession
+from pyspark.sql.pandas.types import to_arrow_schema
 
 from queries.common_utils import (
     check_query_result_pd,
+    get_library_version,
     get_table_path,
+    query_phase,
     run_query_generic,
 )
+from queries.memory_budget import get_engine_memory_limit, get_spill_dir
+from queries.plans import save_plan
+from queries.schema import get_arrow_schema, get_sql_types
 from settings import Settings
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pandas as pd
     from pyspark.sql import DataFrame
 
 settings = Settings()
 
 
 def get_or_create_spark() -> SparkSession:
-    spark = (
+    builder = (
         SparkSession.builder.appName("spark_queries")
-        .master("local[*]")
+        .master(f"local[{settings.run.threads or '*'}]")
         .config("spark.driver.memory", settings.run.spark_driver_memory)
         .config("spark.executor.memory", settings.run.spark_executor_memory)
         .config("spark.log.level", settings.run.spark_log_level)
-        .getOrCreate()
+        # Convert pandas DataFrames to Spark DataFrames with Arrow
+        .config("spark.sql.execution.arrow.pyspark.enabled", "true")
     )
-    return spark
+    if (memory_limit := get_engine_memory_limit()) is not None:
+        # In local mode, the driver JVM also runs the tasks
+        builder = builder.config(
+            "spark.driver.memory", f"{memory_limit // 2**20}m"
+        ).config("spark.local.dir", str(get_spill_dir()))
+    return builder.getOrCreate()
 
 
-def _read_ds(table_name: str) -> DataFrame:
-    if settings.run.io_type == "skip":
-        # TODO: Persist data in memory before query
-        msg = "cannot run PySpark starting from an in-memory representation"
-        raise RuntimeError(msg)
+def _get_ddl_schema(table_name: str) -> str:
+    return ", ".join(
+        f"{column} {sql_type}" for column, sql_type in get_sql_types(table_name).items()
+    )
+
+
+def _read_ipc(table_name: str, path: Path) -> pd.DataFrame:
+    """Read memory-mapped Arrow IPC files, Spark has no reader of its own."""
+    dataset = ds.dataset(
+        path,
+        schema=get_arrow_schema(table_name),
+        format="ipc",
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+    return dataset.to_table().to_pandas()  # type: ignore[no-any-return]
+
 
+def _read_ds(table_name: str) -> DataFrame:
     path = get_table_path(table_name)
 
-    if settings.run.io_type == "parquet":
+    if settings.run.io_type == "skip":
+        # Cache the table in memory and materialize it before the query runs.
+        # Spark reuses the cached data of a table that is read again.
+        df = get_or_create_spark().read.parquet(str(path)).cache()
+        df.count()
+    elif settings.run.io_type == "parquet":
         df = get_or_create_spark().read.parquet(str(path))
     elif settings.run.io_type == "csv":
-        df = get_or_create_spark().read.csv(str(path), header=True, inferSchema=True)
+        df = get_or_create_spark().read.csv(
+            str(path), header=True, schema=_get_ddl_schema(table_name)
+        )
+    elif settings.run.io_type == "feather":
+        df = get_or_create_spark().createDataFrame(
+            _read_ipc(table_name, path), schema=_get_ddl_schema(table_name)
+        )
     else:
         msg = f"unsupported file type: {settings.run.io_type!r}"
         raise ValueError(msg)
@@ -82,7 +123,22 @@ def get_part_supp_ds() -> DataFrame:
 
 
 def run_query(query_number: int, df: DataFrame) -> None:
-    query = df.toPandas
+    def query() -> pd.DataFrame:
+        # Collect the result as Arrow, as `df.toPandas()` does, so that the
+        # conversion to pandas is timed separately. The public `df.toArrow()` is
+        # only available from PySpark 4.0, so the private method it is built on is
+        # used, with the schema conversion `df.toPandas()` uses too.
+        batches = df._collect_as_arrow()
+        with query_phase("materialize"):
+            table = pa.Table.from_batches(batches, schema=to_arrow_schema(df.schema))
+            return table.to_pandas(date_as_object=True)  # type: ignore[no-any-return]
+
     run_query_generic(
         query, query_number, "pyspark", query_checker=check_query_result_pd
     )
+
+    if settings.run.capture_plans:
+        # The parsed, analyzed, optimized and physical plans of the last run
+        plan = df._jdf.queryExecution().toString()
+        version = get_library_version("pyspark")
+        save_plan("pyspark", version, query_number, plan)
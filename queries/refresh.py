@@ -0,0 +1,185 @@
+"""Apply the TPC-H refresh functions to a copy of the dataset between query runs.
+
+RF1 inserts new orders and line items, RF2 deletes old orders and their line items.
+The update sets are generated with `python -m scripts.prepare_data --refresh-sets`.
+Every library implements the two primitive table operations in its own
+`queries.<library>.refresh` module, so that the refresh cost can be compared.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import shutil
+import sys
+from datetime import datetime
+from importlib import import_module
+from subprocess import run
+from typing import TYPE_CHECKING
+
+from linetimer import CodeTimer
+
+from queries.common_utils import get_library_version
+from settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+settings = Settings()
+
+# Tables changed by the refresh functions, with the key to delete on
+REFRESH_TABLES = {"orders": "o_orderkey", "lineitem": "l_orderkey"}
+
+
+def _get_backend(library_name: str) -> ModuleType:
+    try:
+        return import_module(f"queries.{library_name}.refresh")
+    except ModuleNotFoundError as e:
+        if e.name != f"queries.{library_name}.refresh":
+            raise
+        msg = f"refresh functions are not implemented for {library_name!r}"
+        raise ValueError(msg) from None
+
+
+def _get_key_range(path: Path) -> tuple[int, int]:
+    """Return the minimum and maximum of the first column, from the statistics."""
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_metadata(path)
+    statistics = [
+        metadata.row_group(i).column(0).statistics
+        for i in range(metadata.num_row_groups)
+    ]
+    return min(s.min for s in statistics), max(s.max for s in statistics)
+
+
+def prepare_working_copy(dataset_dir: Path) -> None:
+    """Copy the static tables, which must not be changed, to `dataset_dir`."""
+    if settings.run.io_type not in ("parquet", "skip"):
+        msg = f"refresh functions only support Parquet tables, got {settings.run.io_type!r}"
+        raise ValueError(msg)
+    if settings.run.partitioning != "none":
+        msg = "refresh functions only support tables that are single files"
+        raise ValueError(msg)
+
+    shutil.rmtree(dataset_dir, ignore_errors=True)
+    dataset_dir.mkdir(parents=True)
+
+    for path in settings.dataset_base_dir.glob("*.parquet"):
+        table_name = path.name.removesuffix(".parquet")
+        if settings.run.refresh_strategy == "append" and table_name in REFRESH_TABLES:
+            # Tables that are appended to are directories of Parquet files
+            (dataset_dir / path.name).mkdir()
+            shutil.copy(path, dataset_dir / path.name / "part-0.parquet")
+        else:
+            shutil.copy(path, dataset_dir / path.name)
+
+
+def rf1(backend: ModuleType, dataset_dir: Path, set_number: int) -> None:
+    """Insert the new orders and line items of the update set."""
+    for table_name in REFRESH_TABLES:
+        update = (
+            settings.dataset_base_dir
+            / "updates"
+            / f"{table_name}.u{set_number}.parquet"
+        )
+        table = dataset_dir / f"{table_name}.parquet"
+
+        if settings.run.refresh_strategy == "append":
+            backend.write_table([update], table / f"part-u{set_number}.parquet")
+        else:
+            tmp = table.with_suffix(".tmp")
+            backend.write_table([table, update], tmp)
+            tmp.replace(table)
+
+
+def rf2(backend: ModuleType, dataset_dir: Path, set_number: int) -> None:
+    """Delete the orders of the update set, together with their line items."""
+    keys = settings.dataset_base_dir / "updates" / f"delete.{set_number}.parquet"
+    key_min, key_max = _get_key_range(keys)
+
+    for table_name, key_column in REFRESH_TABLES.items():
+        table = dataset_dir / f"{table_name}.parquet"
+
+        if settings.run.refresh_strategy == "append":
+            # Only rewrite the files that can contain one of the deleted keys
+            files = [
+                path
+                for path in sorted(table.glob("*.parquet"))
+                if _overlaps(_get_key_range(path), (key_min, key_max))
+            ]
+        else:
+            files = [table]
+
+        for path in files:
+            tmp = path.with_suffix(".tmp")
+            backend.delete_rows(path, key_column, keys, tmp)
+            tmp.replace(path)
+
+
+def _overlaps(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
+def run_refresh_test(library_name: str) -> None:
+    """Run RF1, all queries and RF2 for every update set.
+
+    The queries run in a subprocess reading the working copy of the dataset, with
+    the execution mode of the current settings.
+    """
+    backend = _get_backend(library_name)
+
+    tables_dir = settings.paths.tables / "refresh"
+    dataset_dir = tables_dir / settings.dataset_base_dir.name
+    prepare_working_copy(dataset_dir)
+
+    env = os.environ | {"PATH_TABLES": str(tables_dir), "RUN_REFRESH_SETS": "0"}
+
+    for set_number in range(1, settings.run.refresh_sets + 1):
+        for name, refresh_function in [("RF1", rf1), ("RF2", rf2)]:
+            with CodeTimer(
+                name=f"Run {library_name} {name} of set {set_number}", unit="s"
+            ) as timer:
+                refresh_function(backend, dataset_dir, set_number)
+
+            if settings.run.log_timings:
+                log_refresh_timing(library_name, name, set_number, timer.took)
+
+            if name == "RF1":
+                run([sys.executable, "-m", f"queries.{library_name}"], env=env)
+
+
+def log_refresh_timing(
+    solution: str, refresh_function: str, set_number: int, time: float
+) -> None:
+    settings.paths.timings.mkdir(parents=True, exist_ok=True)
+
+    path = settings.paths.timings / settings.paths.refresh_filename
+    with path.open("a", newline="") as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(
+                [
+                    "solution",
+                    "version",
+                    "refresh_function",
+                    "set",
+                    "strategy",
+                    "duration[s]",
+                    "scale_factor",
+                    "datetime_iso",
+                ]
+            )
+        writer.writerow(
+            [
+                solution,
+                get_library_version(solution),
+                refresh_function,
+                str(set_number),
+                settings.run.refresh_strategy,
+                str(time),
+                str(settings.scale_factor),
+                datetime.now().isoformat(),
+            ]
+        )
@@ -0,0 +1,150 @@
+"""Run query subprocesses concurrently, each pinned to its own set of CPUs."""
+
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from queries.memory_budget import run_query_process
+from settings import Settings
+
+settings = Settings()
+
+
+class CpuSlot(NamedTuple):
+    cpus: list[int]
+    numa_node: int | None = None
+
+
+def format_cpu_set(cpus: list[int]) -> str:
+    """Format CPU ids in the `cpulist` format, e.g. `0-3,8-11`."""
+    ranges: list[list[int]] = []
+    for cpu in sorted(cpus):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in ranges)
+
+
+def _parse_cpu_set(cpu_list: str) -> list[int]:
+    cpus: list[int] = []
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def _get_numa_nodes() -> dict[int, list[int]]:
+    """Return the CPUs available to this process, grouped by NUMA node."""
+    available = os.sched_getaffinity(0)
+    nodes = {}
+    for path in Path("/sys/devices/system/node").glob("node[0-9]*"):
+        cpus = [
+            c for c in _parse_cpu_set((path / "cpulist").read_text()) if c in available
+        ]
+        if cpus:
+            nodes[int(path.name.removeprefix("node"))] = cpus
+    return dict(sorted(nodes.items()))
+
+
+def _split(cpus: list[int], n: int) -> list[list[int]]:
+    size, remainder = divmod(len(cpus), n)
+    chunks, start = [], 0
+    for i in range(n):
+        end = start + size + (i < remainder)
+        chunks.append(cpus[start:end])
+        start = end
+    return chunks
+
+
+def plan_cpu_slots(n_slots: int, numa: bool = False) -> list[CpuSlot]:
+    """Divide the available CPUs into `n_slots` disjoint CPU sets.
+
+    With `numa`, slots are spread round-robin over the NUMA nodes and never
+    cross a node boundary.
+    """
+    groups: list[tuple[int | None, list[int], int]]
+    if numa:
+        nodes = _get_numa_nodes()
+        if not nodes:
+            msg = "no NUMA topology found in /sys/devices/system/node"
+            raise RuntimeError(msg)
+        slots_per_node = _split(list(range(n_slots)), len(nodes))
+        groups = [
+            (node, cpus, len(slot_ids))
+            for (node, cpus), slot_ids in zip(
+                nodes.items(), slots_per_node, strict=True
+            )
+            if slot_ids
+        ]
+    else:
+        groups = [(None, sorted(os.sched_getaffinity(0)), n_slots)]
+
+    slots: list[CpuSlot] = []
+    for node, cpus, n in groups:
+        if len(cpus) < n:
+            msg = f"cannot run {n} queries in parallel on {len(cpus)} CPUs"
+            raise ValueError(msg)
+        slots.extend(CpuSlot(chunk, node) for chunk in _split(cpus, n))
+    return slots
+
+
+def _pinned_command(slot: CpuSlot, command: list[str]) -> list[str]:
+    cpu_set = format_cpu_set(slot.cpus)
+    if slot.numa_node is not None:
+        if shutil.which("numactl") is None:
+            msg = "`numactl` is required to bind queries to a NUMA node"
+            raise RuntimeError(msg)
+        return [
+            "numactl",
+            f"--physcpubind={cpu_set}",
+            f"--membind={slot.numa_node}",
+            *command,
+        ]
+    return ["taskset", "--cpu-list", cpu_set, *command]
+
+
+def _thread_env(n_threads: int) -> dict[str, str]:
+    """Environment that limits the thread pools of all engines to `n_threads`."""
+    n = str(n_threads)
+    return {
+        "RUN_THREADS": n,
+        "POLARS_MAX_THREADS": n,
+        "OMP_NUM_THREADS": n,  # Also picked up by the Arrow CPU thread pool
+        "MODIN_CPUS": n,
+    }
+
+
+def run_pinned(
+    library_name: str, query_numbers: list[int], timeout: float | None = None
+) -> None:
+    """Run query subprocesses `settings.run.parallel_queries` at a time."""
+    slots: queue.Queue[CpuSlot] = queue.Queue()
+    for slot in plan_cpu_slots(settings.run.parallel_queries, settings.run.numa):
+        slots.put(slot)
+
+    def run_one(query_number: int) -> None:
+        slot = slots.get()
+        try:
+            command = [sys.executable, "-m", f"queries.{library_name}.q{query_number}"]
+            run_query_process(
+                library_name,
+                query_number,
+                _pinned_command(slot, command),
+                env=os.environ | _thread_env(len(slot.cpus)),
+                timeout=timeout,
+            )
+        finally:
+            slots.put(slot)
+
+    with ThreadPoolExecutor(settings.run.parallel_queries) as pool:
+        # Consume the results, so that errors are raised here
+        list(pool.map(run_one, query_numbers))
@@ -0,0 +1,212 @@
+"""Disclaimer.
+
+Certain portions of the contents of this file are derived from TPC-H version 3.0.1
+(retrieved from
+http://www.tpc.org/tpc_documents_current_versions/current_specifications5.asp).
+Such portions are subject to copyrights held by Transaction Processing
+Performance Council (“TPC”) and licensed under the TPC EULA is available at
+http://www.tpc.org/tpc_documents_current_versions/current_specifications5.asp)
+(the “TPC EULA”).
+
+You may not use this file except in compliance with the TPC EULA.
+DISCLAIMER: Portions of this file is derived from the TPC-H benchmark and as
+such any result obtained using this file are not comparable to published TPC-H
+Benchmark results, as the results obtained from using this file do not comply with
+the TPC-H Benchmark.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+# Source tables contained in the schema for TPC-H. For more information, check -
+# https://www.tpc.org/TPC_Documents_Current_Versions/pdf/TPC-H_v3.0.1.pdf
+table_columns = {
+    "customer": [
+        "c_custkey",
+        "c_name",
+        "c_address",
+        "c_nationkey",
+        "c_phone",
+        "c_acctbal",
+        "c_mktsegment",
+        "c_comment",
+    ],
+    "lineitem": [
+        "l_orderkey",
+        "l_partkey",
+        "l_suppkey",
+        "l_linenumber",
+        "l_quantity",
+        "l_extendedprice",
+        "l_discount",
+        "l_tax",
+        "l_returnflag",
+        "l_linestatus",
+        "l_shipdate",
+        "l_commitdate",
+        "l_receiptdate",
+        "l_shipinstruct",
+        "l_shipmode",
+        "comments",
+    ],
+    "nation": [
+        "n_nationkey",
+        "n_name",
+        "n_regionkey",
+        "n_comment",
+    ],
+    "orders": [
+        "o_orderkey",
+        "o_custkey",
+        "o_orderstatus",
+        "o_totalprice",
+        "o_orderdate",
+        "o_orderpriority",
+        "o_clerk",
+        "o_shippriority",
+        "o_comment",
+    ],
+    "part": [
+        "p_partkey",
+        "p_name",
+        "p_mfgr",
+        "p_brand",
+        "p_type",
+        "p_size",
+        "p_container",
+        "p_retailprice",
+        "p_comment",
+    ],
+    "partsupp": [
+        "ps_partkey",
+        "ps_suppkey",
+        "ps_availqty",
+        "ps_supplycost",
+        "ps_comment",
+    ],
+    "region": [
+        "r_regionkey",
+        "r_name",
+        "r_comment",
+    ],
+    "supplier": [
+        "s_suppkey",
+        "s_name",
+        "s_address",
+        "s_nationkey",
+        "s_phone",
+        "s_acctbal",
+        "s_comment",
+    ],
+}
+
+
+# Arrow types of the columns that are not strings, equal to the types Polars
+# infers from the dbgen output
+column_types = {
+    "c_custkey": pa.int64(),
+    "c_nationkey": pa.int64(),
+    "c_acctbal": pa.float64(),
+    "l_orderkey": pa.int64(),
+    "l_partkey": pa.int64(),
+    "l_suppkey": pa.int64(),
+    "l_linenumber": pa.int64(),
+    "l_quantity": pa.int64(),
+    "l_extendedprice": pa.float64(),
+    "l_discount": pa.float64(),
+    "l_tax": pa.float64(),
+    "l_shipdate": pa.date32(),
+    "l_commitdate": pa.date32(),
+    "l_receiptdate": pa.date32(),
+    "n_nationkey": pa.int64(),
+    "n_regionkey": pa.int64(),
+    "o_orderkey": pa.int64(),
+    "o_custkey": pa.int64(),
+    "o_totalprice": pa.float64(),
+    "o_orderdate": pa.date32(),
+    "o_shippriority": pa.int64(),
+    "p_partkey": pa.int64(),
+    "p_size": pa.int64(),
+    "p_retailprice": pa.float64(),
+    "ps_partkey": pa.int64(),
+    "ps_suppkey": pa.int64(),
+    "ps_availqty": pa.int64(),
+    "ps_supplycost": pa.float64(),
+    "r_regionkey": pa.int64(),
+    "s_suppkey": pa.int64(),
+    "s_nationkey": pa.int64(),
+    "s_acctbal": pa.float64(),
+}
+
+# Hive partition keys of the tables that are partitioned in the `hive` datasets.
+# Queries filter on them, so that the filters prune directories: l_shipmode in
+# q12 and q19, o_orderstatus in q21.
+PARTITION_KEYS = {
+    "lineitem": "l_shipmode",
+    "orders": "o_orderstatus",
+}
+
+
+def get_arrow_schema(table_name: str) -> pa.Schema:
+    """Return the Arrow schema of a table."""
+    return pa.schema(
+        [
+            (column, column_types.get(column, pa.large_string()))
+            for column in table_columns[table_name]
+        ]
+    )
+
+
+def get_polars_schema(table_name: str) -> pl.Schema:
+    """Return the Polars schema of a table."""
+    import polars as pl
+
+    return pl.DataFrame(get_arrow_schema(table_name).empty_table()).schema
+
+
+def get_pandas_dtypes(table_name: str) -> dict[str, pd.ArrowDtype]:
+    """Return the PyArrow-backed pandas dtypes of the columns of a table."""
+    import pandas as pd
+
+    return {
+        field.name: pd.ArrowDtype(field.type) for field in get_arrow_schema(table_name)
+    }
+
+
+# NumPy dtypes of the Arrow types used by the tables, as understood by cuDF
+_numpy_dtypes = {
+    pa.int64(): "int64",
+    pa.float64(): "float64",
+    pa.date32(): "datetime64[ms]",
+    pa.large_string(): "str",
+}
+
+
+def get_numpy_dtypes(table_name: str) -> dict[str, str]:
+    """Return the NumPy dtypes of the columns of a table, dates are datetimes."""
+    return {
+        field.name: _numpy_dtypes[field.type] for field in get_arrow_schema(table_name)
+    }
+
+
+# SQL types of the Arrow types used by the tables
+_sql_types = {
+    pa.int64(): "BIGINT",
+    pa.float64(): "DOUBLE",
+    pa.date32(): "DATE",
+    pa.large_string(): "STRING",
+}
+
+
+def get_sql_types(table_name: str) -> dict[str, str]:
+    """Return the SQL types of the columns of a table."""
+    return {
+        field.name: _sql_types[field.type] for field in get_arrow_schema(table_name)
+    }
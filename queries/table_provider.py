@@ -0,0 +1,98 @@
+"""Load the tables of DataFrame libraries, in or outside the timed part of a query.
+
+The mode is set with `RUN_TABLE_LOADING`:
+
+- preload: the tables of a query are loaded before the timer starts and kept for
+  all iterations of the query.
+- lazy: tables are loaded on first use inside the timer, in every iteration.
+- cached: as lazy, but loaded tables are kept for later iterations and queries in
+  the same process, up to `RUN_TABLE_CACHE_BYTES`. The least recently used tables
+  are dropped first.
+
+The time spent loading tables is reported as the I/O phase of a query.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from queries.common_utils import query_phase
+from settings import Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from settings import TableLoading
+
+settings = Settings()
+
+T = TypeVar("T")
+
+
+def _memory_usage(df: Any) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+class TableProvider(Generic[T]):
+    def __init__(
+        self,
+        read: Callable[[str], T],
+        size_of: Callable[[T], int] = _memory_usage,
+    ) -> None:
+        """Provide the tables read by `read`.
+
+        `size_of` returns the size of a table in bytes, for the cached mode.
+        """
+        self.read = read
+        self.size_of = size_of
+        self.mode: TableLoading = settings.run.table_loading or (
+            "lazy" if settings.run.include_io else "preload"
+        )
+        self._tables: OrderedDict[str, tuple[T, int]] = OrderedDict()
+
+    def get(self, table_name: str) -> T:
+        """Return a table, loading it if needed."""
+        if table_name in self._tables:
+            self._tables.move_to_end(table_name)
+            return self._tables[table_name][0]
+
+        if self.mode == "preload":
+            msg = f"table {table_name!r} is used by the query, but was not preloaded"
+            raise RuntimeError(msg)
+        return self._load(table_name)
+
+    def _load(self, table_name: str) -> T:
+        with query_phase("io"):
+            table = self.read(table_name)
+
+        size = self.size_of(table) if self.mode == "cached" else 0
+        self._tables[table_name] = (table, size)
+        self._evict()
+        return table
+
+    def _evict(self) -> None:
+        if self.mode != "cached":
+            return
+        total = sum(size for _, size in self._tables.values())
+        # Always keep the table that was loaded last
+        while total > settings.run.table_cache_bytes and len(self._tables) > 1:
+            _, (_, size) = self._tables.popitem(last=False)
+            total -= size
+
+    def prepare(self, table_names: Iterable[str]) -> None:
+        """Prepare an iteration of a query, which uses the tables `table_names`."""
+        if self.mode == "preload":
+            for table_name in table_names:
+                if table_name not in self._tables:
+                    self._load(table_name)
+
+    def finish(self) -> None:
+        """Finish an iteration of a query."""
+        if self.mode == "lazy":
+            self._tables.clear()
+
+    def release(self) -> None:
+        """Release the tables after the last iteration of a query."""
+        if self.mode != "cached":
+            self._tables.clear()
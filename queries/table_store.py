@@ -0,0 +1,64 @@
+"""Store of uncompressed Arrow IPC copies of the tables, shared by query processes.
+
+Every table is converted once per dataset and then memory-mapped by every query
+process that runs with the skip IO type. By default the store is a directory in
+`/dev/shm`, so the tables stay in shared memory and are never read from disk
+again. The location is set with `PATH_IPC_CACHE`.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from queries.common_utils import get_hive_partitioning, get_table_path
+from settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+settings = Settings()
+
+
+def _get_fingerprint(path: Path) -> str:
+    """Return a hash of the modification times and sizes of the table files."""
+    files = sorted(path.rglob("*")) if path.is_dir() else [path]
+    stats = [(str(f), f.stat().st_mtime_ns, f.stat().st_size) for f in files]
+    return hashlib.sha1(repr(stats).encode()).hexdigest()[:16]
+
+
+def get_store_path(table_name: str) -> Path:
+    """Return the path to the IPC copy of a table, creating it if needed.
+
+    The copy is named after the fingerprint of the table files, so it is created
+    again when the dataset is regenerated.
+    """
+    path = get_table_path(table_name)
+    store_dir = settings.paths.ipc_cache / settings.dataset_base_dir.name
+    store_path = store_dir / f"{table_name}-{_get_fingerprint(path)}.arrow"
+    if store_path.exists():
+        return store_path
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    # Queries can run in parallel, make sure every table is only converted once
+    with (store_dir / f"{table_name}.lock").open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not store_path.exists():
+            for stale in store_dir.glob(f"{table_name}-*.arrow"):
+                stale.unlink()
+            table = pq.read_table(path, partitioning=get_hive_partitioning(table_name))
+            tmp = store_path.with_suffix(f".{os.getpid()}.tmp")
+            with pa.ipc.new_file(tmp, table.schema) as writer:
+                writer.write_table(table)
+            tmp.replace(store_path)
+    return store_path
+
+
+def read_table(table_name: str) -> pa.Table:
+    """Memory-map the IPC copy of a table, the data is not copied."""
+    return pa.ipc.open_file(pa.memory_map(str(get_store_path(table_name)))).read_all()
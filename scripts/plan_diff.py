@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Compare the query plans and timings of a solution between two runs.
+
+Plans are stored by running the queries with `RUN_CAPTURE_PLANS=1`. The runs are
+two versions of the solution, or the same version in two timings directories,
+e.g. before and after changing a setting. Queries whose plan changed and whose
+median duration regressed by more than the threshold are flagged.
+"""
+
+import argparse
+import difflib
+import sys
+from pathlib import Path
+
+from queries.plans import PLANS_DIRNAME, normalize_plan
+from settings import Settings
+
+try:
+    import polars as pl
+except ImportError:
+    print("Please install Polars to use this script.")
+    sys.exit(1)
+
+settings = Settings()
+
+
+def read_plans(timings_dir: Path, solution: str, version: str) -> dict[int, str]:
+    """Return the normalized plan of every query of a run."""
+    plans = {}
+    for path in (timings_dir / PLANS_DIRNAME / solution / version).glob("q*.*"):
+        suffix = path.suffix.removeprefix(".")
+        plans[int(path.stem.removeprefix("q"))] = normalize_plan(
+            path.read_text(), suffix
+        )
+    return plans
+
+
+def read_durations(timings_dir: Path, solution: str, version: str) -> dict[int, float]:
+    """Return the median duration of every query of a run.
+
+    Only timings of the current scale factor and IO type are used.
+    """
+    path = timings_dir / settings.paths.timings_filename
+    if not path.exists():
+        return {}
+    durations = (
+        pl.read_csv(
+            path, schema_overrides={"version": pl.String, "scale_factor": pl.Float64}
+        )
+        .filter(
+            pl.col("solution") == solution,
+            pl.col("version") == version,
+            pl.col("io_type") == settings.run.io_type,
+            pl.col("scale_factor") == settings.scale_factor,
+        )
+        .group_by("query_number")
+        .agg(pl.col("duration[s]").median())
+    )
+    return dict(durations.iter_rows())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Diff query plans between two runs and flag regressions.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("solution", help="Solution, e.g. polars or duckdb")
+    parser.add_argument("base", help="Version of the base run")
+    parser.add_argument("new", help="Version of the new run")
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=settings.paths.timings,
+        help="Timings directory of the base run",
+    )
+    parser.add_argument(
+        "--new-dir",
+        type=Path,
+        default=settings.paths.timings,
+        help="Timings directory of the new run",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown that counts as a regression",
+    )
+    parser.add_argument(
+        "-d",
+        "--diff",
+        action="store_true",
+        help="Print the plan diff of every changed query, not only of regressions",
+    )
+    args = parser.parse_args()
+
+    base_plans = read_plans(args.base_dir, args.solution, args.base)
+    new_plans = read_plans(args.new_dir, args.solution, args.new)
+    if not base_plans or not new_plans:
+        print("No plans found, run the queries with RUN_CAPTURE_PLANS=1 first.")
+        sys.exit(1)
+    base_durations = read_durations(args.base_dir, args.solution, args.base)
+    new_durations = read_durations(args.new_dir, args.solution, args.new)
+
+    regressions = 0
+    for query_number in sorted(base_plans.keys() & new_plans.keys()):
+        base_plan, new_plan = base_plans[query_number], new_plans[query_number]
+        plan_changed = base_plan != new_plan
+
+        base_duration = base_durations.get(query_number)
+        new_duration = new_durations.get(query_number)
+        change = (
+            new_duration / base_duration - 1
+            if base_duration and new_duration is not None
+            else None
+        )
+        regressed = plan_changed and change is not None and change > args.threshold
+        regressions += regressed
+
+        timing = (
+            f"{base_duration:.3f}s -> {new_duration:.3f}s ({change:+.1%})"
+            if change is not None
+            else "no timings"
+        )
+        status = "REGRESSED" if regressed else "changed" if plan_changed else "same"
+        print(f"q{query_number}: plan {status}, {timing}")
+
+        if regressed or (plan_changed and args.diff):
+            diff = difflib.unified_diff(
+                base_plan.splitlines(),
+                new_plan.splitlines(),
+                fromfile=f"{args.base}/q{query_number}",
+                tofile=f"{args.new}/q{query_number}",
+                lineterm="",
+            )
+            print("\n".join(diff), end="\n\n")
+
+    print(f"{regressions} queries regressed with a changed plan")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Plot the profiles of Polars queries as Gantt charts.
+
+Profiles are stored by running the queries with `RUN_POLARS_PROFILE=1`, which
+records the start and end of every node of the plan in microseconds. Besides the
+plot, the nodes that took the longest are printed for every query.
+"""
+
+import argparse
+import sys
+import warnings
+
+from settings import Settings
+
+try:
+    import plotnine as p9
+    import polars as pl
+    from plotnine.exceptions import PlotnineWarning
+
+    from queries.polars.utils import get_profile_path
+
+    warnings.filterwarnings("ignore", category=PlotnineWarning)
+except ImportError:
+    print("Please install Polars and Plotnine to use this script.")
+    sys.exit(1)
+
+settings = Settings()
+
+
+def parse_queries(s: str) -> list[int]:
+    query_numbers: set[int] = set()
+    for part in s.split(","):
+        if "-" in part:
+            start, end = map(int, part.split("-"))
+            query_numbers.update(range(start, end + 1))
+        else:
+            query_numbers.add(int(part))
+    return sorted(query_numbers)
+
+
+def read_profiles(solution: str, version: str, queries: list[int]) -> pl.DataFrame:
+    profiles = []
+    for query_number in queries:
+        path = get_profile_path(solution, version, query_number)
+        if not path.exists():
+            print(f"No profile of q{query_number} in {path}")
+            continue
+        profiles.append(
+            pl.read_parquet(path).with_columns(
+                query=pl.lit(f"Q{query_number}"),
+                # Nodes can occur more than once, e.g. several joins on one key
+                label=pl.format(
+                    "{} {}",
+                    pl.int_range(pl.len()).cast(pl.String).str.zfill(3),
+                    pl.col("node"),
+                ),
+                start=pl.col("start") / 1_000_000,
+                end=pl.col("end") / 1_000_000,
+            )
+        )
+    if not profiles:
+        print("No profiles found, run the queries with RUN_POLARS_PROFILE=1 first.")
+        sys.exit(1)
+    return pl.concat(profiles).with_columns(duration=pl.col("end") - pl.col("start"))
+
+
+def print_top_nodes(profiles: pl.DataFrame, top: int) -> None:
+    for (query,), nodes in profiles.group_by("query", maintain_order=True):
+        total = nodes.select(pl.max("end")).item()
+        print(f"{query} ({total:.3f}s):")
+        for node, duration in (
+            nodes.top_k(top, by="duration").select("node", "duration").iter_rows()
+        ):
+            print(f"  {duration:8.3f}s {duration / total:6.1%}  {node}")
+
+
+def create_plot(profiles: pl.DataFrame, args: argparse.Namespace) -> p9.ggplot:
+    # Truncate long node names, which list all their columns or expressions
+    profiles = profiles.with_columns(
+        pl.when(pl.col("label").str.len_chars() > args.max_label)
+        .then(pl.col("label").str.slice(0, args.max_label - 1) + "…")
+        .otherwise(pl.col("label"))
+        .alias("label")
+    )
+    # The first node at the top
+    labels = profiles.get_column("label").unique().sort(descending=True)
+    queries = profiles.get_column("query").unique(maintain_order=True)
+    profiles = profiles.with_columns(
+        pl.col("label").cast(pl.Enum(labels)), pl.col("query").cast(pl.Enum(queries))
+    )
+    return (
+        p9.ggplot(profiles)
+        + p9.geom_segment(
+            p9.aes(x="start", xend="end", y="label", yend="label"), size=4
+        )
+        + p9.facet_wrap("query", ncol=1, scales="free")
+        + p9.labs(
+            title=f"Profile of {args.solution} {args.version}",
+            x="time (s)",
+            y="",
+        )
+        + p9.theme_bw()
+        + p9.theme(figure_size=(args.width, args.height), dpi=args.dpi)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create Gantt charts of the profiles of Polars queries.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("version", help="Polars version of the profiles")
+    parser.add_argument(
+        "-s",
+        "--solution",
+        type=str,
+        default="polars-profile",
+        help="Solution of the profiles, e.g. polars-streaming-profile",
+    )
+    parser.add_argument(
+        "-q",
+        "--queries",
+        type=str,
+        default="1-22",
+        help="Queries to include",
+        metavar="<integers and ranges>",
+    )
+    parser.add_argument(
+        "-k",
+        "--top",
+        type=int,
+        default=5,
+        help="Number of the slowest nodes to print per query",
+    )
+    parser.add_argument(
+        "--max-label",
+        type=int,
+        default=60,
+        help="Maximum length of the node names",
+    )
+    parser.add_argument(
+        "--width",
+        type=float,
+        default=12.0,
+        help="Figure width",
+        metavar="<inch>",
+    )
+    parser.add_argument(
+        "--height",
+        type=float,
+        default=None,
+        help="Figure height, by default 0.25 inch per node",
+        metavar="<inch>",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=200,
+        help="Figure DPI",
+        metavar="<dpi>",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="profile.png",
+        help="Output file",
+        metavar="<png file>",
+    )
+
+    args = parser.parse_args()
+
+    profiles = read_profiles(args.solution, args.version, parse_queries(args.queries))
+    print_top_nodes(profiles, args.top)
+
+    if args.height is None:
+        args.height = max(4.0, 0.25 * len(profiles))
+    plot = create_plot(profiles, args)
+    plot.save(args.output, verbose=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,19 +18,36 @@ the TPC-H Benchmark.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import glob
 import logging
+import math
 import os
 import pathlib
+import queue
 import shlex
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from multiprocessing import Pool
-from typing import no_type_check
+from typing import TYPE_CHECKING, Literal, no_type_check
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-from settings import Settings
+from queries.schema import PARTITION_KEYS, get_arrow_schema, table_columns
+from settings import Parquet, Settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from settings import Partitioning, TableOrder
 
 tpch_dbgen = pathlib.Path(__file__).parent.parent / "tpch-dbgen"
 
@@ -42,6 +59,13 @@ logger = logging.getLogger(__name__)
 
 STATIC_TABLES = ["nation", "region"]
 
+# Columns the tables are ordered by for the `sorted` and `zorder` table orders.
+# Sorting uses the first column only, Z-ordering interleaves both.
+ORDER_COLUMNS = {
+    "lineitem": ["l_shipdate", "l_orderkey"],
+    "orders": ["o_orderdate", "o_orderkey"],
+}
+
 
 @no_type_check
 def batch(iterable, n=1):
@@ -110,87 +134,18 @@ def pipelined_data_generation(
             os.remove(table_file)  # noqa: PTH107
 
 
-# Source tables contained in the schema for TPC-H. For more information, check -
-# https://www.tpc.org/TPC_Documents_Current_Versions/pdf/TPC-H_v3.0.1.pdf
-table_columns = {
-    "customer": [
-        "c_custkey",
-        "c_name",
-        "c_address",
-        "c_nationkey",
-        "c_phone",
-        "c_acctbal",
-        "c_mktsegment",
-        "c_comment",
-    ],
-    "lineitem": [
-        "l_orderkey",
-        "l_partkey",
-        "l_suppkey",
-        "l_linenumber",
-        "l_quantity",
-        "l_extendedprice",
-        "l_discount",
-        "l_tax",
-        "l_returnflag",
-        "l_linestatus",
-        "l_shipdate",
-        "l_commitdate",
-        "l_receiptdate",
-        "l_shipinstruct",
-        "l_shipmode",
-        "comments",
-    ],
-    "nation": [
-        "n_nationkey",
-        "n_name",
-        "n_regionkey",
-        "n_comment",
-    ],
-    "orders": [
-        "o_orderkey",
-        "o_custkey",
-        "o_orderstatus",
-        "o_totalprice",
-        "o_orderdate",
-        "o_orderpriority",
-        "o_clerk",
-        "o_shippriority",
-        "o_comment",
-    ],
-    "part": [
-        "p_partkey",
-        "p_name",
-        "p_mfgr",
-        "p_brand",
-        "p_type",
-        "p_size",
-        "p_container",
-        "p_retailprice",
-        "p_comment",
-    ],
-    "partsupp": [
-        "ps_partkey",
-        "ps_suppkey",
-        "ps_availqty",
-        "ps_supplycost",
-        "ps_comment",
-    ],
-    "region": [
-        "r_regionkey",
-        "r_name",
-        "r_comment",
-    ],
-    "supplier": [
-        "s_suppkey",
-        "s_name",
-        "s_address",
-        "s_nationkey",
-        "s_phone",
-        "s_acctbal",
-        "s_comment",
-    ],
-}
+def _scan_tbl(path: pathlib.Path, columns: list[str]) -> pl.LazyFrame:
+    """Scan the pipe-delimited output of dbgen."""
+    lf = pl.scan_csv(
+        path,
+        has_header=False,
+        separator="|",
+        try_parse_dates=True,
+        new_columns=columns,
+    )
+
+    # Drop empty last column because CSV ends with a separator
+    return lf.select(columns)
 
 
 def gen_parquet(
@@ -202,16 +157,7 @@ def gen_parquet(
     for table_name, columns in table_columns.items():
         path = base_path / f"{table_name}.tbl*"
 
-        lf = pl.scan_csv(
-            path,
-            has_header=False,
-            separator="|",
-            try_parse_dates=True,
-            new_columns=columns,
-        )
-
-        # Drop empty last column because CSV ends with a separator
-        lf = lf.select(columns)
+        lf = _scan_tbl(path, columns)
 
         if partitioned:
             (base_path / table_name).mkdir(parents=True, exist_ok=True)
@@ -222,6 +168,486 @@ def gen_parquet(
             lf.sink_parquet(path)
 
 
+def _convert_tbl_stream(
+    path: pathlib.Path, table_name: str, output_path: pathlib.Path
+) -> None:
+    """Convert the dbgen output streamed to the named pipe `path` to Arrow IPC.
+
+    dbgen still writes its rows as pipe-delimited text, which is parsed here with
+    the schema of the table. The text is not written to disk, and no types are
+    inferred, but every value is still formatted by dbgen and parsed again.
+    """
+    schema = get_arrow_schema(table_name)
+    read_options = pa_csv.ReadOptions(
+        # The empty last column is there because every row ends with a separator
+        column_names=[*schema.names, ""],
+        block_size=16 * 1024 * 1024,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter="|")
+    convert_options = pa_csv.ConvertOptions(
+        column_types=schema, include_columns=schema.names
+    )
+
+    # A named pipe is not seekable, so it can't be opened by Arrow itself
+    with (
+        path.open("rb") as f,
+        pa_csv.open_csv(f, read_options, parse_options, convert_options) as reader,
+        pa.ipc.new_file(
+            output_path, schema, options=pa.ipc.IpcWriteOptions(compression="lz4")
+        ) as writer,
+    ):
+        for record_batch in reader:
+            writer.write_batch(record_batch)
+
+
+def _get_tbl_name(table_name: str, chunk_idx: int, num_chunks: int) -> str:
+    """Return the name of the file dbgen writes a table of a chunk to."""
+    if num_chunks > 1 and table_name not in STATIC_TABLES:
+        return f"{table_name}.tbl.{chunk_idx}"
+    return f"{table_name}.tbl"
+
+
+def _gen_chunk(
+    chunk_idx: int, scratch_dir: pathlib.Path, scale_factor: float, num_chunks: int
+) -> None:
+    """Generate a single dbgen chunk, streaming its tables into Arrow IPC files."""
+    chunk_dir = scratch_dir / f"chunk-{chunk_idx}"
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+
+    # dbgen writes to named pipes, each read by its own thread. Static tables are
+    # generated in full for every chunk, only the first chunk keeps them.
+    pipes = {}
+    for table_name in table_columns:
+        if table_name in STATIC_TABLES and chunk_idx > 1:
+            continue
+        path = chunk_dir / _get_tbl_name(table_name, chunk_idx, num_chunks)
+        os.mkfifo(path)
+        pipes[table_name] = path
+        (scratch_dir / table_name).mkdir(exist_ok=True)
+
+    command = f"./dbgen -f -s {scale_factor}"
+    if num_chunks > 1:
+        command += f" -C {num_chunks} -S {chunk_idx}"
+
+    with ThreadPoolExecutor(len(pipes)) as pool:
+        futures = [
+            pool.submit(
+                _convert_tbl_stream,
+                path,
+                table_name,
+                scratch_dir / table_name / f"{chunk_idx}.arrow",
+            )
+            for table_name, path in pipes.items()
+        ]
+        try:
+            subprocess.check_output(
+                shlex.split(command),
+                cwd=str(tpch_dbgen),
+                env=os.environ | {"DSS_PATH": str(chunk_dir)},
+            )
+        finally:
+            # Readers of pipes dbgen did not open (e.g. because it failed) are
+            # blocked until a writer opens them, which makes them read no rows
+            while not all(future.done() for future in futures):
+                for path in pipes.values():
+                    with contextlib.suppress(OSError):
+                        os.close(os.open(path, os.O_WRONLY | os.O_NONBLOCK))
+                time.sleep(0.1)
+        for future in futures:
+            future.result()
+
+    shutil.rmtree(chunk_dir)
+
+
+def _interleave_bits(column: pl.Expr) -> pl.Expr:
+    """Spread the lower 16 bits of `column`, with a zero bit between each of them."""
+    x = column.cast(pl.UInt64)
+    # Multiplying by a power of two shifts the bits to the left
+    for shift, mask in [
+        (8, 0x00FF00FF),
+        (4, 0x0F0F0F0F),
+        (2, 0x33333333),
+        (1, 0x55555555),
+    ]:
+        x = (x | (x * 2**shift)) & mask
+    return x
+
+
+def _z_order_bucket(column: str) -> pl.Expr:
+    """Map the distinct values of `column` to 16-bit buckets, in order."""
+    # The dense rank is a UInt32, which the multiplication would overflow
+    rank = pl.col(column).rank("dense").cast(pl.UInt64) - 1
+    return rank * 2**16 // pl.col(column).n_unique()
+
+
+def _z_order_key(columns: list[str]) -> pl.Expr:
+    """Return the Z-order (Morton) key of two columns.
+
+    Both columns are mapped to 16-bit buckets of their distinct values first, so
+    that they have the same resolution in the key.
+    """
+    first, second = (_z_order_bucket(c) for c in columns)
+    return _interleave_bits(first) * 2 | _interleave_bits(second)
+
+
+def _order_table(
+    parts: list[pathlib.Path],
+    table_name: str,
+    table_order: TableOrder,
+    output_path: pathlib.Path,
+) -> None:
+    """Write the rows of the Arrow IPC files to `output_path` in the given order."""
+    columns = ORDER_COLUMNS[table_name]
+    lf = pl.scan_ipc(parts)
+    if table_order == "sorted":
+        lf = lf.sort(columns[0], maintain_order=True)
+    else:
+        lf = lf.sort(_z_order_key(columns), maintain_order=True)
+    lf.sink_ipc(output_path, compression="lz4")
+
+
+def _write_parquet(
+    parts: Iterable[pathlib.Path],
+    table_name: str,
+    output_path: pathlib.Path,
+    layout: Parquet,
+    sorting_columns: list[str] | None = None,
+) -> None:
+    """Concatenate Arrow IPC files into a Parquet file with the given layout.
+
+    `sorting_columns` are recorded in the metadata of every row group, for files
+    that are sorted by these columns.
+    """
+    schema = get_arrow_schema(table_name)
+    with pq.ParquetWriter(
+        output_path,
+        schema,
+        compression=layout.compression,
+        compression_level=layout.compression_level,
+        use_dictionary=layout.dictionary,
+        write_statistics=layout.statistics,
+        write_page_index=layout.page_index,
+        data_page_size=layout.data_page_size,
+        sorting_columns=_get_sorting_columns(schema, sorting_columns),
+    ) as writer:
+        # Buffer record batches, so that all row groups but the last one are full
+        buffer: list[pa.RecordBatch] = []
+        n_rows = 0
+        for record_batch in _iter_batches(parts, schema):
+            buffer.append(record_batch)
+            n_rows += record_batch.num_rows
+
+            if n_rows >= layout.row_group_size:
+                table = pa.Table.from_batches(buffer, schema)
+                n_full = n_rows - n_rows % layout.row_group_size
+                writer.write_table(table.slice(0, n_full), layout.row_group_size)
+                buffer = table.slice(n_full).to_batches()
+                n_rows -= n_full
+
+        if n_rows:
+            writer.write_table(pa.Table.from_batches(buffer, schema))
+
+
+def _write_parquet_dataset(
+    parts: Iterable[pathlib.Path],
+    table_name: str,
+    output_dir: pathlib.Path,
+    layout: Parquet,
+    partitioning: Partitioning,
+    rows_per_file: int,
+    sorting_columns: list[str] | None = None,
+) -> None:
+    """Write Arrow IPC files to a directory of Parquet files with the given layout.
+
+    Files have at most `rows_per_file` rows. With the `hive` partitioning, the
+    tables in `PARTITION_KEYS` are partitioned by their key column, in
+    `<key>=<value>` directories. The key is only stored in the directory names.
+    """
+    schema = get_arrow_schema(table_name)
+
+    hive_partitioning = None
+    file_schema = schema
+    if partitioning == "hive" and table_name in PARTITION_KEYS:
+        key = PARTITION_KEYS[table_name]
+        hive_partitioning = ds.partitioning(
+            pa.schema([schema.field(key)]), flavor="hive"
+        )
+        file_schema = schema.remove(schema.get_field_index(key))
+
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression=layout.compression,
+        compression_level=layout.compression_level,
+        use_dictionary=layout.dictionary,
+        write_statistics=layout.statistics,
+        write_page_index=layout.page_index,
+        data_page_size=layout.data_page_size,
+        sorting_columns=_get_sorting_columns(file_schema, sorting_columns),
+    )
+    ds.write_dataset(
+        _iter_batches(parts, schema),
+        output_dir,
+        schema=schema,
+        format="parquet",
+        partitioning=hive_partitioning,
+        file_options=file_options,
+        basename_template="part-{i}.parquet",
+        max_rows_per_file=rows_per_file,
+        min_rows_per_group=layout.row_group_size,
+        max_rows_per_group=layout.row_group_size,
+        # Write the rows in order, which is lost with multiple threads
+        use_threads=False,
+        existing_data_behavior="delete_matching",
+    )
+
+
+def _write_feather(
+    parts: Iterable[pathlib.Path], table_name: str, output_path: pathlib.Path
+) -> None:
+    """Concatenate Arrow IPC files into an uncompressed Feather file."""
+    schema = get_arrow_schema(table_name)
+    # Uncompressed, so that the file can be memory-mapped
+    with pa.ipc.new_file(output_path, schema) as writer:
+        for record_batch in _iter_batches(parts, schema):
+            writer.write_batch(record_batch)
+
+
+def _iter_batches(
+    parts: Iterable[pathlib.Path], schema: pa.Schema
+) -> Iterator[pa.RecordBatch]:
+    """Yield the record batches of Arrow IPC files, in order.
+
+    Every file is removed once all its record batches are read. They are read
+    into memory, not memory-mapped, so they stay valid after that.
+    """
+    for part in parts:
+        with pa.OSFile(str(part)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                # Polars writes strings as string views, which Parquet doesn't support
+                yield reader.get_batch(i).cast(schema)
+        part.unlink()
+
+
+def _get_sorting_columns(
+    schema: pa.Schema, columns: list[str] | None
+) -> tuple[pq.SortingColumn, ...] | None:
+    if not columns:
+        return None
+    return pq.SortingColumn.from_ordering(schema, [(c, "ascending") for c in columns])  # type: ignore[no-any-return]
+
+
+def _write_table(
+    parts: Iterator[pathlib.Path],
+    table_name: str,
+    base_path: pathlib.Path,
+    file_format: Literal["parquet", "feather"],
+    layout: Parquet,
+    table_order: TableOrder,
+    partitioning: Partitioning,
+    rows_per_file: int,
+) -> None:
+    """Write the Arrow IPC files of the chunks of a table, as they are generated."""
+    sorting_columns = None
+    if table_order != "natural" and table_name in ORDER_COLUMNS:
+        # Ordering needs all rows of the table, so its chunks are kept until the
+        # last one is generated, and then ordered into a full copy of the table
+        chunk_parts = list(parts)
+        logger.info("Ordering %s (%s)", table_name, table_order)
+        ordered = chunk_parts[0].with_name("ordered.arrow")
+        _order_table(chunk_parts, table_name, table_order, ordered)
+        for part in chunk_parts:
+            part.unlink()
+        parts = iter([ordered])
+        if table_order == "sorted":
+            sorting_columns = ORDER_COLUMNS[table_name][:1]
+
+    if file_format == "feather":
+        _write_feather(parts, table_name, base_path / f"{table_name}.feather")
+    elif partitioning != "none":
+        _write_parquet_dataset(
+            parts,
+            table_name,
+            base_path / f"{table_name}.parquet",
+            layout,
+            partitioning,
+            rows_per_file,
+            sorting_columns,
+        )
+    else:
+        _write_parquet(
+            parts,
+            table_name,
+            base_path / f"{table_name}.parquet",
+            layout,
+            sorting_columns,
+        )
+
+
+def _remove_path(path: pathlib.Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _send(
+    parts: queue.Queue[pathlib.Path | None],
+    part: pathlib.Path | None,
+    writer: Future[None],
+) -> None:
+    """Send a part to the writer of a table, unless the writer stopped."""
+    while not writer.done():
+        with contextlib.suppress(queue.Full):
+            parts.put(part, timeout=0.1)
+            return
+
+
+def streaming_data_generation(
+    base_path: pathlib.Path,
+    scale_factor: float,
+    num_chunks: int,
+    parallelism: int = 4,
+    file_format: Literal["parquet", "feather"] = "parquet",
+    layout: Parquet | None = None,
+    table_order: TableOrder = "natural",
+    partitioning: Partitioning = "none",
+    rows_per_file: int = 5_000_000,
+) -> None:
+    """Generate the tables as Parquet or Feather files, without .tbl files on disk.
+
+    dbgen runs `num_chunks` chunks, `parallelism` at a time. Its text output is
+    streamed through named pipes and parsed into Arrow record batches, see
+    `_convert_tbl_stream`, which are written to an Arrow IPC file per table and
+    chunk. Every table has a writer thread, which
+    appends the chunks of the table to its output in order, and removes every
+    chunk once it is written. This gives the same rows as a single dbgen run.
+
+    Chunks are generated at most `parallelism` ahead of the chunk being written,
+    so the scratch space is bounded by a few chunks. The exception are the tables
+    reordered for a `table_order` other than "natural": lineitem and orders are
+    ordered by the columns in `ORDER_COLUMNS`, which needs all their chunks and a
+    full ordered copy of the table as scratch space.
+
+    Parquet files are written with `layout`, default `settings.parquet`, which is
+    recorded in the dataset directory. Every table is a single file, unless a
+    `partitioning` is given. Tables are then directories of Parquet files, see
+    `_write_parquet_dataset`.
+    """
+    layout = layout or settings.parquet
+    if partitioning != "none" and file_format != "parquet":
+        msg = f"partitioned tables must be Parquet files, got {file_format!r}"
+        raise ValueError(msg)
+
+    # dbgen runs in its own directory, so it writes to an absolute path
+    scratch_dir = (base_path / "chunks").resolve()
+    scratch_dir.mkdir(parents=True, exist_ok=True)
+
+    # Arrow reads every pipe on a thread of its I/O pool, which blocks until dbgen
+    # writes to it. All pipes must be read at once, as dbgen writes to some tables
+    # together (e.g. orders and lineitem). Partitioned tables are written from a
+    # thread of that pool too, which blocks until the next chunk is generated.
+    n_threads = (parallelism + 1) * len(table_columns)
+    pa.set_io_thread_count(max(pa.io_thread_count(), n_threads))
+
+    # A writer that lags behind blocks the generation of more chunks
+    queues: dict[str, queue.Queue[pathlib.Path | None]] = {
+        table_name: queue.Queue(maxsize=parallelism) for table_name in table_columns
+    }
+    gen_chunk = partial(
+        _gen_chunk,
+        scratch_dir=scratch_dir,
+        scale_factor=scale_factor,
+        num_chunks=num_chunks,
+    )
+
+    logger.info("Generating %s chunks, %s at a time", num_chunks, parallelism)
+    try:
+        with (
+            ThreadPoolExecutor(parallelism) as generators,
+            ThreadPoolExecutor(len(table_columns)) as writers,
+        ):
+            write_futures = {
+                table_name: writers.submit(
+                    _write_table,
+                    iter(parts.get, None),
+                    table_name,
+                    base_path,
+                    file_format,
+                    layout,
+                    table_order,
+                    partitioning,
+                    rows_per_file,
+                )
+                for table_name, parts in queues.items()
+            }
+            gen_futures: dict[int, Future[None]] = {}
+            try:
+                for chunk_idx in range(1, num_chunks + 1):
+                    ahead = min(chunk_idx + parallelism, num_chunks + 1)
+                    for i in range(chunk_idx, ahead):
+                        if i not in gen_futures:
+                            gen_futures[i] = generators.submit(gen_chunk, i)
+                    gen_futures.pop(chunk_idx).result()
+
+                    for table_name, parts in queues.items():
+                        writer = write_futures[table_name]
+                        if writer.done():
+                            # Writers only finish early if they failed
+                            writer.result()
+                        part = scratch_dir / table_name / f"{chunk_idx}.arrow"
+                        # Static tables are only kept from the first chunk
+                        if part.exists():
+                            _send(parts, part, writer)
+            finally:
+                for table_name, parts in queues.items():
+                    _send(parts, None, write_futures[table_name])
+            # Consume the results, so that errors are raised here
+            for writer in write_futures.values():
+                writer.result()
+    except BaseException:
+        # Remove the partly written tables, which would otherwise pass for complete
+        for table_name in table_columns:
+            _remove_path(base_path / f"{table_name}.{file_format}")
+        raise
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    if file_format == "parquet":
+        (base_path / settings.paths.layout_filename).write_text(
+            layout.model_dump_json(indent=2)
+        )
+
+
+def gen_refresh_sets(
+    base_path: pathlib.Path, scale_factor: float, num_sets: int
+) -> None:
+    """Generate the update sets used by the refresh functions RF1 and RF2.
+
+    Set `n` consists of the new orders and line items inserted by RF1
+    (`orders.u<n>.parquet`, `lineitem.u<n>.parquet`) and the keys of the orders
+    deleted by RF2 (`delete.<n>.parquet`). They are written to `<base_path>/updates`.
+    """
+    subprocess.check_output(
+        shlex.split(f"./dbgen -f -s {scale_factor} -U {num_sets}"),
+        cwd=str(tpch_dbgen),
+    )
+
+    output_path = base_path / "updates"
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    for n in range(1, num_sets + 1):
+        for table_name in ["orders", "lineitem"]:
+            path = tpch_dbgen / f"{table_name}.tbl.u{n}"
+            _scan_tbl(path, table_columns[table_name]).sink_parquet(
+                output_path / f"{table_name}.u{n}.parquet"
+            )
+            path.unlink()
+
+        path = tpch_dbgen / f"delete.{n}"
+        _scan_tbl(path, ["orderkey"]).sink_parquet(output_path / f"delete.{n}.parquet")
+        path.unlink()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -255,14 +681,115 @@ if __name__ == "__main__":
         type=int,
         help="How many processes to use to generate the data",
     )
+    parser.add_argument(
+        "--num-chunks",
+        default=None,
+        type=int,
+        help="Number of dbgen chunks if --num-parts=1 (default: one per unit of scale"
+        " factor, at least --parallelism)",
+    )
+    parser.add_argument(
+        "--format",
+        default="parquet",
+        choices=["parquet", "feather"],
+        help="File format of the tables if --num-parts=1",
+    )
+    parser.add_argument(
+        "--table-order",
+        default=settings.run.table_order,
+        choices=["natural", "sorted", "zorder"],
+        help="Row order of lineitem and orders",
+    )
+    parser.add_argument(
+        "--partitioning",
+        default=settings.run.partitioning,
+        choices=["none", "files", "hive"],
+        help="Write every table to a directory of files of at most --rows-per-file rows",
+    )
+    parser.add_argument(
+        "--compression",
+        default=settings.parquet.compression,
+        choices=["uncompressed", "snappy", "gzip", "brotli", "lz4", "zstd"],
+        help="Parquet compression codec",
+    )
+    parser.add_argument(
+        "--compression-level",
+        default=settings.parquet.compression_level,
+        type=int,
+        help="Parquet compression level (default: the default of the codec)",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        default=settings.parquet.row_group_size,
+        type=int,
+        help="Number of rows per Parquet row group",
+    )
+    parser.add_argument(
+        "--dictionary",
+        default=settings.parquet.dictionary,
+        action=argparse.BooleanOptionalAction,
+        help="Dictionary encode the Parquet columns",
+    )
+    parser.add_argument(
+        "--statistics",
+        default=settings.parquet.statistics,
+        action=argparse.BooleanOptionalAction,
+        help="Write Parquet column chunk statistics",
+    )
+    parser.add_argument(
+        "--page-index",
+        default=settings.parquet.page_index,
+        action=argparse.BooleanOptionalAction,
+        help="Write the Parquet page index",
+    )
+    parser.add_argument(
+        "--data-page-size",
+        default=settings.parquet.data_page_size,
+        type=int,
+        help="Target size of a Parquet data page in bytes",
+    )
+    parser.add_argument(
+        "--refresh-sets",
+        default=0,
+        type=int,
+        help="Only generate this many update sets for the refresh functions",
+    )
     args = parser.parse_args()
 
-    if args.num_parts == 1:
-        # Assumes the tables are already created by the Makefile
-        gen_parquet(
+    # Arrow can't write files smaller than a row group
+    if (
+        args.num_parts == 1
+        and args.partitioning != "none"
+        and args.rows_per_file < args.row_group_size
+    ):
+        parser.error(
+            f"--rows-per-file ({args.rows_per_file}) must be at least"
+            f" --row-group-size ({args.row_group_size}) for partitioned tables"
+        )
+
+    if args.refresh_sets > 0:
+        gen_refresh_sets(
+            pathlib.Path(args.tpch_gen_folder), args.scale_factor, args.refresh_sets
+        )
+    elif args.num_parts == 1:
+        streaming_data_generation(
             pathlib.Path(args.tpch_gen_folder),
+            args.scale_factor,
+            args.num_chunks or max(args.parallelism, math.ceil(args.scale_factor)),
+            parallelism=args.parallelism,
+            file_format=args.format,
+            layout=Parquet(
+                compression=args.compression,
+                compression_level=args.compression_level,
+                row_group_size=args.row_group_size,
+                dictionary=args.dictionary,
+                statistics=args.statistics,
+                page_index=args.page_index,
+                data_page_size=args.data_page_size,
+            ),
+            table_order=args.table_order,
+            partitioning=args.partitioning,
             rows_per_file=args.rows_per_file,
-            partitioned=False,
         )
     else:
         pipelined_data_generation(
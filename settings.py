@@ -6,15 +6,38 @@ from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 IoType: TypeAlias = Literal["skip", "parquet", "feather", "csv"]
+ExecutionMode: TypeAlias = Literal["subprocess", "in-process", "multiplex"]
+RefreshStrategy: TypeAlias = Literal["rewrite", "append"]
+TableOrder: TypeAlias = Literal["natural", "sorted", "zorder"]
+Partitioning: TypeAlias = Literal["none", "files", "hive"]
+TableLoading: TypeAlias = Literal["preload", "lazy", "cached"]
+PolarsEngine: TypeAlias = Literal["in-memory", "streaming", "old-streaming", "gpu"]
+ParquetCompression: TypeAlias = Literal[
+    "uncompressed", "snappy", "gzip", "brotli", "lz4", "zstd"
+]
 
 
 # Set via PATH_<NAME>
 class Paths(BaseSettings):
     answers: Path = Path("data/answers")
+    parameters: Path = Path("data/parameters")
     tables: Path = Path("data/tables")
+    # Uncompressed Arrow IPC copies of the tables, memory-mapped by the query
+    # processes with the skip IO type. Kept in shared memory if available.
+    ipc_cache: Path = (
+        Path("/dev/shm/polars-benchmark")
+        if Path("/dev/shm").is_dir()
+        else Path("data/cache")
+    )
+    layout_filename: str = "layout.json"  # Parquet layout, in the dataset directory
+    # Spill files of the engines when running within a memory budget
+    spill: Path = Path("data/spill")
 
     timings: Path = Path("output/run")
     timings_filename: str = "timings.csv"
+    status_filename: str = "status.csv"
+    throughput_filename: str = "throughput.csv"
+    refresh_filename: str = "refresh.csv"
 
     plots: Path = Path("output/plot")
 
@@ -27,10 +50,68 @@ class Paths(BaseSettings):
 class Run(BaseSettings):
     io_type: IoType = "parquet"
 
+    # Row order of lineitem and orders, every order is a separate dataset
+    # natural -> as generated by dbgen
+    # sorted -> sorted by l_shipdate and o_orderdate
+    # zorder -> Z-ordered by (l_shipdate, l_orderkey) and (o_orderdate, o_orderkey)
+    table_order: TableOrder = "natural"
+    # Shape of the tables, every partitioning is a separate dataset
+    # none -> a single file per table
+    # files -> a directory of files per table
+    # hive -> as files, with lineitem and orders partitioned by l_shipmode and
+    #         o_orderstatus in <key>=<value> directories
+    partitioning: Partitioning = "none"
+
+    # subprocess -> every query runs in a fresh interpreter (full isolation)
+    # in-process -> all queries share one interpreter, so imports and engine
+    #               warm-up (JVM, RMM pool, ...) are paid only once
+    # multiplex -> all queries are collected together, sharing their table scans
+    #              (Polars only)
+    execution_mode: ExecutionMode = "subprocess"
+
+    # Number of query subprocesses to run at once, each pinned to its own CPU set
+    parallel_queries: int = 1
+    numa: bool = False  # Bind each parallel query to a single NUMA node
+    threads: int | None = None  # Thread count of the engine, default is all CPUs
+
+    # Number of concurrent query streams of the TPC-H throughput test,
+    # 0 runs the power test (every query once, on its own)
+    throughput_streams: int = 0
+    stream: int | None = None  # Set for the subprocess running a single stream
+    queries: list[int] | None = None  # Queries to run, in order (default all)
+
+    # Seed for drawing the query substitution parameters with `qgen`, the
+    # validation parameters are used if not set. The answers of a seed are computed
+    # with the in-memory Polars engine, see `queries.parameters.get_answer_path`
+    seed: int | None = None
+
+    # Number of refresh function pairs (RF1, queries, RF2) to run, 0 runs the
+    # queries once on the static tables
+    refresh_sets: int = 0
+    # rewrite -> orders and lineitem are single files, rewritten by each refresh
+    # append -> RF1 adds a file, RF2 rewrites only the files containing deleted keys
+    refresh_strategy: RefreshStrategy = "rewrite"
+
+    # When DataFrame libraries load the tables, see `queries/table_provider.py`
+    # Default is lazy (inside the timer) if IO is included, preload otherwise
+    table_loading: TableLoading | None = None
+    table_cache_bytes: int = 8_000_000_000  # Budget of the cached table loading
+
+    # Interval in seconds of sampling the memory usage while a query runs, 0 only
+    # records the peak RSS from `getrusage`
+    memory_sample_interval: float = 0.01
+    tracemalloc: bool = False  # Trace the peak of Python allocations (slow)
+    # Memory budget in bytes of every query subprocess, see `queries/memory_budget.py`
+    memory_limit: int | None = None
+    # Count hardware events (cycles, cache misses, ...) of queries with `perf stat`
+    perf_counters: bool = False
+    # Store the plan of every query next to the timings, see `queries/plans.py`
+    capture_plans: bool = False
+
     iterations: int = 1
     log_timings: bool = True
     show_results: bool = False
-    check_results: bool = False  # Only available for SCALE_FACTOR=1
+    check_results: bool = False  # Only available for SCALE_FACTOR=1 or a seed
 
     polars_show_plan: bool = False
     polars_eager: bool = bool(os.environ.get("POLARS_EAGER", 0))
@@ -39,6 +120,13 @@ class Run(BaseSettings):
     polars_streaming: bool = bool(os.environ.get("POLARS_STREAMING", 0))
     polars_new_streaming: bool = bool(os.environ.get("POLARS_NEW_STREAMING", 0))
     polars_cloud: bool = False
+    # Collect with `LazyFrame.profile` and store the time span of every node of the
+    # plan next to the timings, see `scripts/plot_profile.py`
+    polars_profile: bool = False
+    # Run every query on the engine that was fastest for it before, according to
+    # the timings file, or to a calibration run of every candidate engine
+    polars_auto_engine: bool = False
+    polars_auto_engines: list[PolarsEngine] = ["in-memory", "streaming"]
     polars_gpu_device: int = 0  # The GPU device to run on for polars GPU
     # Which style of GPU memory resource to use
     # cuda -> cudaMalloc
@@ -67,6 +155,21 @@ class Run(BaseSettings):
     )
 
 
+# Physical layout of the generated Parquet files, set via PARQUET_<NAME>
+class Parquet(BaseSettings):
+    compression: ParquetCompression = "zstd"
+    compression_level: int | None = None  # Default level of the codec if not set
+    row_group_size: int = 512 * 512  # Number of rows
+    dictionary: bool = True  # Dictionary encode the columns
+    statistics: bool = True  # Write the min/max statistics of every column chunk
+    page_index: bool = False  # Write the column and offset indexes of the pages
+    data_page_size: int = 1024 * 1024  # Bytes
+
+    model_config = SettingsConfigDict(
+        env_prefix="parquet_", env_file=".env", extra="ignore"
+    )
+
+
 class Plot(BaseSettings):
     show: bool = False
     n_queries: int = 22
@@ -81,12 +184,18 @@ class Settings(BaseSettings):
     scale_factor: float = 1.0
 
     paths: Paths = Paths()
+    parquet: Parquet = Parquet()
     plot: Plot = Plot()
     run: Run = Run()
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def dataset_base_dir(self) -> Path:
-        return self.paths.tables / f"scale-{self.scale_factor}"
+        name = f"scale-{self.scale_factor}"
+        if self.run.table_order != "natural":
+            name += f"-{self.run.table_order}"
+        if self.run.partitioning != "none":
+            name += f"-{self.run.partitioning}"
+        return self.paths.tables / name
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
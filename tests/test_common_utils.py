@@ -0,0 +1,51 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from queries import common_utils
+from queries.common_utils import TIMINGS_HEADER, log_query_timing
+
+
+@pytest.fixture
+def timings_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(common_utils.settings.paths, "timings", tmp_path)
+    return tmp_path / common_utils.settings.paths.timings_filename
+
+
+def _read_rows(path: Path) -> list[list[str]]:
+    with path.open(newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_timings_rows_match_the_header(timings_path: Path) -> None:
+    log_query_timing("polars", "1.0.0", 1, 0.5)
+    log_query_timing("polars", "1.0.0", 2, 1.5, compute_time=1.0, engine="streaming")
+
+    header, *rows = _read_rows(timings_path)
+
+    assert header == TIMINGS_HEADER
+    assert len(set(header)) == len(header)
+    assert [len(row) for row in rows] == [len(header)] * 2
+
+    second = dict(zip(header, rows[1], strict=True))
+    assert second["query_number"] == "2"
+    assert second["duration[s]"] == "1.5"
+    assert second["compute[s]"] == "1.0"
+    assert second["io[s]"] == ""
+    assert second["engine"] == "streaming"
+
+
+def test_timings_with_other_columns_are_moved_aside(timings_path: Path) -> None:
+    old_rows = [["solution", "version", "query_number", "duration[s]"]]
+    old_rows.append(["polars", "0.20.0", "1", "0.5"])
+    with timings_path.open("w", newline="") as f:
+        csv.writer(f).writerows(old_rows)
+
+    log_query_timing("polars", "1.0.0", 1, 0.5)
+
+    (moved,) = timings_path.parent.glob(f"{timings_path.stem}-*.csv")
+    assert _read_rows(moved) == old_rows
+    header, row = _read_rows(timings_path)
+    assert header == TIMINGS_HEADER
+    assert len(row) == len(header)
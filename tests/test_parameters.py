@@ -0,0 +1,47 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from queries import parameters
+from queries.parameters import DEFAULT_PARAMETERS, get_parameters
+
+
+@pytest.fixture
+def no_seed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parameters.settings.run, "seed", None)
+
+
+@pytest.mark.usefixtures("no_seed")
+def test_get_parameters_of_every_query() -> None:
+    for query_number in DEFAULT_PARAMETERS:
+        assert get_parameters(query_number)
+
+
+@pytest.mark.usefixtures("no_seed")
+def test_get_parameters_with_the_default_parameters() -> None:
+    assert get_parameters(1) == {"var1": date(1998, 9, 2)}
+    assert get_parameters(6) == {
+        "var1": date(1994, 1, 1),
+        "var2": date(1995, 1, 1),
+        "var3": 0.05,
+        "var4": 0.07,
+        "var5": 24,
+    }
+    assert get_parameters(16)["var3"] == [49, 14, 23, 45, 19, 3, 36, 9]
+    assert get_parameters(20)["var4"] == "forest"
+
+
+def test_get_parameters_of_a_seed(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(parameters.settings.run, "seed", 7)
+    monkeypatch.setattr(parameters.settings.paths, "parameters", tmp_path)
+    # Cached parameters of the seed, so that qgen does not run
+    path = tmp_path / f"seed-7-scale-{parameters.settings.scale_factor}.json"
+    path.write_text(json.dumps({"4": ["1995-11-01"], "10": ["1993-12-01"]}))
+
+    # Months are added across the end of the year
+    assert get_parameters(4) == {"var1": date(1995, 11, 1), "var2": date(1996, 2, 1)}
+    assert get_parameters(10) == {"var1": date(1993, 12, 1), "var2": date(1994, 3, 1)}
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from queries.schema import table_columns
+from scripts import prepare_data
+from scripts.prepare_data import (
+    _z_order_bucket,
+    _z_order_key,
+    streaming_data_generation,
+    tpch_dbgen,
+)
+
+
+def test_z_order_buckets_are_monotonic() -> None:
+    # More distinct values than there are buckets, as for the order keys
+    n = 200_000
+    df = pl.DataFrame({"a": pl.int_range(n, eager=True).shuffle(seed=0)})
+
+    buckets = df.sort("a").select(_z_order_bucket("a")).to_series()
+
+    assert buckets.is_sorted()
+    assert buckets.min() == 0
+    assert buckets.max() == 2**16 - 1
+
+
+def test_z_order_key_with_a_constant_column() -> None:
+    n = 100_000
+    df = pl.DataFrame({"a": range(n), "b": [0] * n})
+
+    keys = df.select(_z_order_key(["a", "b"])).to_series()
+
+    # With one distinct value in "b", the key orders by "a" only
+    assert keys.is_sorted()
+    assert keys.n_unique() == 2**16
+
+
+@pytest.mark.skipif(not (tpch_dbgen / "dbgen").exists(), reason="dbgen is not built")
+def test_streaming_data_generation_to_a_relative_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    streaming_data_generation(Path("tables"), 0.01, num_chunks=2, parallelism=2)
+
+    for table_name in table_columns:
+        df = pl.read_parquet(tmp_path / "tables" / f"{table_name}.parquet")
+        assert df.columns == table_columns[table_name]
+        assert df.height > 0
+    assert not (tmp_path / "tables" / "chunks").exists()
+
+
+def test_streaming_data_generation_removes_partial_tables(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Without a dbgen binary, the generation of the first chunk fails
+    monkeypatch.setattr(prepare_data, "tpch_dbgen", tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        streaming_data_generation(tmp_path / "tables", 0.01, num_chunks=2)
+
+    assert list((tmp_path / "tables").iterdir()) == []
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from queries import refresh
+from queries.polars import refresh as polars_refresh
+from queries.refresh import prepare_working_copy, rf1, rf2
+
+
+@pytest.fixture
+def dataset_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Write a dataset whose update set inserts orders 7-9 and deletes 1-2."""
+    monkeypatch.setattr(refresh.settings.paths, "tables", tmp_path / "tables")
+    monkeypatch.setattr(refresh.settings.run, "io_type", "parquet")
+    monkeypatch.setattr(refresh.settings.run, "partitioning", "none")
+    base_dir = refresh.settings.dataset_base_dir
+    (base_dir / "updates").mkdir(parents=True)
+
+    pl.DataFrame({"o_orderkey": range(1, 7)}).write_parquet(base_dir / "orders.parquet")
+    pl.DataFrame({"l_orderkey": [1, 1, 2, 3, 4, 5, 6]}).write_parquet(
+        base_dir / "lineitem.parquet"
+    )
+    pl.DataFrame({"n_nationkey": [0]}).write_parquet(base_dir / "nation.parquet")
+
+    updates = base_dir / "updates"
+    pl.DataFrame({"o_orderkey": [7, 8, 9]}).write_parquet(updates / "orders.u1.parquet")
+    pl.DataFrame({"l_orderkey": [7, 8, 8, 9]}).write_parquet(
+        updates / "lineitem.u1.parquet"
+    )
+    pl.DataFrame({"orderkey": [1, 2]}).write_parquet(updates / "delete.1.parquet")
+
+    return tmp_path / "refresh"
+
+
+def _read_keys(path: Path, key_column: str) -> list[int]:
+    source = path / "*.parquet" if path.is_dir() else path
+    return sorted(pl.read_parquet(source)[key_column])
+
+
+@pytest.mark.parametrize("strategy", ["rewrite", "append"])
+def test_refresh_functions(
+    strategy: str, dataset_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(refresh.settings.run, "refresh_strategy", strategy)
+
+    prepare_working_copy(dataset_dir)
+    rf1(polars_refresh, dataset_dir, 1)
+    rf2(polars_refresh, dataset_dir, 1)
+
+    orders = dataset_dir / "orders.parquet"
+    lineitem = dataset_dir / "lineitem.parquet"
+    assert orders.is_dir() == (strategy == "append")
+    assert _read_keys(orders, "o_orderkey") == [3, 4, 5, 6, 7, 8, 9]
+    assert _read_keys(lineitem, "l_orderkey") == [3, 4, 5, 6, 7, 8, 8, 9]
+    # Static tables are copied unchanged
+    assert _read_keys(dataset_dir / "nation.parquet", "n_nationkey") == [0]
+
+
+def test_append_strategy_only_rewrites_files_with_deleted_keys(
+    dataset_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(refresh.settings.run, "refresh_strategy", "append")
+
+    prepare_working_copy(dataset_dir)
+    rf1(polars_refresh, dataset_dir, 1)
+    update = dataset_dir / "orders.parquet" / "part-u1.parquet"
+    inode = update.stat().st_ino
+    rf2(polars_refresh, dataset_dir, 1)
+
+    assert update.stat().st_ino == inode
+
+
+def test_refresh_functions_require_single_files(
+    dataset_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(refresh.settings.run, "partitioning", "hive")
+
+    with pytest.raises(ValueError, match="single files"):
+        prepare_working_copy(dataset_dir)
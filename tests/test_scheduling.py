@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from queries import scheduling
+from queries.scheduling import CpuSlot, _parse_cpu_set, format_cpu_set, plan_cpu_slots
+
+
+def test_format_cpu_set() -> None:
+    assert format_cpu_set([0, 1, 2, 3, 8, 9, 10, 11]) == "0-3,8-11"
+    # Unsorted, with single CPUs
+    assert format_cpu_set([5, 3, 1, 2]) == "1-3,5"
+    assert format_cpu_set([]) == ""
+
+
+def test_format_cpu_set_round_trip() -> None:
+    cpus = [0, 2, 3, 4, 7, 12, 13]
+
+    assert _parse_cpu_set(format_cpu_set(cpus)) == cpus
+
+
+def test_plan_cpu_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: set(range(8)))
+
+    slots = plan_cpu_slots(3)
+
+    # The first slots get the remaining CPUs
+    assert slots == [CpuSlot([0, 1, 2]), CpuSlot([3, 4, 5]), CpuSlot([6, 7])]
+
+
+def test_plan_cpu_slots_with_more_slots_than_cpus(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: {0, 1})
+
+    with pytest.raises(ValueError, match="cannot run 3 queries in parallel"):
+        plan_cpu_slots(3)
+
+
+def test_plan_cpu_slots_per_numa_node(monkeypatch: pytest.MonkeyPatch) -> None:
+    nodes = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+    monkeypatch.setattr(scheduling, "_get_numa_nodes", lambda: nodes)
+
+    slots = plan_cpu_slots(3, numa=True)
+
+    assert slots == [
+        CpuSlot([0, 1], numa_node=0),
+        CpuSlot([2, 3], numa_node=0),
+        CpuSlot([4, 5, 6, 7], numa_node=1),
+    ]
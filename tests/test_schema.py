@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from queries.schema import (
+    PARTITION_KEYS,
+    get_arrow_schema,
+    get_numpy_dtypes,
+    get_pandas_dtypes,
+    get_polars_schema,
+    get_sql_types,
+    table_columns,
+)
+
+
+@pytest.mark.parametrize("table_name", table_columns)
+def test_schemas_have_every_column(table_name: str) -> None:
+    columns = table_columns[table_name]
+
+    assert get_arrow_schema(table_name).names == columns
+    assert get_polars_schema(table_name).names() == columns
+    assert list(get_pandas_dtypes(table_name)) == columns
+    assert list(get_numpy_dtypes(table_name)) == columns
+    assert list(get_sql_types(table_name)) == columns
+
+
+@pytest.mark.parametrize("table_name", table_columns)
+def test_arrow_schema_round_trips_through_polars(table_name: str) -> None:
+    schema = get_arrow_schema(table_name)
+
+    df = pl.DataFrame(schema.empty_table())
+
+    assert df.schema == get_polars_schema(table_name)
+    assert df.to_arrow(compat_level=pl.CompatLevel.oldest()).schema == schema
+
+
+@pytest.mark.parametrize("table_name", table_columns)
+def test_arrow_schema_round_trips_through_parquet(
+    table_name: str, tmp_path: Path
+) -> None:
+    schema = get_arrow_schema(table_name)
+    path = tmp_path / f"{table_name}.parquet"
+
+    pq.write_table(schema.empty_table(), path)
+
+    assert pq.read_schema(path).remove_metadata() == schema
+
+
+def test_partition_keys_are_string_columns() -> None:
+    for table_name, key in PARTITION_KEYS.items():
+        assert get_arrow_schema(table_name).field(key).type == pa.large_string()
@@ -0,0 +1,22 @@
+from queries.throughput import PERMUTATIONS, get_stream_queries
+
+
+def test_permutations_contain_every_query_once() -> None:
+    # Stream 0 up to and including 40, as in `tpch-dbgen/permute.h`
+    assert len(PERMUTATIONS) == 41
+    for permutation in PERMUTATIONS:
+        assert sorted(permutation) == list(range(1, 23))
+
+
+def test_get_stream_queries() -> None:
+    all_queries = list(range(1, 23))
+
+    assert get_stream_queries(0, all_queries)[:5] == [14, 2, 9, 20, 6]
+    assert get_stream_queries(1, all_queries)[:5] == [21, 3, 18, 5, 11]
+    # Streams after the last permutation start over at stream 0
+    assert get_stream_queries(41, all_queries) == get_stream_queries(0, all_queries)
+
+
+def test_get_stream_queries_keeps_the_order_of_a_subset() -> None:
+    assert get_stream_queries(1, [1, 3, 21]) == [21, 3, 1]
+    assert get_stream_queries(2, [1, 3, 21]) == [1, 3, 21]